@@ -42,6 +42,19 @@ app_schemas: list[ConfigSchema | MapConfigSchema] = [
             # MPD supports at most 10k tracks, some clients segfault when this
             # is exceeded.
             "max_tracklist_length": types.Integer(minimum=1),
+            "lookup_cache_size": types.Integer(minimum=0),
+            "lookup_cache_ttl": types.Integer(minimum=1),
+            "search_cache_size": types.Integer(minimum=0),
+            "search_cache_ttl": types.Integer(minimum=1),
+            "image_cache_size": types.Integer(minimum=0),
+            "image_cache_ttl": types.Integer(minimum=1),
+            "distinct_cache_size": types.Integer(minimum=0),
+            "distinct_cache_ttl": types.Integer(minimum=1),
+            "browse_cache_size": types.Integer(minimum=0),
+            "browse_cache_ttl": types.Integer(minimum=1),
+            "library_timeout": types.Float(minimum=0, optional=True),
+            "library_backend_timeout": types.Float(minimum=0, optional=True),
+            "result_validation": types.String(choices=("full", "sampled", "off")),
             "restore_state": types.Boolean(optional=True),
         },
     ),
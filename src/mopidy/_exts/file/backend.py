@@ -1,14 +1,18 @@
 import logging
-from typing import ClassVar, override
+import pathlib
+from typing import ClassVar, cast, override
 
 import pykka
+from pykka.messages import ProxyCall
 
 from mopidy import backend
 from mopidy.audio import AudioProxy
 from mopidy.config import Config
 from mopidy.types import UriScheme
 
-from . import library
+from . import Extension, library
+from .types import FileConfig
+from .watcher import MediaDirWatcher
 
 logger = logging.getLogger(__name__)
 
@@ -22,3 +26,34 @@ class FileBackend(pykka.ThreadingActor, backend.Backend):
         self.library = library.FileLibraryProvider(backend=self, config=config)
         self.playback = backend.PlaybackProvider(audio=audio, backend=self)
         self.playlists = None
+
+        ext_config = cast(FileConfig, config[Extension.ext_name])
+        self._watcher = None
+        if ext_config["watch_media_dirs"]:
+            self._watcher = MediaDirWatcher(
+                [media_dir["path"] for media_dir in self.library._media_dirs],
+                self._on_media_dirs_changed,
+                show_dotfiles=ext_config["show_dotfiles"],
+                follow_symlinks=ext_config["follow_symlinks"],
+            )
+
+    @override
+    def on_start(self) -> None:
+        if self._watcher is not None:
+            self._watcher.start()
+
+    @override
+    def on_stop(self) -> None:
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    def _on_media_dirs_changed(self, changed: set[pathlib.Path]) -> None:
+        # Called from the watcher's thread. The library is only updated from
+        # the actor's thread, in between handling other calls.
+        self.actor_ref.tell(
+            ProxyCall(
+                attr_path=("library", "_update_changed"),
+                args=(changed,),
+                kwargs={},
+            ),
+        )
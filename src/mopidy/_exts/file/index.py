@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from mopidy.models import Track
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from mopidy.types import DistinctField, Query, SearchField, Uri
+
+logger = logging.getLogger(__name__)
+
+# Bump this when changing the tables or what is stored in them. An index with
+# another version is thrown away and rebuilt.
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE tracks (
+    uri TEXT PRIMARY KEY,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    track TEXT
+);
+CREATE TABLE track_values (
+    uri TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value NOT NULL,
+    folded TEXT
+);
+CREATE INDEX track_values_uri ON track_values (uri);
+CREATE INDEX track_values_field_value ON track_values (field, value);
+"""
+
+_INT_FIELDS = {"track_no", "disc_no"}
+
+_FIELD_ALIASES = {"track": "track_name"}
+
+
+class IndexEntry(NamedTuple):
+    mtime: int
+    """The modification time of the file in nanoseconds when it was scanned."""
+
+    size: int
+    """The size of the file in bytes when it was scanned."""
+
+    track: Track | None
+    """The scanned track, or `None` if the file could not be scanned."""
+
+
+class LibraryIndex:
+    """An SQLite index of the metadata of the files in the media dirs.
+
+    Files are keyed by URI, and their modification time and size tell if they
+    have changed since they were scanned. Changes are not saved to disk until
+    [commit][] is called.
+    """
+
+    def __init__(self, path: pathlib.Path | None) -> None:
+        self._connection = _connect(path)
+
+    def get(self, uri: Uri) -> IndexEntry | None:
+        row = self._connection.execute(
+            "SELECT mtime, size, track FROM tracks WHERE uri = ?",
+            (uri,),
+        ).fetchone()
+        if row is None:
+            return None
+        mtime, size, track = row
+        return IndexEntry(
+            mtime=mtime,
+            size=size,
+            track=None if track is None else Track.model_validate_json(track),
+        )
+
+    def get_files(self, uri: Uri) -> dict[Uri, tuple[int, int]]:
+        """Get the modification time and size of the files at or below `uri`."""
+        prefix = uri if uri.endswith("/") else f"{uri}/"
+        rows = self._connection.execute(
+            "SELECT uri, mtime, size FROM tracks "
+            "WHERE uri = ? OR substr(uri, 1, ?) = ?",
+            (uri, len(prefix), prefix),
+        )
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+    def add(self, uri: Uri, mtime: int, size: int, track: Track | None) -> None:
+        """Add or replace the file at `uri`.
+
+        If `track` is `None`, the file is remembered as not scannable until it
+        changes, but it isn't found by searches.
+        """
+        self.remove([uri])
+        self._connection.execute(
+            "INSERT INTO tracks (uri, mtime, size, track) VALUES (?, ?, ?, ?)",
+            (
+                uri,
+                mtime,
+                size,
+                None if track is None else track.model_dump_json(by_alias=True),
+            ),
+        )
+        if track is not None:
+            self._connection.executemany(
+                "INSERT INTO track_values (uri, field, value, folded) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    (uri, field, value, None if field in _INT_FIELDS else value.lower())
+                    for field, value in _get_values(track)
+                ),
+            )
+
+    def remove(self, uris: Iterable[Uri]) -> None:
+        for uri in uris:
+            self._connection.execute("DELETE FROM tracks WHERE uri = ?", (uri,))
+            self._connection.execute(
+                "DELETE FROM track_values WHERE uri = ?",
+                (uri,),
+            )
+
+    def commit(self) -> None:
+        self._connection.commit()
+
+    def search(
+        self,
+        query: Query[SearchField],
+        uris: Iterable[Uri] | None = None,
+        exact: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[Track]:
+        """Get the tracks matching all the values in the query.
+
+        Values match if they are equal to a value of the track's field if
+        `exact` is true, and if they are a case-insensitive substring of it
+        otherwise. Dates match by prefix, and track and disc numbers are
+        always matched exactly.
+        """
+        where, params = _get_where(query, uris, exact)
+        sql = f"SELECT track FROM tracks WHERE {where} ORDER BY uri"  # noqa: S608
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params += [-1 if limit is None else limit, offset]
+        return [
+            Track.model_validate_json(row[0])
+            for row in self._connection.execute(sql, params)
+        ]
+
+    def get_distinct(
+        self,
+        field: DistinctField,
+        query: Query[SearchField] | None = None,
+    ) -> dict[Any, int]:
+        """Get the values of the field, with the number of tracks having each."""
+        where, params = _get_where(query or {}, None, exact=True)
+        rows = self._connection.execute(
+            "SELECT value, count(DISTINCT uri) FROM track_values "  # noqa: S608
+            f"WHERE field = ? AND uri IN (SELECT uri FROM tracks WHERE {where}) "
+            "GROUP BY value",
+            [_FIELD_ALIASES.get(field, field), *params],
+        )
+        return dict(rows.fetchall())
+
+
+def _connect(path: pathlib.Path | None) -> sqlite3.Connection:
+    if path is not None:
+        try:
+            return _open(str(path))
+        except sqlite3.Error as exc:
+            logger.warning(
+                "Failed opening library index at %s, keeping it in memory instead: %s",
+                path,
+                exc,
+            )
+    return _open(":memory:")
+
+
+def _open(database: str) -> sqlite3.Connection:
+    # The index is used from the backend's actor thread, but created from
+    # the thread starting the actor.
+    connection = sqlite3.connect(database, check_same_thread=False)
+    try:
+        (version,) = connection.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            if version:
+                logger.info("Rebuilding library index from an older version")
+            connection.executescript(
+                "DROP TABLE IF EXISTS tracks;"
+                "DROP TABLE IF EXISTS track_values;"
+                f"{_SCHEMA}"
+                f"PRAGMA user_version = {SCHEMA_VERSION};",
+            )
+    except sqlite3.Error:
+        connection.close()
+        raise
+    return connection
+
+
+def _get_values(track: Track) -> Iterator[tuple[str, Any]]:
+    album = track.album
+    values: list[tuple[str, Any]] = [
+        ("uri", track.uri),
+        ("track_name", track.name),
+        ("album", album and album.name),
+        ("musicbrainz_albumid", album and album.musicbrainz_id),
+        ("track_no", track.track_no),
+        ("disc_no", track.disc_no),
+        ("genre", track.genre),
+        ("date", track.date),
+        ("comment", track.comment),
+        ("musicbrainz_trackid", track.musicbrainz_id),
+    ]
+    values += (
+        [("albumartist", artist.name) for artist in album.artists] if album else []
+    )
+    values += [("artist", artist.name) for artist in track.artists]
+    values += [("musicbrainz_artistid", a.musicbrainz_id) for a in track.artists]
+    values += [("composer", artist.name) for artist in track.composers]
+    values += [("performer", artist.name) for artist in track.performers]
+    return ((field, value) for field, value in values if value not in (None, ""))
+
+
+def _get_where(
+    query: Query[SearchField],
+    uris: Iterable[Uri] | None,
+    exact: bool,
+) -> tuple[str, list[Any]]:
+    conditions = ["track IS NOT NULL"]
+    params: list[Any] = []
+
+    if uris is not None:
+        uri_conditions = []
+        for uri in uris:
+            prefix = uri if uri.endswith("/") else f"{uri}/"
+            uri_conditions.append("uri = ? OR substr(uri, 1, ?) = ?")
+            params += [uri, len(prefix), prefix]
+        conditions.append(" OR ".join(uri_conditions) or "0")
+
+    for field, values in query.items():
+        field_name = _FIELD_ALIASES.get(field, field)
+        for value in values:
+            condition, condition_params = _get_condition(field_name, value, exact)
+            conditions.append(
+                f"uri IN (SELECT uri FROM track_values WHERE {condition})",  # noqa: S608
+            )
+            params += condition_params
+
+    return " AND ".join(f"({condition})" for condition in conditions), params
+
+
+def _get_condition(
+    field: str,
+    value: str | int,
+    exact: bool,
+) -> tuple[str, list[Any]]:
+    if field in _INT_FIELDS or (field == "any" and isinstance(value, int)):
+        try:
+            number = int(value)
+        except ValueError:
+            return "0", []
+        if field == "any":
+            return "field IN ('track_no', 'disc_no') AND value = ?", [number]
+        return "field = ? AND value = ?", [field, number]
+
+    field_condition = "folded IS NOT NULL" if field == "any" else "field = ?"
+    field_params = [] if field == "any" else [field]
+    text = str(value).strip()
+    if exact:
+        return f"{field_condition} AND value = ?", [*field_params, text]
+    if field == "date":
+        return f"{field_condition} AND substr(folded, 1, ?) = ?", [
+            *field_params,
+            len(text),
+            text.lower(),
+        ]
+    return f"{field_condition} AND instr(folded, ?) > 0", [
+        *field_params,
+        text.lower(),
+    ]
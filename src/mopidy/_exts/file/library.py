@@ -1,21 +1,28 @@
 import logging
 import os
 import pathlib
-from collections.abc import Generator
-from typing import TypedDict, cast, override
+import time
+from collections.abc import Generator, Iterable, Iterator, Mapping
+from typing import Any, TypedDict, cast, override
 
 from mopidy import backend, exceptions
 from mopidy import config as config_lib
 from mopidy._lib import paths
 from mopidy.audio import scan, tags
-from mopidy.models import Ref, Track
-from mopidy.types import Uri
+from mopidy.models import Ref, SearchResult, Track
+from mopidy.types import DistinctField, Query, SearchField, Uri
 
 from . import Extension
+from .index import LibraryIndex
 from .types import FileConfig
 
 logger = logging.getLogger(__name__)
 
+_MTIME_RESOLUTION_NS = 2_000_000_000
+
+# Number of scanned files to index before saving the index during a refresh.
+_COMMIT_INTERVAL = 100
+
 
 class MediaDir(TypedDict):
     path: pathlib.Path
@@ -28,6 +35,14 @@ class FileLibraryProvider(backend.LibraryProvider):
     # TODO: get_images that can pull from metadata and/or .folder.png etc?
     # TODO: handle playlists?
 
+    # Core only keeps directories for a short while, as files may be added
+    # at any time. Browsing them again after that is cheap, as long as the
+    # directories haven't been modified.
+    browse_cache_ttl = 10
+
+    # Searches return the tracks in a stable order, so they can be paged.
+    search_paging = True
+
     def __init__(self, backend: backend.Backend, config: config_lib.Config) -> None:
         super().__init__(backend)
 
@@ -42,12 +57,18 @@ class FileLibraryProvider(backend.LibraryProvider):
 
         self._scanner = scan.Scanner(timeout=ext_config["metadata_timeout"])
 
+        # The contents of each browsed directory, with its modification time.
+        self._dirs: dict[pathlib.Path, tuple[int, list[Ref]]] = {}
+
+        self._index = LibraryIndex(
+            Extension.get_cache_dir(config) / "library.sqlite3",
+        )
+
         self.root_directory = self._get_root_directory()
 
     @override
-    def browse(self, uri: Uri) -> list[Ref]:  # noqa: C901
+    def browse(self, uri: Uri) -> list[Ref]:
         logger.debug("Browsing files at: %s", uri)
-        result = []
         local_path = paths.uri_to_path(uri)
 
         if str(local_path) == "root":
@@ -64,61 +85,292 @@ class FileLibraryProvider(backend.LibraryProvider):
             logger.error("Rejected attempt to browse file (%s)", uri)
             return []
 
+        # Adding, removing, or renaming entries in a directory updates its
+        # modification time, so the contents are still the same as long as
+        # the modification time is.
+        mtime = local_path.stat().st_mtime_ns
+        cached = self._dirs.get(local_path)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+
+        result = self._browse_dir(local_path)
+        # Changes right after the last one may not update the modification
+        # time on file systems with coarse timestamps, so recently modified
+        # directories are listed again the next time.
+        if time.time_ns() - mtime > _MTIME_RESOLUTION_NS:
+            self._dirs[local_path] = (mtime, result)
+        return list(result)
+
+    def _browse_dir(self, local_path: pathlib.Path) -> list[Ref]:
+        result = []
+        for name, child_path in self._iter_dir(local_path):
+            uri = paths.path_to_uri(child_path)
+            if child_path.is_dir():
+                result.append(Ref.directory(name=name, uri=uri))
+            elif child_path.is_file():
+                result.append(Ref.track(name=name, uri=uri))
+
+        def order(ref: Ref) -> tuple:
+            return (ref.type != Ref.DIRECTORY, ref.name)
+
+        result.sort(key=order)
+
+        return result
+
+    def _iter_dir(self, local_path: pathlib.Path) -> Iterator[tuple[str, pathlib.Path]]:
+        """Get the name and resolved path of the entries to show in a directory."""
         for dir_entry in local_path.iterdir():
             child_path = dir_entry.resolve()
-            uri = paths.path_to_uri(child_path)
+            if self._is_shown(dir_entry, child_path):
+                yield dir_entry.name, child_path
 
-            if not self._show_dotfiles and dir_entry.name.startswith("."):
-                continue
+    def _is_shown(self, path: pathlib.Path, resolved_path: pathlib.Path) -> bool:
+        uri = paths.path_to_uri(resolved_path)
 
-            if (
-                self._excluded_file_extensions
-                and dir_entry.suffix.lower() in self._excluded_file_extensions
+        if not self._show_dotfiles and path.name.startswith("."):
+            return False
+
+        if (
+            self._excluded_file_extensions
+            and path.suffix.lower() in self._excluded_file_extensions
+        ):
+            return False
+
+        if path.is_symlink() and not self._follow_symlinks:
+            logger.debug("Ignoring symlink: %s", uri)
+            return False
+
+        if not self._is_in_basedir(resolved_path):
+            logger.debug("Ignoring symlink to outside base dir: %s", uri)
+            return False
+
+        return True
+
+    @override
+    def refresh(self, uri: Uri | None = None) -> None:
+        local_path = paths.uri_to_path(uri) if uri else None
+        if local_path is None or str(local_path) == "root":
+            self._dirs.clear()
+            for media_dir in self._media_dirs:
+                self._update_index(media_dir["path"])
+            return
+
+        for path in list(self._dirs):
+            if path.is_relative_to(local_path):
+                del self._dirs[path]
+        if self._is_in_basedir(local_path):
+            self._update_index(local_path)
+
+    def _update_changed(self, changed: set[pathlib.Path]) -> None:
+        """Update the index with the paths changed in the media dirs.
+
+        Core is notified of the changes with the
+        [library_changed][mopidy.backend.BackendListener.library_changed]
+        event, so that it drops its cached results for the parent directories
+        of the paths.
+        """
+        local_paths = {path.resolve() for path in changed}
+        for local_path in sorted(local_paths):
+            if any(
+                local_path != other and local_path.is_relative_to(other)
+                for other in local_paths
             ):
                 continue
-
-            if dir_entry.is_symlink() and not self._follow_symlinks:
-                logger.debug("Ignoring symlink: %s", uri)
+            if not self._is_in_basedir(local_path):
                 continue
+            for path in list(self._dirs):
+                if path.is_relative_to(local_path):
+                    del self._dirs[path]
+            self._update_index(local_path)
+            backend.BackendListener.send(
+                "library_changed",
+                uri=paths.path_to_uri(local_path.parent),
+            )
 
-            if not self._is_in_basedir(child_path):
-                logger.debug("Ignoring symlink to outside base dir: %s", uri)
-                continue
+    def _update_index(self, local_path: pathlib.Path) -> None:
+        """Scan new and changed files at or below the path into the index.
+
+        Files that are no longer there are removed from the index.
+        """
+        logger.info("Updating library index of %s", local_path.as_uri())
+        indexed = self._index.get_files(paths.path_to_uri(local_path))
+        changed: dict[Uri, os.stat_result] = {}
+
+        def get_changed_uris() -> Iterator[Uri]:
+            for file_path in self._iter_files(local_path):
+                uri = paths.path_to_uri(file_path)
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    # Deleted while walking the directories.
+                    continue
+                if indexed.pop(uri, None) != (stat.st_mtime_ns, stat.st_size):
+                    changed[uri] = stat
+                    yield uri
+
+        scanned = 0
+        for _ in self._scan_many(get_changed_uris(), changed):
+            scanned += 1
+            if scanned % _COMMIT_INTERVAL == 0:
+                self._index.commit()
+        self._index.remove(indexed)
+        self._index.commit()
+        logger.info(
+            "Updated library index of %s: %d files scanned, %d removed",
+            local_path.as_uri(),
+            scanned,
+            len(indexed),
+        )
 
-            if child_path.is_dir():
-                result.append(Ref.directory(name=dir_entry.name, uri=uri))
-            elif child_path.is_file():
-                result.append(Ref.track(name=dir_entry.name, uri=uri))
+    def _iter_files(self, local_path: pathlib.Path) -> Iterator[pathlib.Path]:
+        if local_path.is_file():
+            if self._is_shown(local_path, local_path.resolve()):
+                yield local_path
+            return
+        if not local_path.is_dir():
+            return
+        # With symlinks followed, the same directory may be reached more than
+        # once, or even from within itself.
+        visited = set()
+        dirs = [local_path.resolve()]
+        while dirs:
+            dir_path = dirs.pop()
+            if dir_path in visited:
+                continue
+            visited.add(dir_path)
+            try:
+                entries = list(self._iter_dir(dir_path))
+            except OSError as e:
+                logger.warning("Failed listing %s: %s", dir_path.as_uri(), e)
+                continue
+            for _, child_path in entries:
+                if child_path.is_dir():
+                    dirs.append(child_path)
+                elif child_path.is_file():
+                    yield child_path
 
-        def order(ref: Ref) -> tuple:
-            return (ref.type != Ref.DIRECTORY, ref.name)
+    @override
+    def lookup_many(self, uris: Iterable[Uri]) -> dict[Uri, list[Track]]:
+        uris = list(uris)
+        logger.debug("Looking up %d file URIs", len(uris))
+        tracks: dict[Uri, Track | None] = {}
+        # The files to scan, with their stat result if they belong in the index.
+        to_scan: dict[Uri, os.stat_result | None] = {}
+
+        for uri in dict.fromkeys(uris):
+            stat = self._stat_for_index(paths.uri_to_path(uri))
+            entry = self._index.get(uri) if stat is not None else None
+            if (
+                stat is not None
+                and entry is not None
+                and (entry.mtime, entry.size) == (stat.st_mtime_ns, stat.st_size)
+            ):
+                tracks[uri] = entry.track
+            else:
+                to_scan[uri] = stat
 
-        result.sort(key=order)
+        tracks.update(self._scan_many(to_scan, to_scan))
+        if any(stat is not None for stat in to_scan.values()):
+            self._index.commit()
 
-        return result
+        return {
+            uri: [tracks[uri] or Track(uri=uri, name=paths.uri_to_path(uri).name)]
+            for uri in uris
+        }
 
     @override
     def lookup(self, uri: Uri) -> list[Track]:
-        logger.debug("Looking up file URI: %s", uri)
-        local_path = paths.uri_to_path(uri)
+        return self.lookup_many([uri])[uri]
 
+    def _stat_for_index(self, local_path: pathlib.Path) -> os.stat_result | None:
+        if not self._is_in_basedir(local_path):
+            return None
         try:
-            result = self._scanner.scan(uri)
+            stat = local_path.stat()
+        except OSError:
+            return None
+        return stat if local_path.is_file() else None
+
+    def _scan_many(
+        self,
+        uris: Iterable[Uri],
+        stats: Mapping[Uri, os.stat_result | None],
+    ) -> Iterator[tuple[Uri, Track | None]]:
+        """Scan the files concurrently, yielding the tracks as they are done.
+
+        Files with a stat result are added to the index, but the index is not
+        committed.
+        """
+        for uri, result in self._scanner.scan_many(uris):
+            stat = stats.get(Uri(uri))
+            track = self._convert_scan_result(
+                Uri(uri),
+                result,
+                None if stat is None else stat.st_mtime_ns,
+            )
+            if stat is not None:
+                self._index.add(Uri(uri), stat.st_mtime_ns, stat.st_size, track)
+            yield Uri(uri), track
+
+    def _convert_scan_result(
+        self,
+        uri: Uri,
+        result: scan._Result | exceptions.ScannerError,
+        mtime: int | None,
+    ) -> Track | None:
+        try:
+            if isinstance(result, exceptions.ScannerError):
+                raise result
             track = tags.convert_tags_to_track(
                 result.tags,
                 uri=uri,
                 length=result.duration,
+                last_modified=None if mtime is None else mtime // 1_000_000,
             )
         except exceptions.ScannerError as e:
             logger.warning("Failed looking up %s: %s", uri, e)
-            track = Track(uri=uri)
+            return None
 
         if not track.name:
             track = track.replace(
-                name=local_path.name,
+                name=paths.uri_to_path(uri).name,
             )
 
-        return [track]
+        return track
+
+    @override
+    def search(
+        self,
+        query: Query[SearchField],
+        uris: Iterable[Uri] | None = None,
+        exact: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> SearchResult:
+        tracks = self._index.search(
+            query,
+            uris=uris,
+            exact=exact,
+            limit=limit,
+            offset=offset,
+        )
+        return SearchResult(uri=Uri("file:search"), tracks=tuple(tracks))
+
+    @override
+    def get_distinct(
+        self,
+        field: DistinctField,
+        query: Query[SearchField] | None = None,
+    ) -> set[Any]:
+        return set(self._index.get_distinct(field, query))
+
+    @override
+    def get_distinct_counts(
+        self,
+        field: DistinctField,
+        query: Query[SearchField] | None = None,
+    ) -> dict[Any, int]:
+        return self._index.get_distinct(field, query)
 
     def _get_root_directory(self) -> Ref | None:
         if not self._media_dirs:
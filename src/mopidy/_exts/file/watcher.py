@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import pathlib
+import select
+import struct
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Changes are reported once no more changes have happened for this long, so
+# that e.g. all the files of a copied album are rescanned together...
+QUIET_PERIOD = 2.0
+
+# ...but no later than this after the first change.
+MAX_DELAY = 30.0
+
+# How often the directories are checked for changes without inotify.
+POLL_INTERVAL = 10.0
+
+# From <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_ONLYDIR
+)
+
+_EVENT = struct.Struct("iIII")
+
+
+class WatcherError(Exception):
+    pass
+
+
+class MediaDirWatcher(threading.Thread):
+    """Watches the media dirs for added, changed, and removed files.
+
+    Changed paths are collected and passed to `on_change` from the watcher's
+    thread, once they have stopped changing. The paths are files or
+    directories that were added, changed, or removed, and if any part of a
+    media dir may have changed, the media dir itself.
+
+    On Linux, inotify is used to get notified of changes. Elsewhere, or if
+    inotify fails, e.g. because there are more directories than the max
+    number of inotify watches, the modification times of the directories are
+    polled every `POLL_INTERVAL` seconds instead. Polling catches added,
+    removed, and renamed files, but not changes to the contents of existing
+    files. The changed directories are then passed to `on_change`.
+    """
+
+    def __init__(
+        self,
+        media_dirs: Iterable[pathlib.Path],
+        on_change: Callable[[set[pathlib.Path]], None],
+        *,
+        show_dotfiles: bool = False,
+        follow_symlinks: bool = False,
+    ) -> None:
+        super().__init__(name="FileWatcher", daemon=True)
+        self._media_dirs = list(media_dirs)
+        self._on_change = on_change
+        self._show_dotfiles = show_dotfiles
+        self._follow_symlinks = follow_symlinks
+        self._stop_r, self._stop_w = os.pipe()
+
+        self._changed: set[pathlib.Path] = set()
+        self._first_change: float | None = None
+        self._last_change = 0.0
+
+    def stop(self) -> None:
+        os.write(self._stop_w, b"x")
+        if self.is_alive():
+            self.join()
+        os.close(self._stop_r)
+        os.close(self._stop_w)
+
+    def run(self) -> None:
+        try:
+            inotify = _Inotify()
+        except WatcherError as e:
+            logger.info("Polling media dirs for changes, as %s", e)
+        else:
+            try:
+                self._watch(inotify)
+            except WatcherError as e:
+                logger.warning("Polling media dirs for changes, as %s", e)
+            else:
+                return
+            finally:
+                inotify.close()
+        self._poll()
+
+    def _watch(self, inotify: _Inotify) -> None:
+        for media_dir in self._media_dirs:
+            self._add_watches(inotify, media_dir)
+        logger.debug("Watching %d directories for changes", len(inotify.paths))
+
+        while True:
+            readable, _, _ = select.select(
+                [inotify.fd, self._stop_r],
+                [],
+                [],
+                self._get_timeout(),
+            )
+            if self._stop_r in readable:
+                return
+            if inotify.fd in readable:
+                for path, mask in inotify.read():
+                    self._handle_event(inotify, path, mask)
+            self._report_changes()
+
+    def _handle_event(
+        self,
+        inotify: _Inotify,
+        path: pathlib.Path | None,
+        mask: int,
+    ) -> None:
+        if mask & _IN_Q_OVERFLOW:
+            # Events were lost, so anything may have changed.
+            self._add_changes(self._media_dirs)
+            return
+        if path is None or not self._is_visible(path):
+            return
+        if mask & _IN_ISDIR and mask & _IN_MOVED_FROM:
+            inotify.remove_watches(path)
+        if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+            self._add_watches(inotify, path)
+        self._add_changes([path])
+
+    def _add_watches(self, inotify: _Inotify, path: pathlib.Path) -> None:
+        for dir_path in self._iter_dirs(path):
+            inotify.add_watch(dir_path)
+
+    def _poll(self) -> None:
+        mtimes = self._get_mtimes()
+        while not select.select([self._stop_r], [], [], POLL_INTERVAL)[0]:
+            new_mtimes = self._get_mtimes()
+            if changed := {
+                path
+                for path in mtimes.keys() | new_mtimes.keys()
+                if mtimes.get(path) != new_mtimes.get(path)
+            }:
+                self._notify(changed)
+            mtimes = new_mtimes
+
+    def _get_mtimes(self) -> dict[pathlib.Path, int]:
+        mtimes = {}
+        for media_dir in self._media_dirs:
+            for dir_path in self._iter_dirs(media_dir):
+                try:
+                    mtimes[dir_path] = dir_path.stat().st_mtime_ns
+                except OSError:
+                    continue
+        return mtimes
+
+    def _iter_dirs(self, path: pathlib.Path) -> Iterator[pathlib.Path]:
+        for dir_path, dir_names, _ in os.walk(
+            path,
+            followlinks=self._follow_symlinks,
+        ):
+            dir_names[:] = [
+                name for name in dir_names if self._show_dotfiles or name[0] != "."
+            ]
+            yield pathlib.Path(dir_path)
+
+    def _is_visible(self, path: pathlib.Path) -> bool:
+        return self._show_dotfiles or not path.name.startswith(".")
+
+    def _add_changes(self, paths: Iterable[pathlib.Path]) -> None:
+        now = time.monotonic()
+        for path in paths:
+            self._changed.add(path)
+            self._last_change = now
+            if self._first_change is None:
+                self._first_change = now
+
+    def _get_timeout(self) -> float | None:
+        if self._first_change is None:
+            return None
+        return max(
+            0,
+            min(
+                self._last_change + QUIET_PERIOD,
+                self._first_change + MAX_DELAY,
+            )
+            - time.monotonic(),
+        )
+
+    def _report_changes(self) -> None:
+        if self._first_change is None or self._get_timeout():
+            return
+        changed = self._changed
+        self._changed = set()
+        self._first_change = None
+        self._notify(changed)
+
+    def _notify(self, changed: set[pathlib.Path]) -> None:
+        logger.debug("Changes in media dirs: %s", changed)
+        try:
+            self._on_change(changed)
+        except Exception:
+            logger.exception("Failed handling changes in media dirs")
+
+
+class _Inotify:
+    def __init__(self) -> None:
+        try:
+            self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            self.fd: int = self._libc.inotify_init1(os.O_CLOEXEC)
+        except (OSError, AttributeError) as e:
+            msg = f"inotify is not available: {e}"
+            raise WatcherError(msg) from e
+        if self.fd < 0:
+            msg = f"inotify failed: {os.strerror(ctypes.get_errno())}"
+            raise WatcherError(msg)
+        self.paths: dict[int, pathlib.Path] = {}
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+    def add_watch(self, path: pathlib.Path) -> None:
+        wd = self._libc.inotify_add_watch(
+            self.fd,
+            os.fsencode(path),
+            ctypes.c_uint32(_WATCH_MASK),
+        )
+        if wd >= 0:
+            self.paths[wd] = path
+            return
+        error = ctypes.get_errno()
+        if error == errno.ENOSPC:
+            msg = (
+                "there are too many directories to watch with inotify. "
+                "Increase fs.inotify.max_user_watches to watch them."
+            )
+            raise WatcherError(msg)
+        # The directory may already be gone again.
+        logger.debug("Failed watching %s: %s", path, os.strerror(error))
+
+    def remove_watches(self, path: pathlib.Path) -> None:
+        for wd, watched_path in list(self.paths.items()):
+            if watched_path.is_relative_to(path):
+                self._libc.inotify_rm_watch(self.fd, wd)
+                del self.paths[wd]
+
+    def read(self) -> Iterator[tuple[pathlib.Path | None, int]]:
+        """Read the pending events, with the path of each event's file."""
+        data = os.read(self.fd, 64 * 1024)
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_IGNORED:
+                self.paths.pop(wd, None)
+                continue
+            dir_path = self.paths.get(wd)
+            if dir_path is None:
+                yield None, mask
+            else:
+                yield dir_path / os.fsdecode(name) if name else dir_path, mask
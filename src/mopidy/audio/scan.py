@@ -1,5 +1,8 @@
+import concurrent.futures
 import logging
+import os
 import time
+from collections.abc import Iterable, Iterator
 from enum import IntEnum
 from pathlib import Path
 from typing import Any, NamedTuple, cast
@@ -88,6 +91,61 @@ class Scanner:
             pipeline.set_state(Gst.State.NULL)
             del pipeline
 
+    def scan_many(
+        self,
+        uris: Iterable[str],
+        concurrency: int | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[tuple[str, _Result | exceptions.ScannerError]]:
+        """Scan the given URIs concurrently, each with its own pipeline.
+
+        The URIs are taken from `uris` as the scans progress, so it may be a
+        lazy iterable of many URIs.
+
+        Args:
+            uris: URIs of the resources to scan.
+            concurrency: Max number of URIs to scan at the same time. Defaults
+                to the number of CPUs.
+            timeout: Timeout for scanning each URI in milliseconds. Defaults to
+                the `timeout` value used when creating the scanner.
+
+        Returns:
+            The URI and the result of [scan][] for each URI, in the order the
+            scans complete. If a scan fails, the result is the
+            [ScannerError][mopidy.exceptions.ScannerError] instead.
+        """
+        concurrency = concurrency or os.cpu_count() or 1
+        uris = iter(uris)
+        pending: dict[concurrent.futures.Future[_Result], str] = {}
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=concurrency,
+            thread_name_prefix="Scanner",
+        ) as executor:
+            try:
+                while True:
+                    for uri in uris:
+                        pending[executor.submit(self.scan, uri, timeout)] = uri
+                        if len(pending) >= concurrency:
+                            break
+                    if not pending:
+                        return
+                    done, _ = concurrent.futures.wait(
+                        pending,
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    for future in done:
+                        uri = pending.pop(future)
+                        try:
+                            result = future.result()
+                        except exceptions.ScannerError as error:
+                            yield uri, error
+                        else:
+                            yield uri, result
+            finally:
+                # Stop early if the caller stops iterating.
+                for future in pending:
+                    future.cancel()
+
 
 # Turns out it's _much_ faster to just create a new pipeline for every as
 # decodebins and other elements don't seem to take well to being reused.
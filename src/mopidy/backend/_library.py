@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pykka
 from pykka.typing import proxy_field, proxy_method
@@ -17,7 +17,20 @@ if TYPE_CHECKING:
 
 @pykka.traversable
 class LibraryProvider:
-    """A library provider provides a library of music to Mopidy."""
+    """A library provider provides a library of music to Mopidy.
+
+    If the user has enabled them with the `core/*_cache_size` config values,
+    core caches the results of the library methods for up to the
+    `core/*_cache_ttl` config values. With the
+    `*_cache_ttl` attributes, a provider can limit how long core may cache
+    the results of each method. If `None`, the config value is used, and `0`
+    opts out of caching, e.g. if the results often change without the library
+    being refreshed. Core reads the attributes once, when it starts.
+
+    Providers that know when their library changes should rather send the
+    [library_changed][mopidy.backend.BackendListener.library_changed] event,
+    which clears core's cached results for the changed part of the library.
+    """
 
     root_directory: Ref | None = None
     """A [Ref.directory][mopidy.models.Ref.directory] with a URI and name set,
@@ -28,6 +41,37 @@ class LibraryProvider:
     *MUST be set by any class that implements* [browse][].
     """
 
+    browse_cache_ttl: int | None = None
+    """Number of seconds core may cache the results of [browse][]."""
+
+    lookup_cache_ttl: int | None = None
+    """Number of seconds core may cache the results of [lookup_many][]."""
+
+    search_cache_ttl: int | None = None
+    """Number of seconds core may cache the results of [search][].
+
+    Set to `0` if the search results depend on more than the query.
+    """
+
+    search_paging: bool = False
+    """Whether [search][] supports the `limit` and `offset` arguments.
+
+    If `True`, core passes `limit` and `offset` to [search][] when a client
+    asks for a page of search results. Otherwise, core gets all the results
+    and picks the page itself.
+    """
+
+    image_cache_ttl: int | None = None
+    """Number of seconds core may cache the results of [get_images][].
+
+    Set to `0` if the image URIs expire.
+    """
+
+    distinct_cache_ttl: int | None = None
+    """Number of seconds core may cache the results of [get_distinct][] and
+    [get_distinct_counts][].
+    """
+
     def __init__(self, backend: Backend) -> None:
         self.backend = backend
 
@@ -56,6 +100,23 @@ class LibraryProvider:
         """
         return set()
 
+    def get_distinct_counts(
+        self,
+        field: DistinctField,
+        query: Query[SearchField] | None = None,
+    ) -> dict[Any, int] | None:
+        """See [mopidy.core.LibraryController.get_distinct][].
+
+        Like [get_distinct][], but returns the number of tracks with each
+        value.
+
+        *MAY be implemented by subclass.*
+
+        Default implementation returns `None`, which means that the backend
+        can't count the values. Core then uses [get_distinct][] instead.
+        """
+        return None
+
     def get_images(self, uris: Iterable[Uri]) -> dict[Uri, list[Image]]:
         """See [mopidy.core.LibraryController.get_images][].
 
@@ -93,18 +154,32 @@ class LibraryProvider:
         query: Query[SearchField],
         uris: Iterable[Uri] | None = None,
         exact: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> SearchResult | None:
         """See [mopidy.core.LibraryController.search][].
 
         *MAY be implemented by subclass.*
+
+        The `limit` and `offset` arguments are only passed if
+        [search_paging][] is `True`. When searching several backends, core
+        asks each of them for the first `offset + limit` results, and picks
+        the page after merging them.
         """
         return None
 
 
 class LibraryProviderProxy:
     root_directory = proxy_field(LibraryProvider.root_directory)
+    browse_cache_ttl = proxy_field(LibraryProvider.browse_cache_ttl)
+    lookup_cache_ttl = proxy_field(LibraryProvider.lookup_cache_ttl)
+    search_cache_ttl = proxy_field(LibraryProvider.search_cache_ttl)
+    search_paging = proxy_field(LibraryProvider.search_paging)
+    image_cache_ttl = proxy_field(LibraryProvider.image_cache_ttl)
+    distinct_cache_ttl = proxy_field(LibraryProvider.distinct_cache_ttl)
     browse = proxy_method(LibraryProvider.browse)
     get_distinct = proxy_method(LibraryProvider.get_distinct)
+    get_distinct_counts = proxy_method(LibraryProvider.get_distinct_counts)
     get_images = proxy_method(LibraryProvider.get_images)
     lookup_many = proxy_method(LibraryProvider.lookup_many)
     lookup = proxy_method(LibraryProvider.lookup)
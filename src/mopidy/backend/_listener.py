@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from mopidy import listener
 
+if TYPE_CHECKING:
+    from mopidy.types import Uri
+
 
 class BackendListener(listener.Listener):
     """Marker interface for recipients of events sent by the backend actors.
@@ -27,3 +30,18 @@ class BackendListener(listener.Listener):
 
         *MAY* be implemented by actor.
         """
+
+    def library_changed(self, uri: Uri) -> None:
+        """Called when the backend's library has changed.
+
+        Core drops its cached library results for the URI and the URIs below
+        it, as well as all the backend's cached directories, searches, and
+        distinct values, like when the library is refreshed.
+
+        *MAY* be implemented by actor.
+
+        Args:
+            uri: The URI of the changed track or directory, or the backend's
+                URI scheme followed by a colon, like `file:`, if any part of
+                the library may have changed.
+        """
@@ -100,6 +100,19 @@ class CoreConfig(TypedDict):
     config_dir: pathlib.Path
     data_dir: pathlib.Path
     max_tracklist_length: int
+    lookup_cache_size: int
+    lookup_cache_ttl: int
+    search_cache_size: int
+    search_cache_ttl: int
+    image_cache_size: int
+    image_cache_ttl: int
+    distinct_cache_size: int
+    distinct_cache_ttl: int
+    browse_cache_size: int
+    browse_cache_ttl: int
+    library_timeout: float | None
+    library_backend_timeout: float | None
+    result_validation: Literal["full", "sampled", "off"]
     restore_state: bool
 
 
@@ -149,6 +149,10 @@ class Core(
             self.playback.set_state(new_state)
             self.playback._trigger_track_playback_paused()
 
+    @override
+    def library_changed(self, uri: Uri) -> None:
+        self.library._on_library_changed(uri)
+
     @override
     def playlists_loaded(self) -> None:
         # Forward event from backend to frontends
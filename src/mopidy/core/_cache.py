@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple, TypedDict
+
+import pykka
+
+
+class CacheStats(TypedDict):
+    size: int
+    hits: int
+    misses: int
+
+
+class _Entry[V](NamedTuple):
+    value: V
+    expires: float | None
+    cost: int
+
+
+class Cache[K, V]:
+    """A least recently used cache with an optional time to live per entry.
+
+    Each entry has a cost, which defaults to 1, and the least recently used
+    entries are evicted when the total cost exceeds `max_size`. With the
+    default cost, `max_size` is the max number of entries. With the size of
+    each entry as its cost, `max_size` is a memory budget.
+
+    The cache is used from both the core actor and the threads waiting for
+    backends, so all access is guarded by a lock.
+
+    Args:
+        max_size: Max total cost of the entries. If zero, nothing is cached.
+        clock: Function returning the current time in seconds.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: collections.OrderedDict[K, _Entry[V]] = collections.OrderedDict()
+        self._total_cost = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Get the value for the key, or `None` if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires is None or entry.expires > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry.value
+                self._remove(key)
+            self.misses += 1
+            return None
+
+    def peek(self, key: K) -> V | None:
+        """Like `get()`, but without counting a hit or miss or expiring."""
+        entry = self._entries.get(key)
+        return None if entry is None else entry.value
+
+    def set(
+        self,
+        key: K,
+        value: V,
+        ttl: float | None = None,
+        cost: int = 1,
+    ) -> None:
+        """Store the value for the key, expiring after `ttl` seconds."""
+        if cost > self.max_size or (ttl is not None and ttl <= 0):
+            return
+        expires = None if ttl is None else self._clock() + ttl
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _Entry(value, expires, cost)
+            self._total_cost += cost
+            while self._total_cost > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def discard(self, key: K) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def discard_if(self, predicate: Callable[[K, V], bool]) -> None:
+        """Remove all entries for which `predicate(key, value)` is true."""
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if predicate(k, e.value)]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_cost = 0
+
+    def get_stats(self) -> CacheStats:
+        return CacheStats(size=len(self._entries), hits=self.hits, misses=self.misses)
+
+    def _remove(self, key: K) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_cost -= entry.cost
+
+
+class InFlight[K]:
+    """Calls to backends that have not completed yet, by key.
+
+    Identical calls made while a call is in flight share its future instead
+    of calling the backend again, so that the load on the backends depends on
+    the number of distinct calls, not on the number of clients making them.
+
+    A future is shared until it has completed. After that, the next identical
+    call calls the backend again, so that results are never older than the
+    call asking for them.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.shared = 0
+        self._futures: dict[K, pykka.Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def call[T](self, key: K, func: Callable[[], pykka.Future[T]]) -> pykka.Future[T]:
+        """Get the future of the in-flight call for the key, or call `func`."""
+        with self._lock:
+            self._remove_completed()
+            future = self._futures.get(key)
+            if future is None:
+                self.calls += 1
+                future = self._futures[key] = func()
+            else:
+                self.shared += 1
+            return future
+
+    def get_stats(self) -> CacheStats:
+        with self._lock:
+            self._remove_completed()
+            return CacheStats(
+                size=len(self._futures),
+                hits=self.shared,
+                misses=self.calls,
+            )
+
+    def _remove_completed(self) -> None:
+        for key in [k for k, f in self._futures.items() if not _is_pending(f)]:
+            del self._futures[key]
+
+
+def _is_pending(future: pykka.Future[Any]) -> bool:
+    try:
+        future.get(timeout=0)
+    except pykka.Timeout:
+        return True
+    except Exception:  # noqa: BLE001
+        # The call failed, which also means it has completed.
+        return False
+    return False
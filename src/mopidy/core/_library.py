@@ -1,20 +1,37 @@
 from __future__ import annotations
 
 import collections
+import concurrent.futures
 import contextlib
+import functools
+import heapq
+import itertools
 import logging
 import operator
-import urllib.parse
+import threading
+import time
+import types
 import warnings
-from collections.abc import Generator, Iterable, Mapping
-from typing import TYPE_CHECKING, Any, cast
+from collections.abc import Callable, Generator, Iterable, Mapping
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
+import pykka
 from pykka.typing import proxy_method
 
 from mopidy import exceptions
 from mopidy.core import _validation as validation
 from mopidy.models import Image, Ref, SearchResult, Track
-from mopidy.types import DistinctField, Query, SearchField, Uri, UriScheme
+from mopidy.types import (
+    DistinctField,
+    Query,
+    QueryValue,
+    SearchField,
+    Uri,
+)
+
+from ._cache import Cache, CacheStats, InFlight
+from ._listener import CoreListener
+from ._routing import get_uri_scheme, group_by_backend
 
 if TYPE_CHECKING:
     from mopidy.backend import BackendProxy
@@ -23,6 +40,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Max number of seconds to wait for a backend's results when adding tracks
+# incrementally, if neither `core/library_timeout` nor
+# `core/library_backend_timeout` is set.
+_INCREMENTAL_LOOKUP_TIMEOUT = 60
+
+
+def _is_built_in(backend: BackendProxy) -> bool:
+    return backend.actor_ref.actor_class.__module__.startswith("mopidy._exts.")
+
 
 @contextlib.contextmanager
 def _backend_error_handling(
@@ -31,6 +57,9 @@ def _backend_error_handling(
 ) -> Generator[None]:
     try:
         yield
+    except pykka.Timeout:
+        # Already logged by LibraryController._get_result().
+        pass
     except exceptions.ValidationError as e:
         logger.error(
             "%s backend returned bad data: %s",
@@ -46,6 +75,55 @@ def _backend_error_handling(
         )
 
 
+def _wait_for_lookup(
+    backend: BackendProxy,
+    uris: list[Uri],
+    get_result: Callable[[], dict[Uri, list[Track]]],
+    on_result: Callable[[dict[Uri, list[Track]]], None],
+    level: validation.ValidationLevel,
+) -> None:
+    results: dict[Uri, list[Track]] = {uri: [] for uri in uris}
+    with _backend_error_handling(backend):
+        try:
+            result = get_result()
+        except pykka.Timeout:
+            logger.warning(
+                "%s backend did not respond in time, continuing without its "
+                "results for %d URIs.",
+                backend.actor_ref.actor_class.__name__,
+                len(uris),
+            )
+            raise
+        if result is not None:
+            validation.check_instance(result, Mapping)
+            for uri, tracks in result.items():
+                validation.check_instances(tracks, Track, level=level)
+                if uri in results:
+                    results[uri] = tracks
+    on_result(results)
+
+
+type _QueryKey = tuple[tuple[str, tuple[QueryValue, ...]], ...]
+type _SearchPaging = tuple[int, int] | None
+type _SearchKey = tuple[
+    BackendProxy,
+    _QueryKey,
+    tuple[Uri, ...] | None,
+    bool,
+    _SearchPaging,
+]
+type _CallKey = tuple[str, BackendProxy, Uri | tuple[Uri, ...]]
+type _DistinctKey = tuple[BackendProxy, DistinctField, _QueryKey | None, bool]
+type _DistinctValues = frozenset[Any] | dict[Any, int | None]
+
+
+class _Search(NamedTuple):
+    backend: BackendProxy
+    key: _SearchKey
+    cached: SearchResult | None
+    future: pykka.Future[SearchResult | None] | None
+
+
 class LibraryController:
     """Manages browsing and searching for music."""
 
@@ -53,8 +131,144 @@ class LibraryController:
         self.backends = backends
         self.core = core
 
+        core_config = core._config.get("core", {})
+        self._browse_cache = Cache[Uri, tuple[Ref, ...]](
+            core_config.get("browse_cache_size", 0),
+        )
+        self._lookup_cache = Cache[Uri, tuple[Track, ...]](
+            core_config.get("lookup_cache_size", 0),
+        )
+        self._search_cache = Cache[_SearchKey, SearchResult](
+            core_config.get("search_cache_size", 0) * 1024 * 1024,
+        )
+        self._image_cache = Cache[Uri, tuple[Image, ...]](
+            core_config.get("image_cache_size", 0),
+        )
+        self._distinct_cache = Cache[_DistinctKey, _DistinctValues](
+            core_config.get("distinct_cache_size", 0),
+        )
+        self._cache_ttls: dict[str, int] = {
+            "browse": core_config.get("browse_cache_ttl", 300),
+            "lookup": core_config.get("lookup_cache_ttl", 3600),
+            "search": core_config.get("search_cache_ttl", 300),
+            "image": core_config.get("image_cache_ttl", 3600),
+            "distinct": core_config.get("distinct_cache_ttl", 3600),
+        }
+
+        # Backends set these attributes once, so they are read when core
+        # starts, like the backends' URI schemes, and are not changed after.
+        library_backends = dict.fromkeys(backends.with_library.values())
+        enabled_caches = [
+            name
+            for name, cache in (
+                ("browse", self._browse_cache),
+                ("lookup", self._lookup_cache),
+                ("search", self._search_cache),
+                ("image", self._image_cache),
+                ("distinct", self._distinct_cache),
+            )
+            if cache.max_size
+        ]
+        ttl_futures = {
+            (backend, cache): getattr(backend.library, f"{cache}_cache_ttl")
+            for backend in library_backends
+            for cache in enabled_caches
+        }
+        paging_futures = {
+            backend: backend.library.search_paging for backend in library_backends
+        }
+        self._backend_cache_ttls: Mapping[tuple[BackendProxy, str], int] = (
+            types.MappingProxyType(
+                {
+                    (backend, cache): self._read_cache_ttl(backend, cache, future)
+                    for (backend, cache), future in ttl_futures.items()
+                },
+            )
+        )
+        self._backend_search_paging: Mapping[BackendProxy, bool] = (
+            types.MappingProxyType(
+                {
+                    backend: self._read_search_paging(backend, future)
+                    for backend, future in paging_futures.items()
+                },
+            )
+        )
+        self._root_directories: dict[BackendProxy, Ref] = {}
+        self._in_flight = InFlight[_CallKey]()
+
+        self._timeout: float | None = core_config.get("library_timeout")
+        self._backend_timeout: float | None = core_config.get(
+            "library_backend_timeout",
+        )
+        self._timeout_counts = collections.Counter[str]()
+        self._validation_level: validation.ValidationLevel = core_config.get(
+            "result_validation",
+            "full",
+        )
+        self._search_ids = itertools.count(1)
+
+    def _get_deadline(self) -> float | None:
+        if self._timeout is None:
+            return None
+        return time.monotonic() + self._timeout
+
+    def _get_result[T](
+        self,
+        backend: BackendProxy,
+        future: pykka.Future[T],
+        deadline: float | None,
+    ) -> T:
+        timeout = self._backend_timeout
+        if deadline is not None:
+            remaining = max(deadline - time.monotonic(), 0)
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        try:
+            return future.get(timeout=timeout)
+        except pykka.Timeout:
+            backend_name = backend.actor_ref.actor_class.__name__
+            self._timeout_counts[backend_name] += 1
+            logger.warning(
+                "%s backend did not respond in time, continuing without its "
+                "results. This has happened %d times.",
+                backend_name,
+                self._timeout_counts[backend_name],
+            )
+            raise
+
+    def _read_cache_ttl(
+        self,
+        backend: BackendProxy,
+        cache: str,
+        future: pykka.Future[int | None],
+    ) -> int:
+        ttl = self._cache_ttls[cache]
+        with _backend_error_handling(backend):
+            backend_ttl = future.get()
+            if backend_ttl is not None:
+                validation.check_integer(backend_ttl, min=0)
+                ttl = backend_ttl
+        return ttl
+
+    def _read_search_paging(
+        self,
+        backend: BackendProxy,
+        future: pykka.Future[bool],
+    ) -> bool:
+        with _backend_error_handling(backend):
+            return future.get() is True
+        return False
+
+    def _get_validation_level(
+        self,
+        backend: BackendProxy,
+    ) -> validation.ValidationLevel:
+        if self._validation_level == "off" and not _is_built_in(backend):
+            # Only Mopidy's own backends are trusted to return valid results.
+            return "sampled"
+        return self._validation_level
+
     def _get_backend(self, uri: Uri) -> BackendProxy | None:
-        uri_scheme = UriScheme(urllib.parse.urlparse(uri).scheme)
+        uri_scheme = get_uri_scheme(uri)
         return self.backends.with_library.get(uri_scheme, None)
 
     def _get_backends_to_uris(
@@ -64,13 +278,8 @@ class LibraryController:
         if not uris:
             return dict.fromkeys(self.backends.with_library.values())
 
-        result: dict[BackendProxy, list[Uri] | None] = collections.defaultdict(list)
-        for uri in uris:
-            backend = self._get_backend(uri)
-            if backend is not None:
-                lst = result[backend]
-                assert lst is not None
-                lst.append(uri)
+        result: dict[BackendProxy, list[Uri] | None] = {}
+        result.update(group_by_backend(uris, self.backends.with_library))
         return result
 
     def browse(self, uri: Uri | None) -> list[Ref]:
@@ -115,27 +324,53 @@ class LibraryController:
         return self._browse(uri)
 
     def _roots(self) -> list[Ref]:
-        directories = set[Ref]()
         backends = self.backends.with_library_browse.values()
-        futures = {b: b.library.root_directory for b in backends}
+        futures = {
+            b: b.library.root_directory
+            for b in backends
+            if b not in self._root_directories
+        }
+        deadline = self._get_deadline()
         for backend, future in futures.items():
             with _backend_error_handling(backend):
-                root = future.get()
+                root = self._get_result(backend, future, deadline)
                 validation.check_instance(root, Ref)
                 assert root is not None
-                directories.add(root)
+                # Root directories are set once by the backends, so they are
+                # kept until the whole library is refreshed.
+                self._root_directories[backend] = root
+        directories = {
+            self._root_directories[b] for b in backends if b in self._root_directories
+        }
         return sorted(directories, key=operator.attrgetter("name"))
 
     def _browse(self, uri: Uri) -> list[Ref]:
-        scheme = UriScheme(urllib.parse.urlparse(uri).scheme)
+        scheme = get_uri_scheme(uri)
         backend = self.backends.with_library_browse.get(scheme)
 
         if not backend:
             return []
 
+        cached = self._browse_cache.get(uri)
+        if cached is not None:
+            return list(cached)
+
         with _backend_error_handling(backend):
-            result = backend.library.browse(uri).get()
-            validation.check_instances(result, Ref)
+            future = self._in_flight.call(
+                ("browse", backend, uri),
+                functools.partial(backend.library.browse, uri),
+            )
+            deadline = self._get_deadline()
+            result = self._get_result(backend, future, deadline)
+            validation.check_instances(
+                result,
+                Ref,
+                level=self._get_validation_level(backend),
+            )
+            if self._browse_cache.max_size and (
+                ttl := self._get_cache_ttl(backend, "browse")
+            ):
+                self._browse_cache.set(uri, tuple(result), ttl=ttl)
             return result
 
         return []
@@ -144,7 +379,8 @@ class LibraryController:
         self,
         field: DistinctField,
         query: Query[SearchField] | None = None,
-    ) -> set[Any]:
+        counts: bool = False,
+    ) -> set[Any] | dict[Any, int | None]:
         """List distinct values for a given field from the library.
 
         This has mainly been added to support the list commands the MPD
@@ -153,6 +389,10 @@ class LibraryController:
 
         Returns set of values corresponding to the requested field type.
 
+        If `counts` is true, returns a dict mapping each value to the number
+        of tracks with the value instead. The count is `None` if any backend
+        with the value can't count its tracks.
+
         Args:
             field: Any one of `uri`, `track_name`, `album`, `artist`,
                 `albumartist`, `composer`, `performer`, `track_no`, `genre`,
@@ -160,6 +400,8 @@ class LibraryController:
                 `musicbrainz_artistid`, or `musicbrainz_trackid`.
             query: Query to use for limiting results, see [search][] for
                 details about the query format.
+            counts: If the number of tracks with each value should be
+                returned too.
         """
         if field == "track":
             warnings.warn(
@@ -174,21 +416,101 @@ class LibraryController:
         if query is not None:
             validation.check_query(query)  # TODO: normalize?
 
+        validation.check_boolean(counts)
+
         compat_field = cast(DistinctField, {"track_name": "track"}.get(field, field))
+        query_key = None if query is None else _get_query_key(query)
 
-        result = set()
-        futures = {
-            b: b.library.get_distinct(compat_field, query)
-            for b in self.backends.with_library.values()
-        }
-        for backend, future in futures.items():
+        backends = list(dict.fromkeys(self.backends.with_library.values()))
+        cached: dict[BackendProxy, _DistinctValues] = {}
+        futures = {}
+        for backend in backends:
+            key = (backend, compat_field, query_key, counts)
+            if (values := self._distinct_cache.get(key)) is not None:
+                cached[backend] = values
+            elif counts:
+                futures[backend] = backend.library.get_distinct_counts(
+                    compat_field,
+                    query,
+                )
+            else:
+                futures[backend] = backend.library.get_distinct(compat_field, query)
+
+        results: dict[BackendProxy, _DistinctValues] = {}
+        deadline = self._get_deadline()
+        for backend in backends:
+            if backend in cached:
+                results[backend] = cached[backend]
+                continue
             with _backend_error_handling(backend):
-                values = future.get()
+                values = self._get_distinct_result(
+                    backend,
+                    futures[backend],
+                    deadline,
+                    field_type,
+                    fallback=(
+                        functools.partial(
+                            backend.library.get_distinct,
+                            compat_field,
+                            query,
+                        )
+                        if counts
+                        else None
+                    ),
+                )
                 if values is not None:
-                    if field_type is not None:
-                        validation.check_instances(values, field_type)
-                    result.update(values)
-        return result
+                    results[backend] = values
+                    self._cache_distinct_result(
+                        backend,
+                        (backend, compat_field, query_key, counts),
+                        values,
+                    )
+
+        if counts:
+            return _merge_distinct_counts(results.values())
+        return set().union(*results.values())
+
+    def _get_distinct_result(
+        self,
+        backend: BackendProxy,
+        future: pykka.Future[Any],
+        deadline: float | None,
+        field_type: type | None,
+        fallback: Callable[[], pykka.Future[set[Any]]] | None = None,
+    ) -> _DistinctValues | None:
+        # With a fallback, the future is for the values with counts, and the
+        # fallback gets the values without counts if the backend can't count.
+        counts = fallback is not None
+        values = self._get_result(backend, future, deadline)
+        if fallback is not None and values is None:
+            values = self._get_result(backend, fallback(), deadline)
+            if values is not None:
+                values = dict.fromkeys(values)
+        if values is None:
+            return None
+        if counts:
+            validation.check_instance(values, Mapping)
+            for count in values.values():
+                if count is not None:
+                    validation.check_integer(count, min=0)
+        if field_type is not None:
+            validation.check_instances(
+                values,
+                field_type,
+                level=self._get_validation_level(backend),
+            )
+        return dict(values) if counts else frozenset(values)
+
+    def _cache_distinct_result(
+        self,
+        backend: BackendProxy,
+        key: _DistinctKey,
+        values: _DistinctValues,
+    ) -> None:
+        if not self._distinct_cache.max_size:
+            return
+        if ttl := self._get_cache_ttl(backend, "distinct"):
+            self._distinct_cache.set(key, values, ttl=ttl)
 
     def get_images(self, uris: Iterable[Uri]) -> dict[Uri, tuple[Image, ...]]:
         """Lookup the images for the given URIs.
@@ -205,26 +527,58 @@ class LibraryController:
         """
         validation.check_uris(uris)
 
+        results: dict[Uri, tuple[Image, ...]] = dict.fromkeys(uris, ())
+        uncached_uris = []
+        for uri in results:
+            cached = self._image_cache.get(uri)
+            if cached is None:
+                uncached_uris.append(uri)
+            else:
+                results[uri] = cached
+
+        backends_to_uris = self._get_backends_to_uris(uncached_uris)
         futures = {
-            backend: backend.library.get_images(backend_uris)
-            for (backend, backend_uris) in self._get_backends_to_uris(uris).items()
+            backend: self._in_flight.call(
+                ("get_images", backend, tuple(backend_uris)),
+                functools.partial(backend.library.get_images, backend_uris),
+            )
+            for (backend, backend_uris) in backends_to_uris.items()
             if backend_uris
         }
 
-        results: dict[Uri, tuple[Image, ...]] = dict.fromkeys(uris, ())
+        deadline = self._get_deadline()
         for backend, future in futures.items():
             with _backend_error_handling(backend):
-                if future.get() is None:
+                result = self._get_result(backend, future, deadline)
+                if result is None:
                     continue
-                validation.check_instance(future.get(), Mapping)
-                for uri, images in future.get().items():
-                    if uri not in uris:
+                validation.check_instance(result, Mapping)
+                level = self._get_validation_level(backend)
+                for uri, images in result.items():
+                    if uri not in results:
                         msg = f"Got unknown image URI: {uri}"
                         raise exceptions.ValidationError(msg)
-                    validation.check_instances(images, Image)
+                    validation.check_instances(images, Image, level=level)
                     results[uri] += tuple(images)
+                self._cache_image_result(
+                    backend,
+                    {uri: results[uri] for uri in backends_to_uris[backend] or []},
+                )
         return results
 
+    def _cache_image_result(
+        self,
+        backend: BackendProxy,
+        result: dict[Uri, tuple[Image, ...]],
+    ) -> None:
+        if not self._image_cache.max_size:
+            return
+        if ttl := self._get_cache_ttl(backend, "image"):
+            # URIs without images are cached too, so that clients asking for
+            # images the backend doesn't have don't keep calling the backend.
+            for uri, images in result.items():
+                self._image_cache.set(uri, images, ttl=ttl)
+
     def lookup(self, uris: Iterable[Uri]) -> dict[Uri, list[Track]]:
         """Lookup the given URIs.
 
@@ -236,24 +590,168 @@ class LibraryController:
         """
         validation.check_uris(uris)
 
+        results: dict[Uri, list[Track]] = {}
+        uncached_uris = []
+        for uri in uris:
+            cached = self._lookup_cache.get(uri)
+            if cached is None:
+                results[uri] = []
+                uncached_uris.append(uri)
+            else:
+                results[uri] = list(cached)
+
         futures = {
-            backend: backend.library.lookup_many(backend_uris)
-            for (backend, backend_uris) in self._get_backends_to_uris(uris).items()
+            backend: self._lookup_many(backend, backend_uris)
+            for (backend, backend_uris) in self._get_backends_to_uris(
+                uncached_uris,
+            ).items()
             if backend_uris
         }
-        results = {u: [] for u in uris}
 
+        deadline = self._get_deadline()
         for backend, future in futures.items():
             with _backend_error_handling(backend):
-                result = future.get()
+                result = self._get_result(backend, future, deadline)
                 if result is not None:
                     validation.check_instance(result, Mapping)
+                    level = self._get_validation_level(backend)
                     for uri, tracks in result.items():
-                        validation.check_instances(tracks, Track)
+                        validation.check_instances(tracks, Track, level=level)
                         results[uri] = tracks
+                    self._cache_lookup_result(backend, result)
 
         return results
 
+    def _lookup_many(
+        self,
+        backend: BackendProxy,
+        uris: list[Uri],
+    ) -> pykka.Future[dict[Uri, list[Track]]]:
+        return self._in_flight.call(
+            ("lookup", backend, tuple(uris)),
+            functools.partial(backend.library.lookup_many, uris),
+        )
+
+    def _get_cache_ttl(self, backend: BackendProxy, cache: str) -> int:
+        return self._backend_cache_ttls.get((backend, cache), self._cache_ttls[cache])
+
+    def _cache_lookup_result(
+        self,
+        backend: BackendProxy,
+        result: Mapping[Uri, list[Track]],
+    ) -> None:
+        if not self._lookup_cache.max_size:
+            return
+        ttl = self._get_cache_ttl(backend, "lookup")
+        for uri, tracks in result.items():
+            self._discard_stale_lookups(tracks)
+            if tracks:
+                self._lookup_cache.set(uri, tuple(tracks), ttl=ttl)
+
+    def _discard_stale_lookups(self, tracks: Iterable[Track]) -> None:
+        # A track with a newer modification time than the cached lookup of
+        # its URI, e.g. from a lookup of its directory or from a search,
+        # means that the cached lookup is outdated.
+        for track in tracks:
+            if track.last_modified is None:
+                continue
+            cached = self._lookup_cache.peek(track.uri)
+            if cached is not None and any(
+                (cached_track.last_modified or 0) < track.last_modified
+                for cached_track in cached
+            ):
+                self._lookup_cache.discard(track.uri)
+
+    def _lookup_incrementally(
+        self,
+        uris: list[Uri],
+        on_result: Callable[[dict[Uri, list[Track]]], None],
+    ) -> None:
+        """Internal method for [TracklistController][mopidy.core.TracklistController].
+
+        Looks up the given URIs like [lookup][], but calls `on_result` with
+        the results from each backend as soon as they arrive, from a separate
+        thread per backend, instead of waiting for all the backends. URIs
+        that a backend has not looked up in time are resolved to no tracks.
+        """
+        timeout = min(
+            (t for t in (self._timeout, self._backend_timeout) if t is not None),
+            default=_INCREMENTAL_LOOKUP_TIMEOUT,
+        )
+
+        uncached_uris = []
+        for uri in uris:
+            cached = self._lookup_cache.get(uri)
+            if cached is None:
+                uncached_uris.append(uri)
+            else:
+                on_result({uri: list(cached)})
+
+        backends_to_uris = self._get_backends_to_uris(uncached_uris)
+        looked_up = {
+            uri
+            for backend_uris in backends_to_uris.values()
+            for uri in backend_uris or []
+        }
+        if unknown_uris := [uri for uri in uncached_uris if uri not in looked_up]:
+            on_result({uri: [] for uri in unknown_uris})
+
+        for backend, backend_uris in backends_to_uris.items():
+            if not backend_uris:
+                continue
+            future = self._lookup_many(backend, backend_uris)
+            threading.Thread(
+                target=_wait_for_lookup,
+                args=(
+                    backend,
+                    backend_uris,
+                    functools.partial(future.get, timeout=timeout),
+                    functools.partial(self._on_lookup_done, backend, on_result),
+                    self._get_validation_level(backend),
+                ),
+                name="LibraryLookup",
+                daemon=True,
+            ).start()
+
+    def _on_lookup_done(
+        self,
+        backend: BackendProxy,
+        on_result: Callable[[dict[Uri, list[Track]]], None],
+        result: dict[Uri, list[Track]],
+    ) -> None:
+        self._cache_lookup_result(backend, result)
+        on_result(result)
+
+    def get_cache_stats(self) -> dict[str, CacheStats]:
+        """Get the number of entries, hits, and misses of the library caches.
+
+        Returns a dict with the stats of each cache by name:
+
+        - `browse`: The results of [browse][] by URI, as configured by
+          `core/browse_cache_size` and `core/browse_cache_ttl`.
+        - `lookup`: The results of [lookup][] by URI, as configured by
+          `core/lookup_cache_size` and `core/lookup_cache_ttl`.
+        - `search`: The results of [search][] by backend and query, as
+          configured by `core/search_cache_size` and `core/search_cache_ttl`.
+        - `image`: The results of [get_images][] by URI, as configured by
+          `core/image_cache_size` and `core/image_cache_ttl`.
+        - `distinct`: The results of [get_distinct][] by backend, field, and
+          query, as configured by `core/distinct_cache_size` and
+          `core/distinct_cache_ttl`.
+        - `in_flight`: The calls to backends made by [browse][],
+          [get_images][], and [lookup][] that have not completed yet. A hit
+          is a call that shared the backend's response to an identical call
+          already in flight, and a miss is a call to the backend.
+        """
+        return {
+            "browse": self._browse_cache.get_stats(),
+            "lookup": self._lookup_cache.get_stats(),
+            "search": self._search_cache.get_stats(),
+            "image": self._image_cache.get_stats(),
+            "distinct": self._distinct_cache.get_stats(),
+            "in_flight": self._in_flight.get_stats(),
+        }
+
     def refresh(self, uri: Uri | None = None) -> None:
         """Refresh library. Limit to URI and below if an URI is given.
 
@@ -263,9 +761,11 @@ class LibraryController:
         if uri is not None:
             validation.check_uri(uri)
 
+        self._invalidate_caches(uri)
+
         futures = {}
         backends = {}
-        uri_scheme = urllib.parse.urlparse(uri).scheme if uri else None
+        uri_scheme = get_uri_scheme(uri) if uri else None
 
         for backend_scheme, backend in self.backends.with_library.items():
             backends.setdefault(backend, set()).add(backend_scheme)
@@ -278,11 +778,43 @@ class LibraryController:
             with _backend_error_handling(backend):
                 future.get()
 
+    def _on_library_changed(self, uri: Uri) -> None:
+        validation.check_uri(uri)
+        self._invalidate_caches(uri)
+
+    def _invalidate_caches(self, uri: Uri | None) -> None:
+        if not uri:
+            self._root_directories.clear()
+            self._browse_cache.clear()
+            self._lookup_cache.clear()
+            self._image_cache.clear()
+            self._search_cache.clear()
+            self._distinct_cache.clear()
+            return
+
+        self._lookup_cache.discard_if(lambda key, _: key.startswith(uri))
+        self._image_cache.discard_if(lambda key, _: key.startswith(uri))
+
+        # The change may add or remove entries in the directories above the
+        # URI, which can't be told apart from other directories by their
+        # URIs, so all the backend's cached directories are dropped. Likewise,
+        # any part of a backend's library may match a search or have any of
+        # the distinct values, so all the backend's cached searches and
+        # distinct values are dropped.
+        backend = self._get_backend(uri)
+        self._browse_cache.discard_if(
+            lambda key, _: self._get_backend(key) == backend,
+        )
+        self._search_cache.discard_if(lambda key, _: key[0] == backend)
+        self._distinct_cache.discard_if(lambda key, _: key[0] == backend)
+
     def search(
         self,
         query: Query[SearchField],
         uris: Iterable[Uri] | None = None,
         exact: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[SearchResult]:
         """Search the library for tracks where `field` contains `values`.
 
@@ -308,12 +840,33 @@ class LibraryController:
 
             # Returns results matching artist 'xyz' and 'abc' in any backend
             search({'artist': ['xyz', 'abc']})
+
+            # Returns the second page of at most 50 tracks, artists, and
+            # albums each matching 'a' in any backend
+            search({'any': ['a']}, limit=50, offset=50)
             ```
 
+        If `limit` is given, the results of the backends are merged with the
+        best matches of each backend first, and the results from `offset` up
+        to `offset + limit` are returned, still grouped by backend. To get
+        the next page, search again with `offset` increased by `limit`.
+
+        Pages are not versioned: each page is picked from the results the
+        backends return for that call. If the results change between calls,
+        e.g. after the backend's library has changed, after the cached
+        results have expired, or with the search cache disabled and a backend
+        that doesn't return its results in the same order each time, the
+        pages may overlap or skip results. Clients that need a consistent
+        view of the results should search without `limit`.
+
         Args:
             query: One or more queries to search for.
             uris: Zero or more URI roots to limit the search to.
             exact: If the search should use exact matching.
+            limit: Max number of tracks, artists, and albums each to return,
+                across all backends.
+            offset: Number of tracks, artists, and albums each to skip before
+                the returned ones, when `limit` is given.
         """
         query = _normalize_query(query)
 
@@ -321,17 +874,20 @@ class LibraryController:
             validation.check_uris(uris)
         validation.check_query(query)
         validation.check_boolean(exact)
+        if limit is not None:
+            validation.check_integer(limit, min=1)
+        validation.check_integer(offset, min=0)
 
         if not query:
             return []
 
-        futures = {}
-        for backend, backend_uris in self._get_backends_to_uris(uris).items():
-            futures[backend] = backend.library.search(
-                query=query,
-                uris=backend_uris,
-                exact=exact,
-            )
+        deadline = self._get_deadline()
+        searches = self._start_searches(
+            query,
+            uris,
+            exact,
+            page=None if limit is None else (limit, offset),
+        )
 
         # Some of our tests check for LookupError to catch bad queries. This is
         # silly and should be replaced with query validation before passing it
@@ -339,23 +895,258 @@ class LibraryController:
         reraise = (TypeError, LookupError)
 
         results = []
-        for backend, future in futures.items():
-            try:
-                with _backend_error_handling(backend, reraise=reraise):
-                    result = future.get()
-                    if result is not None:
-                        validation.check_instance(result, SearchResult)
-                        results.append(result)
-            except TypeError:
-                backend_name = backend.actor_ref.actor_class.__name__
-                logger.warning(
-                    '%s does not implement library.search() with "exact" '
-                    "support. Please upgrade it.",
-                    backend_name,
-                )
+        for search in searches:
+            result = search.cached
+            if result is None:
+                result = self._get_search_result(search, deadline, reraise=reraise)
+            if result is not None:
+                results.append(result)
+
+        if limit is not None:
+            # A single backend that supports paging has skipped the offset
+            # itself, while the others return their results from the start.
+            paging = searches[0].key[4] if len(searches) == 1 else None
+            skipped = paging[1] if paging is not None else 0
+            results = _get_search_page(results, limit, offset - skipped)
 
         return results
 
+    def start_search(
+        self,
+        query: Query[SearchField],
+        uris: Iterable[Uri] | None = None,
+        exact: bool = False,
+    ) -> int:
+        """Start a search, getting the results from each backend as events.
+
+        Searches like [search][], but returns a search ID right away instead
+        of waiting for all the backends to respond. The results of each
+        backend are sent with a
+        [search_result][mopidy.core.CoreListener.search_result] event as soon
+        as the backend responds, so that slow backends don't hold back the
+        results of the fast ones. When all backends have responded, or timed
+        out, a [search_done][mopidy.core.CoreListener.search_done] event is
+        sent.
+
+        The events may be sent before the search ID is returned to the
+        caller, so clients should be prepared to receive events for search
+        IDs they don't know yet.
+
+        Like all core events, the events are sent to every
+        [CoreListener][mopidy.core.CoreListener], including all clients of
+        the HTTP frontend's WebSocket, not just the caller. Each
+        `search_result` event carries the backend's full search result, so
+        clients that don't need to show results as they arrive should use
+        [search][] instead.
+
+        Args:
+            query: One or more queries to search for.
+            uris: Zero or more URI roots to limit the search to.
+            exact: If the search should use exact matching.
+
+        Returns:
+            The ID of the search, which is included in the events.
+        """
+        query = _normalize_query(query)
+
+        if uris is not None:
+            validation.check_uris(uris)
+        validation.check_query(query)
+        validation.check_boolean(exact)
+
+        search_id = next(self._search_ids)
+        deadline = self._get_deadline()
+        searches = self._start_searches(query, uris, exact) if query else []
+
+        for search in searches:
+            if search.cached is not None:
+                CoreListener.send(
+                    "search_result",
+                    search_id=search_id,
+                    result=search.cached,
+                )
+
+        if pending := [search for search in searches if search.cached is None]:
+            threading.Thread(
+                target=self._stream_search_results,
+                args=(search_id, pending, deadline),
+                name="LibrarySearch",
+                daemon=True,
+            ).start()
+        else:
+            CoreListener.send("search_done", search_id=search_id)
+
+        return search_id
+
+    def _start_searches(
+        self,
+        query: Query[SearchField],
+        uris: Iterable[Uri] | None,
+        exact: bool,
+        page: tuple[int, int] | None = None,
+    ) -> list[_Search]:
+        query_key = _get_query_key(query)
+        backends_to_uris = self._get_backends_to_uris(uris)
+        searches = []
+        for backend, backend_uris in backends_to_uris.items():
+            paging = None
+            if page is not None and self._backend_search_paging.get(backend, False):
+                limit, offset = page
+                # With more than one backend, the page can only be picked
+                # after merging the results, so each backend is asked for all
+                # results up to the end of the page.
+                paging = (
+                    (limit, offset)
+                    if len(backends_to_uris) == 1
+                    else (offset + limit, 0)
+                )
+            cache_key = (
+                backend,
+                query_key,
+                None if backend_uris is None else tuple(backend_uris),
+                exact,
+                paging,
+            )
+            if (cached := self._search_cache.get(cache_key)) is not None:
+                searches.append(_Search(backend, cache_key, cached, None))
+                continue
+            if paging is None:
+                future = backend.library.search(
+                    query=query,
+                    uris=backend_uris,
+                    exact=exact,
+                )
+            else:
+                future = backend.library.search(
+                    query=query,
+                    uris=backend_uris,
+                    exact=exact,
+                    limit=paging[0],
+                    offset=paging[1],
+                )
+            searches.append(_Search(backend, cache_key, None, future))
+        return searches
+
+    def _get_search_result(
+        self,
+        search: _Search,
+        deadline: float | None,
+        reraise: type[Exception] | tuple[type[Exception], ...] = TypeError,
+    ) -> SearchResult | None:
+        assert search.future is not None
+        try:
+            with _backend_error_handling(search.backend, reraise=reraise):
+                result = self._get_result(search.backend, search.future, deadline)
+                if result is not None:
+                    validation.check_instance(result, SearchResult)
+                    self._discard_stale_lookups(result.tracks)
+                    self._cache_search_result(
+                        search.backend,
+                        search.key,
+                        result,
+                    )
+                    return result
+        except TypeError:
+            backend_name = search.backend.actor_ref.actor_class.__name__
+            logger.warning(
+                '%s does not implement library.search() with "exact" '
+                "support. Please upgrade it.",
+                backend_name,
+            )
+        return None
+
+    def _stream_search_results(
+        self,
+        search_id: int,
+        searches: list[_Search],
+        deadline: float | None,
+    ) -> None:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(searches),
+            thread_name_prefix="LibrarySearch",
+        ) as executor:
+            futures = [
+                executor.submit(self._get_search_result, search, deadline)
+                for search in searches
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                if (result := future.result()) is not None:
+                    CoreListener.send(
+                        "search_result",
+                        search_id=search_id,
+                        result=result,
+                    )
+        CoreListener.send("search_done", search_id=search_id)
+
+    def _cache_search_result(
+        self,
+        backend: BackendProxy,
+        key: _SearchKey,
+        result: SearchResult,
+    ) -> None:
+        if not self._search_cache.max_size:
+            return
+        ttl = self._get_cache_ttl(backend, "search")
+        if ttl:
+            # The size of the result serialized as JSON is a rough, but cheap
+            # to compute, measure of the memory it uses.
+            cost = len(result.model_dump_json())
+            self._search_cache.set(key, result, ttl=ttl, cost=cost)
+
+
+def _get_search_page(
+    results: list[SearchResult],
+    limit: int,
+    offset: int,
+) -> list[SearchResult]:
+    pages: list[dict[str, list[Any]]] = [
+        {"tracks": [], "artists": [], "albums": []} for _ in results
+    ]
+    for kind in ("tracks", "artists", "albums"):
+        # Each backend returns its results with the best matches first, so
+        # the results are merged by their rank within each backend, keeping
+        # the backend order between results of the same rank. The merge is
+        # lazy, so only the results up to the end of the page are visited.
+        ranked = heapq.merge(
+            *(
+                zip(range(len(getattr(result, kind))), itertools.repeat(i))
+                for i, result in enumerate(results)
+            ),
+        )
+        for rank, i in itertools.islice(ranked, offset, offset + limit):
+            pages[i][kind].append(getattr(results[i], kind)[rank])
+    return [
+        SearchResult(uri=result.uri, **page)
+        for result, page in zip(results, pages, strict=True)
+    ]
+
+
+def _merge_distinct_counts(
+    results: Iterable[_DistinctValues],
+) -> dict[Any, int | None]:
+    value_counts: dict[Any, int | None] = {}
+    for values in results:
+        assert isinstance(values, dict)
+        for value, count in values.items():
+            if value not in value_counts:
+                value_counts[value] = count
+            elif (total := value_counts[value]) is None or count is None:
+                value_counts[value] = None
+            else:
+                value_counts[value] = total + count
+    return value_counts
+
+
+def _get_query_key(query: Query[SearchField]) -> _QueryKey:
+    # Queries that only differ in the order of fields or values, or in
+    # duplicated values, give the same results, and share a cache entry.
+    return tuple(
+        sorted(
+            (field, tuple(sorted(set(values), key=str)))
+            for field, values in query.items()
+        ),
+    )
+
 
 def _normalize_query(query: Query[SearchField]) -> Query[SearchField]:
     broken_client = False
@@ -382,8 +1173,10 @@ def _normalize_query(query: Query[SearchField]) -> Query[SearchField]:
 
 class LibraryControllerProxy:
     browse = proxy_method(LibraryController.browse)
+    get_cache_stats = proxy_method(LibraryController.get_cache_stats)
     get_distinct = proxy_method(LibraryController.get_distinct)
     get_images = proxy_method(LibraryController.get_images)
     lookup = proxy_method(LibraryController.lookup)
     refresh = proxy_method(LibraryController.refresh)
     search = proxy_method(LibraryController.search)
+    start_search = proxy_method(LibraryController.start_search)
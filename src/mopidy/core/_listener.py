@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, Literal, override
 
 from mopidy import listener
-from mopidy.models import Playlist, TlTrack
+from mopidy.models import Playlist, SearchResult, TlTrack, TracklistChange
 from mopidy.types import DurationMs, Percentage, PlaybackState, Uri
 
 type CoreEvent = Literal[
@@ -13,6 +13,7 @@ type CoreEvent = Literal[
     "track_playback_ended",
     "playback_state_changed",
     "tracklist_changed",
+    "tracklist_delta",
     "playlists_loaded",
     "playlist_changed",
     "playlist_deleted",
@@ -21,12 +22,23 @@ type CoreEvent = Literal[
     "mute_changed",
     "seeked",
     "stream_title_changed",
+    "search_result",
+    "search_done",
 ]
 
 # A union of all possible data types for the core events. This is used to create
 # Pydantic TypeAdapter's to serialize the events to JSON.
 type CoreEventData = (
-    DurationMs | Percentage | PlaybackState | Playlist | TlTrack | Uri | bool | str
+    DurationMs
+    | Percentage
+    | PlaybackState
+    | Playlist
+    | SearchResult
+    | TlTrack
+    | tuple[TracklistChange, ...]
+    | Uri
+    | bool
+    | str
 )
 
 
@@ -134,6 +146,29 @@ class CoreListener(listener.Listener):
         *MAY* be implemented by actor.
         """
 
+    def tracklist_delta(
+        self,
+        version: int,
+        changes: tuple[TracklistChange, ...],
+    ) -> None:
+        """Called whenever the tracklist is changed, with the changes made.
+
+        Sent right before
+        [tracklist_changed][mopidy.core.CoreListener.tracklist_changed], so
+        that clients keeping a copy of the tracklist can update it without
+        refetching the full tracklist.
+
+        If `version` isn't exactly one more than the version of the client's
+        copy, the client has missed some changes and can catch up using
+        [get_changes_since][mopidy.core.TracklistController.get_changes_since].
+
+        *MAY* be implemented by actor.
+
+        Args:
+            version: The new tracklist version.
+            changes: The changes, in the order they were made.
+        """
+
     def playlists_loaded(self) -> None:
         """Called when playlists are loaded or refreshed.
 
@@ -201,3 +236,33 @@ class CoreListener(listener.Listener):
         Args:
             title: The new stream title.
         """
+
+    def search_result(self, search_id: int, result: SearchResult) -> None:
+        """Called with the results from one backend of a streaming search.
+
+        Sent once for each backend that responds to a search started with
+        [start_search][mopidy.core.LibraryController.start_search], in the
+        order the backends respond. Like other events, it is sent to all
+        listeners, not just the one that started the search, and it carries
+        the backend's full search result.
+
+        *MAY* be implemented by actor.
+
+        Args:
+            search_id: The ID returned by `start_search()`.
+            result: The backend's search result.
+        """
+
+    def search_done(self, search_id: int) -> None:
+        """Called when all backends have responded to a streaming search.
+
+        Sent after the last
+        [search_result][mopidy.core.CoreListener.search_result] event of a
+        search started with
+        [start_search][mopidy.core.LibraryController.start_search].
+
+        *MAY* be implemented by actor.
+
+        Args:
+            search_id: The ID returned by `start_search()`.
+        """
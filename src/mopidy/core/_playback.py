@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-import urllib.parse
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
@@ -11,9 +10,10 @@ from pykka.typing import proxy_method
 from mopidy.core import _validation as validation
 from mopidy.core._state_storage import PlaybackControllerState
 from mopidy.exceptions import CoreError
-from mopidy.types import DurationMs, PlaybackState, TracklistId, UriScheme
+from mopidy.types import DurationMs, PlaybackState, TracklistId
 
 from ._listener import CoreListener
+from ._routing import get_uri_scheme
 
 if TYPE_CHECKING:
     from mopidy.audio import AudioProxy
@@ -59,7 +59,7 @@ class PlaybackController:
     def _get_backend(self, tl_track: TlTrack | None) -> BackendProxy | None:
         if tl_track is None:
             return None
-        uri_scheme = UriScheme(urllib.parse.urlparse(tl_track.track.uri).scheme)
+        uri_scheme = get_uri_scheme(tl_track.track.uri)
         return self.backends.with_playback.get(uri_scheme, None)
 
     def get_current_tl_track(self) -> TlTrack | None:
@@ -252,11 +252,14 @@ class PlaybackController:
 
         Used by [TracklistController][mopidy.core.TracklistController].
         """
-        tl_tracks = self.core.tracklist.get_tl_tracks()
-        if not tl_tracks:
+        if not self.core.tracklist.get_length():
             self.stop()
             self._set_current_tl_track(None)
-        elif self.get_current_tl_track() not in tl_tracks:
+            return
+        current_tl_track = self.get_current_tl_track()
+        if current_tl_track is not None and (
+            self.core.tracklist.index(tl_track=current_tl_track) is None
+        ):
             self._set_current_tl_track(None)
 
     def next(self) -> None:
@@ -313,11 +316,8 @@ class PlaybackController:
         tl_track: TlTrack | None = None
         if tlid is not None:
             validation.check_integer(tlid, min=1)
-            for candidate_tl_track in self.core.tracklist.get_tl_tracks():
-                if candidate_tl_track.tlid == tlid:
-                    tl_track = candidate_tl_track
-                    break
-            else:
+            tl_track = self.core.tracklist._get_tl_track(tlid)
+            if tl_track is None:
                 logger.info(
                     "Tried to play track with TLID %d, "
                     "but it was not found in the tracklist.",
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import contextlib
 import logging
-import urllib.parse
 from collections.abc import Generator
 from typing import TYPE_CHECKING
 
@@ -11,15 +10,15 @@ from pykka.typing import proxy_method
 from mopidy import exceptions
 from mopidy.core import _validation as validation
 from mopidy.models import Playlist, Ref
-from mopidy.types import UriScheme
 
 from ._listener import CoreListener
+from ._routing import get_uri_scheme
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from mopidy.backend import BackendProxy
-    from mopidy.types import Uri
+    from mopidy.types import Uri, UriScheme
 
     from ._actor import Backends, Core
 
@@ -96,7 +95,7 @@ class PlaylistsController:
         """
         validation.check_uri(uri)
 
-        uri_scheme = UriScheme(urllib.parse.urlparse(uri).scheme)
+        uri_scheme = get_uri_scheme(uri)
         backend = self.backends.with_playlists.get(uri_scheme, None)
 
         if not backend:
@@ -159,7 +158,7 @@ class PlaylistsController:
         """
         validation.check_uri(uri)
 
-        uri_scheme = UriScheme(urllib.parse.urlparse(uri).scheme)
+        uri_scheme = get_uri_scheme(uri)
         backend = self.backends.with_playlists.get(uri_scheme, None)
         if not backend:
             return False
@@ -187,7 +186,7 @@ class PlaylistsController:
         Args:
             uri: Playlist URI.
         """
-        uri_scheme = UriScheme(urllib.parse.urlparse(uri).scheme)
+        uri_scheme = get_uri_scheme(uri)
         backend = self.backends.with_playlists.get(uri_scheme, None)
         if not backend:
             return None
@@ -259,7 +258,7 @@ class PlaylistsController:
         if playlist.uri is None:
             return None  # TODO: log this problem?
 
-        uri_scheme = UriScheme(urllib.parse.urlparse(playlist.uri).scheme)
+        uri_scheme = get_uri_scheme(playlist.uri)
         backend = self.backends.with_playlists.get(uri_scheme, None)
         if not backend:
             return None
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import collections
+import functools
+import re
+import urllib.parse
+from typing import TYPE_CHECKING
+
+from mopidy.types import UriScheme
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from mopidy.backend import BackendProxy
+    from mopidy.types import Uri
+
+# The characters urllib.parse accepts in a scheme.
+_SCHEME_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*")
+
+
+def get_uri_scheme(uri: str) -> UriScheme:
+    """Get the scheme of the URI, like `urllib.parse.urlsplit(uri).scheme`.
+
+    The schemes of all URIs handled by core are looked up this way, often for
+    thousands of URIs at a time, so the common case of a URI starting with a
+    scheme is answered from a small cache keyed by the part before the first
+    colon. Other URIs are parsed in full.
+    """
+    head, colon, _ = uri.partition(":")
+    if colon:
+        scheme = _get_scheme(head)
+        if scheme is not None:
+            return scheme
+    return UriScheme(urllib.parse.urlsplit(uri).scheme)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_scheme(head: str) -> UriScheme | None:
+    if _SCHEME_RE.fullmatch(head) is None:
+        return None
+    return UriScheme(head.lower())
+
+
+def group_by_backend(
+    uris: Iterable[Uri],
+    backends: Mapping[UriScheme, BackendProxy],
+) -> dict[BackendProxy, list[Uri]]:
+    """Group the URIs by the backend handling their scheme.
+
+    URIs with a scheme no backend handles are left out. The URIs keep their
+    order within each group.
+    """
+    result: dict[BackendProxy, list[Uri]] = collections.defaultdict(list)
+    for uri in uris:
+        backend = backends.get(get_uri_scheme(uri))
+        if backend is not None:
+            result[backend].append(uri)
+    return dict(result)
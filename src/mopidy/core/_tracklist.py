@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+import collections
+import contextlib
 import logging
 import random
 import warnings
-from collections.abc import Iterable
-from typing import TYPE_CHECKING
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
 from warnings import deprecated
 
+import pykka
+from pykka.messages import ProxyCall
 from pykka.typing import proxy_method
 
 from mopidy import exceptions
 from mopidy.core import _validation as validation
 from mopidy.core._state_storage import TracklistControllerState
-from mopidy.models import TlTrack, Track
+from mopidy.models import TlTrack, Track, TracklistChange
 from mopidy.types import TracklistId
 
 from ._listener import CoreListener
@@ -24,6 +28,99 @@ if TYPE_CHECKING:
 
     from ._actor import Core
 
+# Number of tracklist versions to keep changes for in the change log.
+CHANGE_LOG_LENGTH = 100
+
+# Methods that can be used as operations in TracklistController.batch().
+BATCH_METHODS = ("add", "clear", "move", "remove", "shuffle")
+
+
+class _ShuffledTracks:
+    """The order tracks are played in when random mode is enabled.
+
+    Tracks that have not been played yet are kept with the next track to play
+    at the end of the list, so that marking it as played is a cheap pop. The
+    position of every pending track is indexed by TLID, so that any track can
+    be dropped by moving the last track into its place. New tracks are
+    appended and then swapped with a random pending track, which keeps the
+    order uniformly random without reshuffling the tracks already pending.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[TlTrack] = []
+        self._positions: dict[TracklistId, int] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._pending)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def clear(self) -> None:
+        self._pending = []
+        self._positions = {}
+
+    def copy(self) -> _ShuffledTracks:
+        result = _ShuffledTracks()
+        result._pending = self._pending[:]
+        result._positions = self._positions.copy()
+        return result
+
+    def reset(self, tl_tracks: Iterable[TlTrack]) -> None:
+        self._pending = list(tl_tracks)
+        random.shuffle(self._pending)
+        self._positions = {
+            tl_track.tlid: position for position, tl_track in enumerate(self._pending)
+        }
+
+    def peek(self) -> TlTrack | None:
+        if not self._pending:
+            return None
+        return self._pending[-1]
+
+    def add(self, tl_tracks: Iterable[TlTrack]) -> None:
+        for tl_track in tl_tracks:
+            position = len(self._pending)
+            self._pending.append(tl_track)
+            self._positions[tl_track.tlid] = position
+            self._swap(position, random.randint(0, position))  # noqa: S311
+
+    def discard(self, tlid: TracklistId) -> None:
+        position = self._positions.get(tlid)
+        if position is None:
+            return
+        self._swap(position, len(self._pending) - 1)
+        self._pending.pop()
+        del self._positions[tlid]
+
+    def _swap(self, a: int, b: int) -> None:
+        if a == b:
+            return
+        pending = self._pending
+        pending[a], pending[b] = pending[b], pending[a]
+        self._positions[pending[a].tlid] = a
+        self._positions[pending[b].tlid] = b
+
+
+class _PendingAdd:
+    """The URIs of an incremental add, in the order their tracks are added."""
+
+    def __init__(self, uris: Iterable[Uri]) -> None:
+        self._uris = collections.deque(uris)
+        self._results: dict[Uri, list[Track]] = {}
+
+    def update(self, results: Mapping[Uri, list[Track]]) -> list[Track]:
+        """Store lookup results and return the tracks that are next in line."""
+        self._results.update(results)
+        tracks = []
+        while self._uris and self._uris[0] in self._results:
+            tracks.extend(self._results[self._uris.popleft()])
+        return tracks
+
+    def cancel(self) -> None:
+        self._uris.clear()
+        self._results.clear()
+
 
 class TracklistController:
     """Manages the queued tracks."""
@@ -32,17 +129,64 @@ class TracklistController:
         self.core = core
         self._next_tlid: TracklistId = TracklistId(1)
         self._tl_tracks: list[TlTrack] = []
+        self._tlid_index: dict[TracklistId, int] | None = None
+        self._field_indexes: dict[str, dict[Any, list[int]]] = {}
         self._version: int = 0
+        self._in_batch: bool = False
+        self._batch_modified: bool = False
+        self._pending_changes: list[TracklistChange] = []
+        self._change_log: collections.deque[tuple[int, tuple[TracklistChange, ...]]] = (
+            collections.deque(maxlen=CHANGE_LOG_LENGTH)
+        )
 
         self._consume: bool = False
         self._random: bool = False
-        self._shuffled: list[TlTrack] = []
+        self._shuffled = _ShuffledTracks()
         self._repeat: bool = False
         self._single: bool = False
 
-    def get_tl_tracks(self) -> list[TlTrack]:
-        """Get tracklist as list of [TlTrack][mopidy.models.TlTrack]."""
-        return self._tl_tracks[:]
+    def get_tl_tracks(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        version: int | None = None,
+    ) -> list[TlTrack]:
+        """Get tracklist as list of [TlTrack][mopidy.models.TlTrack].
+
+        By default, the full tracklist is returned. Clients that only need
+        to show a part of a long tracklist can fetch it one page at a time
+        using *offset* and *limit*. To make sure that all the pages are from
+        the same tracklist, pass the version returned by [get_version][]
+        as *version* when fetching each page.
+
+        Each call returns a new list, so the caller may modify it. Building
+        the list takes time proportional to the number of tracks returned,
+        so clients of long tracklists should fetch pages.
+
+        Args:
+            offset: Position of the first track to return.
+            limit: Max number of tracks to return. Defaults to all tracks
+                after *offset*.
+            version: The tracklist version the client expects.
+
+        Raises:
+            TracklistVersionMismatch: If *version* is given and the
+                tracklist has changed since that version.
+        """
+        validation.check_integer(offset, min=0)
+        if limit is not None:
+            validation.check_integer(limit, min=0)
+        if version is not None:
+            validation.check_integer(version, min=0)
+            if version != self._version:
+                msg = (
+                    f"Tracklist version is {self._version}, "
+                    f"not the expected version {version}"
+                )
+                raise exceptions.TracklistVersionMismatch(msg)
+
+        end = None if limit is None else offset + limit
+        return self._tl_tracks[offset:end]
 
     def get_tracks(self) -> list[Track]:
         """Get tracklist as list of [Track][mopidy.models.Track]."""
@@ -60,10 +204,88 @@ class TracklistController:
         """
         return self._version
 
+    def get_changes_since(self, version: int) -> list[TracklistChange] | None:
+        """Get the changes made to the tracklist after the given version.
+
+        Lets clients that have missed some
+        [tracklist_delta][mopidy.core.CoreListener.tracklist_delta] events
+        bring their copy of the tracklist up to date.
+
+        Only the changes for the last 100 versions are kept. If the changes
+        since the given version are no longer available, or the version is
+        unknown, `None` is returned, and the client must fetch the full
+        tracklist with [get_tl_tracks][] instead.
+
+        Args:
+            version: The tracklist version the client has.
+        """
+        validation.check_integer(version, min=0)
+
+        if version == self._version:
+            return []
+        if version > self._version:
+            return None
+        if not self._change_log or self._change_log[0][0] > version + 1:
+            return None
+        return [
+            change
+            for (change_version, changes) in self._change_log
+            if change_version > version
+            for change in changes
+        ]
+
+    def _record_change(self, **kwargs: Any) -> None:
+        self._pending_changes.append(
+            TracklistChange(version=self._version + 1, **kwargs),
+        )
+
+    def _invalidate_indexes(self) -> None:
+        self._tlid_index = None
+        self._field_indexes = {}
+
+    def _get_tlid_index(self) -> dict[TracklistId, int]:
+        # The TLID to position index is built lazily on first use after the
+        # tracklist has been modified, so that a series of modifications only
+        # pays for a single rebuild.
+        if self._tlid_index is None:
+            self._tlid_index = {
+                tl_track.tlid: position
+                for position, tl_track in enumerate(self._tl_tracks)
+            }
+        return self._tlid_index
+
+    def _get_field_index(self, field: str) -> dict[Any, list[int]]:
+        # Like the TLID index, the index from a track field's values to the
+        # positions of the tracks with that value is built lazily, and only
+        # for the fields that are actually filtered on.
+        index = self._field_indexes.get(field)
+        if index is None:
+            index = {}
+            for position, tl_track in enumerate(self._tl_tracks):
+                index.setdefault(getattr(tl_track.track, field), []).append(position)
+            self._field_indexes[field] = index
+        return index
+
+    def _get_tl_track(self, tlid: TracklistId) -> TlTrack | None:
+        """Internal method for [PlaybackController][mopidy.core.PlaybackController]."""
+        position = self._get_tlid_index().get(tlid)
+        if position is None:
+            return None
+        return self._tl_tracks[position]
+
     def _increase_version(self) -> None:
+        if self._in_batch:
+            # Defer the version bump and its side effects to the end of the
+            # batch, so that they happen once per batch.
+            self._batch_modified = True
+            return
+
         self._version += 1
+        changes = tuple(self._pending_changes)
+        self._pending_changes = []
+        self._change_log.append((self._version, changes))
         self.core.playback._on_tracklist_change()
-        self._trigger_tracklist_changed()
+        self._trigger_tracklist_changed(changes)
 
     def get_consume(self) -> bool:
         """Get consume mode.
@@ -110,8 +332,9 @@ class TracklistController:
         if self.get_random() != value:
             self._trigger_options_changed()
         if value:
-            self._shuffled = self.get_tl_tracks()
-            random.shuffle(self._shuffled)
+            self._shuffled.reset(self._tl_tracks)
+        else:
+            self._shuffled.clear()
         self._random = value
 
     def get_repeat(self) -> bool:
@@ -185,14 +408,11 @@ class TracklistController:
             tl_track = self.core.playback.get_current_tl_track()
 
         if tl_track is not None:
-            try:
-                return self._tl_tracks.index(tl_track)
-            except ValueError:
-                pass
+            position = self._get_tlid_index().get(tl_track.tlid)
+            if position is not None and self._tl_tracks[position] == tl_track:
+                return position
         elif tlid is not None:
-            for i, tl_track in enumerate(self._tl_tracks):
-                if tl_track.tlid == tlid:
-                    return i
+            return self._get_tlid_index().get(tlid)
         return None
 
     def get_eot_tlid(self) -> TracklistId | None:
@@ -278,13 +498,10 @@ class TracklistController:
             and (self.get_repeat() or not tl_track)
         ):
             logger.debug("Shuffling tracks")
-            self._shuffled = self._tl_tracks[:]
-            random.shuffle(self._shuffled)
+            self._shuffled.reset(self._tl_tracks)
 
         if self.get_random():
-            if self._shuffled:
-                return self._shuffled[0]
-            return None
+            return self._shuffled.peek()
 
         next_index = self.index(tl_track)
         if next_index is None:
@@ -349,12 +566,13 @@ class TracklistController:
         # 1 - len(tracks) Thus 'position - 1' will always be within the list.
         return self._tl_tracks[position - 1]
 
-    def add(  # noqa: C901
+    def add(
         self,
         tracks: Iterable[Track] | None = None,
         *,
         at_position: int | None = None,
         uris: Iterable[Uri] | None = None,
+        incremental: bool = False,
     ) -> list[TlTrack]:
         """Add tracks to the tracklist.
 
@@ -366,6 +584,17 @@ class TracklistController:
         position in the tracklist. If `at_position` is not given, the tracks
         are appended to the end of the tracklist.
 
+        If `incremental` is true, `uris` must be given, and the method
+        returns an empty list without waiting for the lookups. The tracks are
+        then appended to the tracklist in the order of the URIs as soon as
+        the results from the backends arrive, so that the tracks from a fast
+        backend don't have to wait for a slow backend unless they come after
+        the slow backend's tracks. Each group of appended tracks gets the next
+        TLIDs and triggers the events, like a separate call to this method.
+        The URIs of a backend that doesn't respond within
+        `core/library_timeout` or `core/library_backend_timeout`, or a minute
+        if neither is set, are skipped.
+
         Triggers the
         [tracklist_changed][mopidy.core.CoreListener.tracklist_changed] event.
 
@@ -373,6 +602,7 @@ class TracklistController:
             tracks: Tracks to add.
             at_position: Position in tracklist to add tracks.
             uris: List of URIs for tracks to add.
+            incremental: Add the tracks as the lookups of `uris` complete.
         """
         if sum(o is not None for o in [tracks, uris]) != 1:
             msg = 'Exactly one of "tracks" or "uris" must be set'
@@ -383,6 +613,14 @@ class TracklistController:
         if uris is not None:
             validation.check_uris(uris)
         validation.check_integer(at_position or 0)
+        validation.check_boolean(incremental)
+
+        if incremental:
+            if uris is None or at_position is not None:
+                msg = '"incremental" requires "uris" and no "at_position"'
+                raise ValueError(msg)
+            self._add_incrementally(list(uris))
+            return []
 
         if tracks:
             warnings.warn(
@@ -398,28 +636,90 @@ class TracklistController:
             for uri in uris:
                 tracks.extend(track_map[uri])
 
-        tl_tracks = []
-        max_length = self.core._config["core"]["max_tracklist_length"]
+        return self._add_tracks(list(tracks), at_position)
 
-        for track in tracks:
-            if self.get_length() >= max_length:
-                msg = f"Tracklist may contain at most {max_length:d} tracks."
-                raise exceptions.TracklistFull(msg)
+    def _add_tracks(
+        self,
+        tracks: list[Track],
+        at_position: int | None,
+    ) -> list[TlTrack]:
+        max_length = self.core._config["core"]["max_tracklist_length"]
+        if self.get_length() + len(tracks) > max_length:
+            msg = f"Tracklist may contain at most {max_length:d} tracks."
+            raise exceptions.TracklistFull(msg)
 
-            tl_track = TlTrack(self._next_tlid, track)
-            self._next_tlid = TracklistId(self._next_tlid + 1)
-            if at_position is not None:
-                self._tl_tracks.insert(at_position, tl_track)
-                at_position += 1
-            else:
-                self._tl_tracks.append(tl_track)
-            tl_tracks.append(tl_track)
+        tl_tracks = [
+            TlTrack(TracklistId(self._next_tlid + i), track)
+            for i, track in enumerate(tracks)
+        ]
+        self._next_tlid = TracklistId(self._next_tlid + len(tl_tracks))
+        position = self._insert(tl_tracks, at_position)
 
         if tl_tracks:
+            self._record_change(
+                type="insert",
+                position=position,
+                tlids=tuple(tl_track.tlid for tl_track in tl_tracks),
+            )
             self._increase_version()
 
         return tl_tracks
 
+    def _add_incrementally(self, uris: list[Uri]) -> None:
+        pending = _PendingAdd(uris)
+        actor_ref = self.core.actor_ref
+
+        def on_result(result: dict[Uri, list[Track]]) -> None:
+            # Called from the lookup threads, so the result is handed over to
+            # the core actor's thread, just like events from other actors.
+            with contextlib.suppress(pykka.ActorDeadError):
+                actor_ref.tell(
+                    ProxyCall(
+                        attr_path=("tracklist", "_on_lookup_result"),
+                        args=(pending, result),
+                        kwargs={},
+                    ),
+                )
+
+        self.core.library._lookup_incrementally(uris, on_result)
+
+    def _on_lookup_result(
+        self,
+        pending: _PendingAdd,
+        result: dict[Uri, list[Track]],
+    ) -> None:
+        tracks = pending.update(result)
+        if not tracks:
+            return
+        try:
+            self._add_tracks(tracks, None)
+        except exceptions.TracklistFull as exc:
+            logger.warning("Stopped adding tracks: %s", exc)
+            pending.cancel()
+
+    def _insert(self, tl_tracks: list[TlTrack], at_position: int | None) -> int:
+        if at_position is not None:
+            position, _, _ = slice(at_position, None).indices(len(self._tl_tracks))
+            # A single slice assignment moves the tail of the tracklist once,
+            # instead of once per inserted track.
+            self._tl_tracks[at_position:at_position] = tl_tracks
+            self._invalidate_indexes()
+        else:
+            # Appending doesn't move any existing tracks, so the indexes that
+            # are already built can be extended instead of rebuilt.
+            position = len(self._tl_tracks)
+            self._tl_tracks.extend(tl_tracks)
+            for i, tl_track in enumerate(tl_tracks, start=position):
+                if self._tlid_index is not None:
+                    self._tlid_index[tl_track.tlid] = i
+                for field, index in self._field_indexes.items():
+                    index.setdefault(getattr(tl_track.track, field), []).append(i)
+
+        if self.get_random():
+            self._shuffled.add(tl_tracks)
+
+        return position
+
     def clear(self) -> None:
         """Clear the tracklist.
 
@@ -427,6 +727,9 @@ class TracklistController:
         [tracklist_changed][mopidy.core.CoreListener.tracklist_changed] event.
         """
         self._tl_tracks = []
+        self._invalidate_indexes()
+        self._shuffled.clear()
+        self._record_change(type="clear")
         self._increase_version()
 
     def filter(self, criteria: Query[TracklistField]) -> list[TlTrack]:
@@ -458,12 +761,25 @@ class TracklistController:
         validation.check_query(criteria, validation.TRACKLIST_FIELDS.keys())
         validation.check_instances(tlids, int)
 
-        matches = self._tl_tracks
-        for key, values in criteria.items():
-            matches = [ct for ct in matches if getattr(ct.track, key) in values]
+        positions: set[int] | None = None
         if tlids:
-            matches = [ct for ct in matches if ct.tlid in tlids]
-        return matches
+            tlid_index = self._get_tlid_index()
+            positions = {tlid_index[tlid] for tlid in set(tlids) if tlid in tlid_index}
+        for key, values in criteria.items():
+            field_index = self._get_field_index(key)
+            key_positions = {
+                position
+                for value in set(values)
+                for position in field_index.get(value, ())
+            }
+            if positions is None:
+                positions = key_positions
+            else:
+                positions &= key_positions
+
+        if positions is None:
+            return self._tl_tracks[:]
+        return [self._tl_tracks[position] for position in sorted(positions)]
 
     def move(self, start: int, end: int, to_position: int) -> None:
         """Move the tracks in the slice `[start:end]` to `to_position`.
@@ -498,11 +814,16 @@ class TracklistController:
             msg = "to_position can not be larger than tracklist length"
             raise AssertionError(msg)
 
-        new_tl_tracks = tl_tracks[:start] + tl_tracks[end:]
-        for tl_track in tl_tracks[start:end]:
-            new_tl_tracks.insert(to_position, tl_track)
-            to_position += 1
-        self._tl_tracks = new_tl_tracks
+        moved_tl_tracks = tl_tracks[start:end]
+        del tl_tracks[start:end]
+        tl_tracks[to_position:to_position] = moved_tl_tracks
+        self._invalidate_indexes()
+        self._record_change(
+            type="move",
+            position=start,
+            end=end,
+            to_position=to_position,
+        )
         self._increase_version()
 
     def remove(self, criteria: Query[TracklistField]) -> list[TlTrack]:
@@ -519,9 +840,23 @@ class TracklistController:
             criteria: One or more rules to match by.
         """
         tl_tracks = self.filter(criteria)
-        for tl_track in tl_tracks:
-            position = self._tl_tracks.index(tl_track)
-            del self._tl_tracks[position]
+        if tl_tracks:
+            # Rebuild the list in a single pass instead of looking up and
+            # deleting each removed track one by one.
+            removed_tlids = {tl_track.tlid for tl_track in tl_tracks}
+            self._tl_tracks = [
+                tl_track
+                for tl_track in self._tl_tracks
+                if tl_track.tlid not in removed_tlids
+            ]
+            self._invalidate_indexes()
+            if self.get_random():
+                for tlid in removed_tlids:
+                    self._shuffled.discard(tlid)
+            self._record_change(
+                type="remove",
+                tlids=tuple(tl_track.tlid for tl_track in tl_tracks),
+            )
         self._increase_version()
         return tl_tracks
 
@@ -557,6 +892,17 @@ class TracklistController:
         after = tl_tracks[end or len(tl_tracks) :]
         random.shuffle(shuffled)
         self._tl_tracks = before + shuffled + after
+        self._invalidate_indexes()
+        if shuffled:
+            self._record_change(
+                type="remove",
+                tlids=tuple(tl_track.tlid for tl_track in shuffled),
+            )
+            self._record_change(
+                type="insert",
+                position=len(before),
+                tlids=tuple(tl_track.tlid for tl_track in shuffled),
+            )
         self._increase_version()
 
     def slice(self, start: int, end: int) -> list[TlTrack]:
@@ -571,10 +917,72 @@ class TracklistController:
         # TODO: validate slice?
         return self._tl_tracks[start:end]
 
+    def batch(self, operations: Sequence[Mapping[str, Any]]) -> list[Any]:
+        """Apply multiple tracklist changes as a single change.
+
+        Each operation is a mapping with the name of one of the methods
+        [add][], [clear][], [move][], [remove][], or [shuffle][] as
+        `method`, and optionally a mapping of keyword arguments to the
+        method as `params`.
+
+        The operations are applied in order. If any operation fails, all
+        the changes made by the batch are undone, and the error is raised.
+        Otherwise, the tracklist version is increased once, and the
+        [tracklist_changed][mopidy.core.CoreListener.tracklist_changed] event
+        is triggered once, no matter how many operations the batch contains.
+
+        Returns a list with the return value of each operation.
+
+        Examples:
+            ```python
+            # Moves the last two tracks of a five track tracklist to the
+            # front, and then removes the track with TLID 3
+            batch([
+                {"method": "move", "params": {"start": 3, "end": 5, "to_position": 0}},
+                {"method": "remove", "params": {"criteria": {"tlid": [3]}}},
+            ])
+            ```
+
+        Args:
+            operations: The operations to apply. Since they are validated
+                before any of them is applied, they can't be given as an
+                iterator.
+        """
+        validation.check_instances(operations, Mapping)
+        for operation in operations:
+            validation.check_choice(operation.get("method", ""), BATCH_METHODS)
+            validation.check_instance(operation.get("params", {}), Mapping)
+
+        tl_tracks = self._tl_tracks[:]
+        next_tlid = self._next_tlid
+        shuffled = self._shuffled.copy()
+
+        self._in_batch = True
+        self._batch_modified = False
+        try:
+            results = [
+                getattr(self, operation["method"])(**operation.get("params", {}))
+                for operation in operations
+            ]
+        except Exception:
+            self._tl_tracks = tl_tracks
+            self._invalidate_indexes()
+            self._next_tlid = next_tlid
+            self._shuffled = shuffled
+            self._pending_changes = []
+            raise
+        finally:
+            self._in_batch = False
+
+        if self._batch_modified:
+            self._increase_version()
+
+        return results
+
     def _mark_playing(self, tl_track: TlTrack) -> None:
         """Internal method for [PlaybackController][mopidy.core.PlaybackController]."""
-        if self.get_random() and tl_track in self._shuffled:
-            self._shuffled.remove(tl_track)
+        if self.get_random():
+            self._shuffled.discard(tl_track.tlid)
 
     def _mark_unplayable(self, tl_track: TlTrack | None) -> None:
         """Internal method for [PlaybackController][mopidy.core.PlaybackController]."""
@@ -584,8 +992,8 @@ class TracklistController:
         )
         if self.get_consume() and tl_track is not None:
             self.remove({"tlid": [tl_track.tlid]})
-        if self.get_random() and tl_track in self._shuffled:
-            self._shuffled.remove(tl_track)
+        if self.get_random() and tl_track is not None:
+            self._shuffled.discard(tl_track.tlid)
 
     def _mark_played(self, tl_track: TlTrack | None) -> bool:
         """Internal method for [PlaybackController][mopidy.core.PlaybackController]."""
@@ -594,12 +1002,12 @@ class TracklistController:
             return True
         return False
 
-    def _trigger_tracklist_changed(self) -> None:
-        if self.get_random():
-            self._shuffled = self._tl_tracks[:]
-            random.shuffle(self._shuffled)
-        else:
-            self._shuffled = []
+    def _trigger_tracklist_changed(
+        self,
+        changes: tuple[TracklistChange, ...],
+    ) -> None:
+        logger.debug("Triggering event: tracklist_delta(version=%d)", self._version)
+        CoreListener.send("tracklist_delta", version=self._version, changes=changes)
 
         logger.debug("Triggering event: tracklist_changed()")
         CoreListener.send("tracklist_changed")
@@ -632,6 +1040,15 @@ class TracklistController:
             if "tracklist" in coverage:
                 self._next_tlid = max(TracklistId(state.next_tlid), self._next_tlid)
                 self._tl_tracks = list(state.tl_tracks)
+                self._invalidate_indexes()
+                if self.get_random():
+                    self._shuffled.reset(self._tl_tracks)
+                self._record_change(type="clear")
+                self._record_change(
+                    type="insert",
+                    position=0,
+                    tlids=tuple(tl_track.tlid for tl_track in self._tl_tracks),
+                )
                 self._increase_version()
 
 
@@ -640,6 +1057,7 @@ class TracklistControllerProxy:
     get_tracks = proxy_method(TracklistController.get_tracks)
     get_length = proxy_method(TracklistController.get_length)
     get_version = proxy_method(TracklistController.get_version)
+    get_changes_since = proxy_method(TracklistController.get_changes_since)
     get_consume = proxy_method(TracklistController.get_consume)
     set_consume = proxy_method(TracklistController.set_consume)
     get_random = proxy_method(TracklistController.get_random)
@@ -662,3 +1080,4 @@ class TracklistControllerProxy:
     remove = proxy_method(TracklistController.remove)
     shuffle = proxy_method(TracklistController.shuffle)
     slice = proxy_method(TracklistController.slice)
+    batch = proxy_method(TracklistController.batch)
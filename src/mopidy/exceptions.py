@@ -34,5 +34,9 @@ class TracklistFull(CoreError):  # noqa: N818
     """Raised when the tracklist cannot accept more tracks."""
 
 
+class TracklistVersionMismatch(CoreError):  # noqa: N818
+    """Raised when the tracklist has changed since the version given."""
+
+
 class ValidationError(ValueError):
     """Raised when an API argument fails validation."""
@@ -1,7 +1,7 @@
 from mopidy.models._collections import Playlist, SearchResult
 from mopidy.models._models import Album, Artist, Image, Track
 from mopidy.models._refs import ModelType, Ref
-from mopidy.models._tracklist import TlTrack
+from mopidy.models._tracklist import TlTrack, TracklistChange
 
 __all__ = [
     "Album",
@@ -13,4 +13,5 @@ __all__ = [
     "SearchResult",
     "TlTrack",
     "Track",
+    "TracklistChange",
 ]
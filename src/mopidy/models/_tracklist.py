@@ -2,6 +2,7 @@ from collections.abc import Iterator
 from typing import Any, Literal
 
 from pydantic.fields import Field
+from pydantic.types import NonNegativeInt
 
 from mopidy.models._base import BaseModel
 from mopidy.models._models import Track
@@ -47,3 +48,70 @@ class TlTrack(BaseModel):
 
     def __iter__(self) -> Iterator[TracklistId | Track]:  # pyright: ignore[reportIncompatibleMethodOverride]  # ty:ignore[invalid-method-override]
         return iter((self.tlid, self.track))
+
+    def __eq__(self, other: object) -> bool:
+        # The tracklist compares TlTracks a lot, e.g. when looking for the
+        # current track. As TLIDs are unique within a tracklist, comparing
+        # them first saves comparing the full tracks in most cases.
+        if self is other:
+            return True
+        if not isinstance(other, TlTrack):
+            return NotImplemented
+        return (
+            self.__class__ is other.__class__
+            and self.tlid == other.tlid
+            and (self.track is other.track or self.track == other.track)
+        )
+
+    def __hash__(self) -> int:
+        # Equal TlTracks always have equal TLIDs, so there is no need to hash
+        # the full track.
+        return hash(self.tlid)
+
+
+class TracklistChange(BaseModel):
+    """A single change to the tracklist.
+
+    Changes are emitted with the
+    [tracklist_delta][mopidy.core.CoreListener.tracklist_delta] event and
+    returned by
+    [get_changes_since][mopidy.core.TracklistController.get_changes_since].
+    By applying the changes in order to a copy of the tracklist, a client can
+    keep its copy up to date without fetching the full tracklist again.
+
+    The `type` field decides which of the other fields are used:
+
+    `insert`
+        The tracks with the given `tlids` were inserted at `position`.
+    `remove`
+        The tracks with the given `tlids` were removed.
+    `move`
+        The tracks in the slice `[position:end]` were moved to `to_position`,
+        like [TracklistController.move][mopidy.core.TracklistController.move].
+    `clear`
+        All tracks were removed.
+    """
+
+    model: Literal["TracklistChange"] = Field(
+        default="TracklistChange",
+        repr=False,
+        alias="__model__",
+    )
+
+    version: NonNegativeInt
+    """The tracklist version the change resulted in."""
+
+    type: Literal["insert", "remove", "move", "clear"]
+    """The type of change."""
+
+    position: NonNegativeInt | None = None
+    """The insert position, or the position of the first moved track."""
+
+    end: NonNegativeInt | None = None
+    """The position after the last moved track."""
+
+    to_position: NonNegativeInt | None = None
+    """The new position of the moved tracks."""
+
+    tlids: tuple[TracklistId, ...] = ()
+    """The TLIDs of the inserted or removed tracks."""
@@ -22,6 +22,19 @@ def test_load_raw_config():
             "config_dir": "$XDG_CONFIG_DIR/mopidy",
             "data_dir": "$XDG_DATA_DIR/mopidy",
             "max_tracklist_length": "10000",
+            "lookup_cache_size": "0",
+            "lookup_cache_ttl": "3600",
+            "search_cache_size": "0",
+            "search_cache_ttl": "300",
+            "image_cache_size": "0",
+            "image_cache_ttl": "3600",
+            "distinct_cache_size": "0",
+            "distinct_cache_ttl": "3600",
+            "browse_cache_size": "0",
+            "browse_cache_ttl": "300",
+            "library_timeout": "",
+            "library_backend_timeout": "",
+            "result_validation": "full",
             "restore_state": "false",
         },
         "logging": {
@@ -59,6 +72,19 @@ def test_validate_config():
             "config_dir": str(Path("~/.config/mopidy").expanduser()),
             "data_dir": str(Path("~/.local/share/mopidy").expanduser()),
             "max_tracklist_length": 10000,
+            "lookup_cache_size": 0,
+            "lookup_cache_ttl": 3600,
+            "search_cache_size": 0,
+            "search_cache_ttl": 300,
+            "image_cache_size": 0,
+            "image_cache_ttl": 3600,
+            "distinct_cache_size": 0,
+            "distinct_cache_ttl": 3600,
+            "browse_cache_size": 0,
+            "browse_cache_ttl": 300,
+            "library_timeout": None,
+            "library_backend_timeout": None,
+            "result_validation": "full",
             "restore_state": False,
         },
         "logging": {
@@ -104,6 +130,19 @@ def test_format_config():
         "#config_dir = $XDG_CONFIG_DIR/mopidy",
         "#data_dir = $XDG_DATA_DIR/mopidy",
         "#max_tracklist_length = 10000",
+        "#lookup_cache_size = 0",
+        "#lookup_cache_ttl = 3600",
+        "#search_cache_size = 0",
+        "#search_cache_ttl = 300",
+        "#image_cache_size = 0",
+        "#image_cache_ttl = 3600",
+        "#distinct_cache_size = 0",
+        "#distinct_cache_ttl = 3600",
+        "#browse_cache_size = 0",
+        "#browse_cache_ttl = 300",
+        "#library_timeout = ",
+        "#library_backend_timeout = ",
+        "#result_validation = full",
         "#restore_state = false",
         "",
         "[logging]",
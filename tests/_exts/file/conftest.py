@@ -18,9 +18,10 @@ def follow_symlinks():
 
 
 @pytest.fixture
-def config(media_dirs, follow_symlinks) -> Config:
+def config(media_dirs, follow_symlinks, tmp_path) -> Config:
     return Config(
         {
+            "core": {"cache_dir": str(tmp_path / "cache")},
             "proxy": {},
             "file": {
                 "show_dotfiles": False,
@@ -28,6 +29,7 @@ def config(media_dirs, follow_symlinks) -> Config:
                 "excluded_file_extensions": [".conf"],
                 "follow_symlinks": follow_symlinks,
                 "metadata_timeout": 1000,
+                "watch_media_dirs": False,
             },
         }
     )
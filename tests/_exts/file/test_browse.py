@@ -1,3 +1,6 @@
+import os
+from unittest import mock
+
 import pytest
 
 from mopidy._lib import paths
@@ -67,3 +70,64 @@ def test_media_dirs_whitespace_is_stripped(provider):
     media_dir = provider._media_dirs[0]
     assert media_dir["path"] == path_to_data_dir("")
     assert media_dir["name"] == "My Music"
+
+
+@pytest.fixture
+def media_dir(tmp_path):
+    media_dir = tmp_path / "music"
+    media_dir.mkdir()
+    (media_dir / "a.mp3").touch()
+    return media_dir
+
+
+@pytest.mark.parametrize("media_dirs", [[]])
+def test_browse_reuses_contents_of_unmodified_directory(
+    provider, media_dir, monkeypatch
+):
+    provider._media_dirs = [{"path": media_dir, "name": "Music"}]
+    uri = paths.path_to_uri(media_dir)
+    os.utime(media_dir, ns=(0, 0))
+
+    result = provider.browse(uri)
+    monkeypatch.setattr(provider, "_browse_dir", mock.Mock())
+
+    assert provider.browse(uri) == result
+    provider._browse_dir.assert_not_called()
+
+
+@pytest.mark.parametrize("media_dirs", [[]])
+def test_browse_lists_modified_directory_again(provider, media_dir):
+    provider._media_dirs = [{"path": media_dir, "name": "Music"}]
+    uri = paths.path_to_uri(media_dir)
+    os.utime(media_dir, ns=(0, 0))
+    provider.browse(uri)
+
+    (media_dir / "b.mp3").touch()
+    result = provider.browse(uri)
+
+    assert [ref.name for ref in result] == ["a.mp3", "b.mp3"]
+
+
+@pytest.mark.parametrize("media_dirs", [[]])
+def test_browse_lists_recently_modified_directory_again(
+    provider, media_dir, monkeypatch
+):
+    provider._media_dirs = [{"path": media_dir, "name": "Music"}]
+    uri = paths.path_to_uri(media_dir)
+    provider.browse(uri)
+    monkeypatch.setattr(provider, "_browse_dir", mock.Mock(return_value=[]))
+
+    assert provider.browse(uri) == []
+
+
+@pytest.mark.parametrize("media_dirs", [[]])
+def test_refresh_forgets_contents_of_directory(provider, media_dir, monkeypatch):
+    provider._media_dirs = [{"path": media_dir, "name": "Music"}]
+    uri = paths.path_to_uri(media_dir)
+    os.utime(media_dir, ns=(0, 0))
+    provider.browse(uri)
+
+    provider.refresh(uri)
+    monkeypatch.setattr(provider, "_browse_dir", mock.Mock(return_value=[]))
+
+    assert provider.browse(uri) == []
@@ -0,0 +1,167 @@
+import sqlite3
+
+import pytest
+
+from mopidy._exts.file import index as index_lib
+from mopidy._exts.file.index import LibraryIndex
+from mopidy.models import Album, Artist, Track
+
+TRACK1 = Track(
+    uri="file:///music/a/1.flac",
+    name="Song One",
+    artists=[Artist(name="Artist A")],
+    album=Album(name="Album A", artists=[Artist(name="Various")]),
+    track_no=1,
+    date="2001-02-03",
+)
+TRACK2 = Track(
+    uri="file:///music/b/2.flac",
+    name="Song Two",
+    artists=[Artist(name="Artist B")],
+    genre="Rock",
+    track_no=2,
+    date="2002",
+)
+
+
+@pytest.fixture
+def index():
+    index = LibraryIndex(None)
+    index.add(TRACK1.uri, 1, 10, TRACK1)
+    index.add(TRACK2.uri, 2, 20, TRACK2)
+    index.add("file:///music/b/cover.jpg", 3, 30, None)
+    return index
+
+
+def test_get(index):
+    entry = index.get(TRACK1.uri)
+
+    assert entry == (1, 10, TRACK1)
+
+
+def test_get_unscannable_file(index):
+    assert index.get("file:///music/b/cover.jpg") == (3, 30, None)
+
+
+def test_get_unknown_file(index):
+    assert index.get("file:///music/c/3.flac") is None
+
+
+def test_get_files(index):
+    assert index.get_files("file:///music/b") == {
+        TRACK2.uri: (2, 20),
+        "file:///music/b/cover.jpg": (3, 30),
+    }
+
+
+def test_get_files_does_not_include_siblings_with_same_prefix(index):
+    index.add("file:///music/bb/3.flac", 4, 40, None)
+
+    assert "file:///music/bb/3.flac" not in index.get_files("file:///music/b")
+
+
+def test_add_replaces_file(index):
+    track = TRACK1.replace(name="New Name")
+
+    index.add(TRACK1.uri, 5, 50, track)
+
+    assert index.get(TRACK1.uri) == (5, 50, track)
+    assert index.search({"track_name": ["one"]}) == []
+
+
+def test_remove(index):
+    index.remove([TRACK1.uri])
+
+    assert index.get(TRACK1.uri) is None
+    assert index.search({}) == [TRACK2]
+
+
+def test_search_everything_skips_unscannable_files(index):
+    assert index.search({}) == [TRACK1, TRACK2]
+
+
+@pytest.mark.parametrize(
+    ("query", "exact", "expected"),
+    [
+        ({"track_name": ["song one"]}, False, [TRACK1]),
+        ({"track_name": ["Song"]}, False, [TRACK1, TRACK2]),
+        ({"track_name": ["Song"]}, True, []),
+        ({"track_name": ["Song One"]}, True, [TRACK1]),
+        ({"track": ["two"]}, False, [TRACK2]),
+        ({"artist": ["artist"], "genre": ["rock"]}, False, [TRACK2]),
+        ({"artist": ["Artist A", "Artist B"]}, True, []),
+        ({"albumartist": ["various"]}, False, [TRACK1]),
+        ({"album": ["album a"]}, False, [TRACK1]),
+        ({"track_no": [2]}, False, [TRACK2]),
+        ({"track_no": ["1"]}, True, [TRACK1]),
+        ({"date": ["2001"]}, False, [TRACK1]),
+        ({"date": ["2001"]}, True, []),
+        ({"date": ["02"]}, False, []),
+        ({"any": ["rock"]}, False, [TRACK2]),
+        ({"any": ["a/1"]}, False, [TRACK1]),
+        ({"any": [1]}, False, [TRACK1]),
+        ({"uri": [TRACK2.uri]}, True, [TRACK2]),
+    ],
+)
+def test_search(index, query, exact, expected):
+    assert index.search(query, exact=exact) == expected
+
+
+def test_search_within_uris(index):
+    assert index.search({}, uris=["file:///music/b"]) == [TRACK2]
+    assert index.search({}, uris=["file:///music/a", TRACK2.uri]) == [
+        TRACK1,
+        TRACK2,
+    ]
+    assert index.search({}, uris=[]) == []
+
+
+def test_search_with_limit_and_offset(index):
+    assert index.search({}, limit=1) == [TRACK1]
+    assert index.search({}, limit=1, offset=1) == [TRACK2]
+    assert index.search({}, offset=1) == [TRACK2]
+
+
+def test_get_distinct(index):
+    index.add("file:///music/a/3.flac", 4, 40, TRACK1.replace(uri="file:///3"))
+
+    assert index.get_distinct("artist") == {"Artist A": 2, "Artist B": 1}
+
+
+def test_get_distinct_with_query(index):
+    assert index.get_distinct("track_no", {"genre": ["Rock"]}) == {2: 1}
+
+
+def test_get_distinct_of_track_field(index):
+    assert index.get_distinct("track") == {"Song One": 1, "Song Two": 1}
+
+
+def test_index_is_kept_on_disk(tmp_path):
+    path = tmp_path / "index.sqlite3"
+    index = LibraryIndex(path)
+    index.add(TRACK1.uri, 1, 10, TRACK1)
+    index.commit()
+
+    assert LibraryIndex(path).get(TRACK1.uri) == (1, 10, TRACK1)
+
+
+def test_index_from_other_version_is_rebuilt(tmp_path):
+    path = tmp_path / "index.sqlite3"
+    index = LibraryIndex(path)
+    index.add(TRACK1.uri, 1, 10, TRACK1)
+    index.commit()
+    with sqlite3.connect(path) as connection:
+        connection.execute(f"PRAGMA user_version = {index_lib.SCHEMA_VERSION + 1}")
+
+    assert LibraryIndex(path).get(TRACK1.uri) is None
+
+
+def test_broken_index_is_kept_in_memory(tmp_path, caplog):
+    path = tmp_path / "index.sqlite3"
+    path.write_bytes(b"not a database" * 100)
+
+    index = LibraryIndex(path)
+    index.add(TRACK1.uri, 1, 10, TRACK1)
+
+    assert index.get(TRACK1.uri) == (1, 10, TRACK1)
+    assert "Failed opening library index" in caplog.text
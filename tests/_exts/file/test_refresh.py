@@ -0,0 +1,175 @@
+from unittest import mock
+
+import pytest
+
+from mopidy import exceptions
+from mopidy._lib import paths
+from mopidy.audio import scan
+
+
+@pytest.fixture
+def media_dir(tmp_path):
+    media_dir = tmp_path / "music"
+    (media_dir / "a").mkdir(parents=True)
+    (media_dir / "a" / "1.mp3").write_bytes(b"1")
+    (media_dir / "a" / "2.mp3").write_bytes(b"2")
+    (media_dir / "b.conf").write_bytes(b"excluded")
+    return media_dir
+
+
+@pytest.fixture
+def media_dirs(media_dir):
+    return [str(media_dir)]
+
+
+@pytest.fixture
+def scanner(provider):
+    def scan_file(uri, *args, **kwargs):
+        name = paths.uri_to_path(uri).stem
+        return scan._Result(
+            uri=uri,
+            tags={"title": [f"Song {name}"], "artist": [f"Artist {name}"]},
+            duration=1000,
+            seekable=True,
+            mime="audio/mpeg",
+            playable=True,
+        )
+
+    with mock.patch.object(provider._scanner, "scan", side_effect=scan_file) as scan_:
+        yield scan_
+
+
+def test_refresh_indexes_files(provider, scanner, media_dir):
+    provider.refresh()
+
+    result = provider.search({"track_name": ["song"]})
+    assert [track.name for track in result.tracks] == ["Song 1", "Song 2"]
+    assert scanner.call_count == 2
+
+
+def test_refresh_only_scans_changed_files(provider, scanner, media_dir):
+    provider.refresh()
+    (media_dir / "a" / "2.mp3").write_bytes(b"changed")
+
+    provider.refresh()
+
+    assert scanner.call_count == 3
+    assert scanner.call_args.args[0] == paths.path_to_uri(media_dir / "a" / "2.mp3")
+
+
+def test_refresh_removes_deleted_files(provider, scanner, media_dir):
+    provider.refresh()
+    (media_dir / "a" / "2.mp3").unlink()
+
+    provider.refresh(paths.path_to_uri(media_dir / "a"))
+
+    assert provider.get_distinct("artist") == {"Artist 1"}
+
+
+def test_refresh_outside_media_dirs_does_nothing(provider, scanner, tmp_path):
+    (tmp_path / "3.mp3").write_bytes(b"3")
+
+    provider.refresh(paths.path_to_uri(tmp_path))
+
+    scanner.assert_not_called()
+
+
+def test_lookup_is_answered_from_index(provider, scanner, media_dir):
+    provider.refresh()
+
+    result = provider.lookup(paths.path_to_uri(media_dir / "a" / "1.mp3"))
+
+    assert [track.name for track in result] == ["Song 1"]
+    assert result[0].last_modified is not None
+    assert scanner.call_count == 2
+
+
+def test_lookup_adds_file_to_index(provider, scanner, media_dir):
+    provider.lookup(paths.path_to_uri(media_dir / "a" / "1.mp3"))
+
+    assert provider.get_distinct_counts("artist") == {"Artist 1": 1}
+
+
+def test_lookup_of_unscannable_file_uses_file_name(provider, scanner, media_dir):
+    scanner.side_effect = exceptions.ScannerError("test")
+    uri = paths.path_to_uri(media_dir / "a" / "1.mp3")
+
+    provider.lookup(uri)
+    result = provider.lookup(uri)
+
+    assert [track.name for track in result] == ["1.mp3"]
+    assert scanner.call_count == 1
+    assert provider.search({}).tracks == ()
+
+
+def test_search_with_paging(provider, scanner, media_dir):
+    provider.refresh()
+
+    result = provider.search({}, limit=1, offset=1)
+
+    assert [track.name for track in result.tracks] == ["Song 2"]
+
+
+def test_lookup_many(provider, scanner, media_dir, tmp_path):
+    (tmp_path / "3.mp3").write_bytes(b"3")
+    uris = [
+        paths.path_to_uri(media_dir / "a" / "2.mp3"),
+        paths.path_to_uri(tmp_path / "3.mp3"),
+        paths.path_to_uri(media_dir / "a" / "1.mp3"),
+    ]
+
+    result = provider.lookup_many(uris)
+
+    assert list(result) == uris
+    assert [tracks[0].name for tracks in result.values()] == [
+        "Song 2",
+        "Song 3",
+        "Song 1",
+    ]
+    # Files outside the media dirs are not indexed.
+    assert provider.get_distinct("artist") == {"Artist 1", "Artist 2"}
+
+
+def test_lookup_many_only_scans_files_not_in_index(provider, scanner, media_dir):
+    uri1 = paths.path_to_uri(media_dir / "a" / "1.mp3")
+    uri2 = paths.path_to_uri(media_dir / "a" / "2.mp3")
+    provider.lookup(uri1)
+
+    provider.lookup_many([uri1, uri2, uri2])
+
+    assert sorted(call.args[0] for call in scanner.call_args_list) == [uri1, uri2]
+
+
+def test_update_changed_indexes_added_files(provider, scanner, media_dir):
+    provider.refresh()
+    (media_dir / "c").mkdir()
+    (media_dir / "c" / "3.mp3").write_bytes(b"3")
+
+    with mock.patch("mopidy.backend.BackendListener.send") as send:
+        provider._update_changed({media_dir / "c", media_dir / "c" / "3.mp3"})
+
+    assert scanner.call_count == 3
+    assert provider.get_distinct("artist") == {"Artist 1", "Artist 2", "Artist 3"}
+    send.assert_called_once_with(
+        "library_changed",
+        uri=paths.path_to_uri(media_dir),
+    )
+
+
+def test_update_changed_removes_deleted_files(provider, scanner, media_dir):
+    provider.refresh()
+    (media_dir / "a" / "2.mp3").unlink()
+
+    with mock.patch("mopidy.backend.BackendListener.send"):
+        provider._update_changed({media_dir / "a" / "2.mp3"})
+
+    assert provider.get_distinct("artist") == {"Artist 1"}
+
+
+def test_update_changed_ignores_excluded_files(provider, scanner, media_dir):
+    (media_dir / "c.conf").write_bytes(b"excluded")
+
+    with mock.patch("mopidy.backend.BackendListener.send"):
+        provider._update_changed({media_dir / "c.conf"})
+
+    scanner.assert_not_called()
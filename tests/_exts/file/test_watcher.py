@@ -0,0 +1,104 @@
+import queue
+
+import pytest
+
+from mopidy._exts.file import watcher
+
+
+@pytest.fixture
+def media_dir(tmp_path):
+    media_dir = tmp_path / "music"
+    (media_dir / "a").mkdir(parents=True)
+    (media_dir / ".hidden").mkdir()
+    return media_dir
+
+
+@pytest.fixture(params=["inotify", "polling"])
+def changes(request, media_dir, monkeypatch):
+    monkeypatch.setattr(watcher, "QUIET_PERIOD", 0.1)
+    monkeypatch.setattr(watcher, "POLL_INTERVAL", 0.1)
+    if request.param == "polling":
+
+        def fail():
+            msg = "testing"
+            raise watcher.WatcherError(msg)
+
+        monkeypatch.setattr(watcher, "_Inotify", fail)
+
+    changes = queue.Queue()
+    media_dir_watcher = watcher.MediaDirWatcher([media_dir], changes.put)
+    media_dir_watcher.start()
+    # Give the watcher time to set up its watches before changing anything.
+    with pytest.raises(queue.Empty):
+        changes.get(timeout=0.3)
+    yield changes
+    media_dir_watcher.stop()
+
+
+def get_changed(changes):
+    changed = set()
+    # The changes may be split across notifications when polling.
+    changed |= changes.get(timeout=5)
+    while True:
+        try:
+            changed |= changes.get(timeout=0.5)
+        except queue.Empty:
+            return changed
+
+
+def test_reports_added_file(changes, media_dir):
+    (media_dir / "a" / "1.mp3").write_bytes(b"1")
+
+    changed = get_changed(changes)
+
+    assert changed & {media_dir / "a", media_dir / "a" / "1.mp3"}
+
+
+def test_reports_removed_directory(changes, media_dir):
+    (media_dir / "a").rmdir()
+
+    changed = get_changed(changes)
+
+    assert media_dir / "a" in changed
+
+
+def test_reports_file_in_new_directory(changes, media_dir):
+    (media_dir / "b").mkdir()
+    get_changed(changes)
+
+    (media_dir / "b" / "1.mp3").write_bytes(b"1")
+
+    changed = get_changed(changes)
+
+    assert changed & {media_dir / "b", media_dir / "b" / "1.mp3"}
+
+
+def test_ignores_hidden_directories(changes, media_dir):
+    (media_dir / ".hidden" / "1.mp3").write_bytes(b"1")
+
+    with pytest.raises(queue.Empty):
+        changes.get(timeout=0.5)
+
+
+def test_keeps_watching_if_callback_fails(media_dir, monkeypatch, caplog):
+    monkeypatch.setattr(watcher, "QUIET_PERIOD", 0.1)
+    changes = queue.Queue()
+
+    def on_change(changed):
+        changes.put(changed)
+        msg = "testing"
+        raise RuntimeError(msg)
+
+    media_dir_watcher = watcher.MediaDirWatcher([media_dir], on_change)
+    media_dir_watcher.start()
+    try:
+        with pytest.raises(queue.Empty):
+            changes.get(timeout=0.3)
+        (media_dir / "a" / "1.mp3").write_bytes(b"1")
+        changes.get(timeout=5)
+        (media_dir / "a" / "2.mp3").write_bytes(b"2")
+        changes.get(timeout=5)
+    finally:
+        media_dir_watcher.stop()
+
+    assert "Failed handling changes in media dirs" in caplog.text
@@ -715,3 +715,6 @@ class JsonRpcInspectorTest(JsonRpcTestBase):
 
         assert "core.tracklist.filter" in methods
         assert methods["core.tracklist.filter"].params[0].name == "criteria"
+
+        assert "core.tracklist.batch" in methods
+        assert methods["core.tracklist.batch"].params[0].name == "operations"
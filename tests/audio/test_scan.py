@@ -1,4 +1,6 @@
+import threading
 import unittest
+from unittest import mock
 
 from mopidy import exceptions
 from mopidy._lib.paths import path_to_uri
@@ -120,3 +122,59 @@ class ScannerTest(unittest.TestCase):
     @unittest.SkipTest
     def test_song_without_time_is_handeled(self):
         pass
+
+
+class ScanManyTest(unittest.TestCase):
+    def setUp(self):
+        self.scanner = scan.Scanner()
+        patcher = mock.patch.object(self.scanner, "scan", side_effect=self.fake_scan)
+        self.scan = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.barrier = None
+
+    def fake_scan(self, uri, timeout=None):
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        if uri.startswith("error:"):
+            raise exceptions.ScannerError(uri)
+        return scan._Result(uri, {}, None, False, None, True)
+
+    def test_results_are_returned_for_all_uris(self):
+        results = dict(self.scanner.scan_many(["a:1", "error:2", "a:3"]))
+
+        assert results.keys() == {"a:1", "error:2", "a:3"}
+        assert results["a:1"].uri == "a:1"
+        assert isinstance(results["error:2"], exceptions.ScannerError)
+
+    def test_uris_are_scanned_concurrently(self):
+        # Each scan waits for the others, so this times out if the scans run
+        # one at a time.
+        self.barrier = threading.Barrier(3)
+
+        results = dict(
+            self.scanner.scan_many(["a:1", "a:2", "a:3"], concurrency=3),
+        )
+
+        assert len(results) == 3
+
+    def test_timeout_is_passed_to_each_scan(self):
+        list(self.scanner.scan_many(["a:1", "a:2"], timeout=500))
+
+        self.scan.assert_has_calls(
+            [mock.call("a:1", 500), mock.call("a:2", 500)],
+            any_order=True,
+        )
+
+    def test_uris_are_taken_as_scans_progress(self):
+        taken = []
+
+        def uris():
+            for i in range(10):
+                taken.append(i)
+                yield f"a:{i}"
+
+        results = self.scanner.scan_many(uris(), concurrency=2)
+        next(results)
+        results.close()
+
+        assert len(taken) == 2
@@ -17,3 +17,6 @@ class BackendListenerTest(unittest.TestCase):
 
     def test_listener_has_default_impl_for_playlists_loaded(self):
         self.listener.playlists_loaded()
+
+    def test_listener_has_default_impl_for_library_changed(self):
+        self.listener.library_changed("dummy:")
@@ -0,0 +1,8 @@
+"""Micro-benchmarks of hot paths.
+
+The benchmarks are not collected by pytest. Run them as modules, e.g.:
+
+```sh
+python -m tests.benchmarks.tracklist
+```
+"""
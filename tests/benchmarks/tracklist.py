@@ -0,0 +1,101 @@
+"""Benchmark TlTrack comparisons and reads on the tracklist's hot paths.
+
+Compares `TlTrack` equality with the field by field equality of pydantic
+models, which was used before `TlTrack` got its own `__eq__()`, on a
+tracklist with 10k tracks.
+
+Then compares reading the whole tracklist with reading a page of it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import timeit
+from unittest import mock
+
+import pydantic
+
+from mopidy import core
+from mopidy.models import Album, Artist, TlTrack, Track
+from mopidy.types import TracklistId, Uri
+
+TRACKLIST_LENGTH = 10_000
+
+
+def build_tracks(count: int) -> list[Track]:
+    artists = frozenset(
+        {Artist(uri=Uri("dummy:artist:1"), name="Artist", sortname="Artist, The")},
+    )
+    return [
+        Track(
+            uri=Uri(f"dummy:track:{i}"),
+            name=f"Track {i}",
+            artists=artists,
+            album=Album(
+                uri=Uri(f"dummy:album:{i // 10}"),
+                name=f"Album {i // 10}",
+                artists=artists,
+            ),
+            track_no=i % 10 + 1,
+            length=180_000,
+        )
+        for i in range(count)
+    ]
+
+
+def run(name: str, stmt: object, number: int) -> None:
+    seconds = timeit.timeit(stmt, number=number)  # pyright: ignore[reportArgumentType]
+    print(f"{name:<50} {seconds / number * 1e6:>12.1f} µs")  # noqa: T201
+
+
+def main() -> None:
+    tracks = build_tracks(TRACKLIST_LENGTH)
+    tl_tracks = [
+        TlTrack(TracklistId(i), track) for i, track in enumerate(tracks, start=1)
+    ]
+    # A copy of the last track, as it arrives from a client or from the
+    # stored state, is equal to, but not the same object as, the one in the
+    # tracklist.
+    last = TlTrack(tl_tracks[-1].tlid, tl_tracks[-1].track.replace())
+
+    for label, patch in [
+        (
+            "pydantic __eq__",
+            mock.patch.object(TlTrack, "__eq__", pydantic.BaseModel.__eq__),
+        ),
+        ("TlTrack.__eq__", contextlib.nullcontext()),
+    ]:
+        with patch:
+            run(f"list.index() of last, {label}", lambda: tl_tracks.index(last), 20)
+            run(f"'in' test of last, {label}", lambda: last in tl_tracks, 20)
+
+    core_ = core.Core({"core": {"max_tracklist_length": 20_000}}, backends=[])
+    with mock.patch("warnings.warn"):
+        core_.tracklist.add(tracks=tracks)
+    core_.tracklist.set_random(True)
+    current = core_.tracklist.get_tl_tracks()[-1]
+    core_.playback._set_current_tl_track(current)
+
+    run("TracklistController.index()", lambda: core_.tracklist.index(current), 1000)
+    run(
+        "TracklistController._mark_playing()",
+        lambda: core_.tracklist._mark_playing(current),
+        1000,
+    )
+    run(
+        "PlaybackController._on_tracklist_change()",
+        core_.playback._on_tracklist_change,
+        1000,
+    )
+
+    run("TracklistController.get_tl_tracks()", core_.tracklist.get_tl_tracks, 1000)
+    run(
+        "TracklistController.get_tl_tracks(), 100 tracks",
+        lambda: core_.tracklist.get_tl_tracks(offset=5000, limit=100),
+        1000,
+    )
+    run("TracklistController.get_tracks()", core_.tracklist.get_tracks, 1000)
+
+
+if __name__ == "__main__":
+    main()
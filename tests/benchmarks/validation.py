@@ -0,0 +1,56 @@
+"""Benchmark the validation of large library results.
+
+Compares the `full`, `sampled`, and `off` levels of the `core/result_validation`
+config on a lookup returning 50k tracks, both for the item checks alone and for
+a complete `LibraryController.lookup()` call.
+"""
+
+from __future__ import annotations
+
+from unittest import mock
+
+from mopidy import backend, core
+from mopidy.core import _validation as validation
+from mopidy.models import Track
+from mopidy.types import Uri
+from tests.benchmarks.tracklist import build_tracks, run
+
+LOOKUP_LENGTH = 50_000
+
+
+def create_core(result_validation: str, tracks: list[Track]) -> core.Core:
+    backend_proxy = mock.Mock()
+    backend_proxy.uri_schemes.get.return_value = ["dummy"]
+    # Pretend to be a built-in backend, so that "off" applies.
+    backend_proxy.actor_ref.actor_class.__module__ = "mopidy._exts.dummy"
+    backend_proxy.library = mock.Mock(spec=backend.LibraryProvider)
+    backend_proxy.library.lookup_many.return_value.get.return_value = {
+        Uri("dummy:playlist"): tracks,
+    }
+    return core.Core(
+        {"core": {"result_validation": result_validation}},
+        backends=[backend_proxy],
+    )
+
+
+def main() -> None:
+    tracks = build_tracks(LOOKUP_LENGTH)
+
+    for level in ("full", "sampled", "off"):
+        run(
+            f"check_instances() of {LOOKUP_LENGTH} tracks, {level}",
+            lambda level=level: validation.check_instances(tracks, Track, level=level),
+            100,
+        )
+
+    for level in ("full", "sampled", "off"):
+        core_ = create_core(level, tracks)
+        run(
+            f"LibraryController.lookup() of {LOOKUP_LENGTH} tracks, {level}",
+            lambda core_=core_: core_.library.lookup([Uri("dummy:playlist")]),
+            100,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+from unittest import mock
+
+import pykka
+
+from mopidy.core._cache import Cache, InFlight
+
+
+def test_get_returns_none_for_missing_key():
+    cache = Cache[str, int](max_size=2)
+
+    assert cache.get("a") is None
+    assert cache.get_stats() == {"size": 0, "hits": 0, "misses": 1}
+
+
+def test_get_returns_stored_value():
+    cache = Cache[str, int](max_size=2)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get_stats() == {"size": 1, "hits": 1, "misses": 0}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = Cache[str, int](max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_entry_expires_after_ttl():
+    clock = mock.Mock(return_value=100)
+    cache = Cache[str, int](max_size=2, clock=clock)
+    cache.set("a", 1, ttl=10)
+
+    clock.return_value = 109
+    assert cache.get("a") == 1
+
+    clock.return_value = 110
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_nothing_is_stored_with_zero_size_or_ttl():
+    cache = Cache[str, int](max_size=0)
+    cache.set("a", 1)
+    assert len(cache) == 0
+
+    cache = Cache[str, int](max_size=2)
+    cache.set("a", 1, ttl=0)
+    assert len(cache) == 0
+
+
+def test_peek_does_not_count_as_hit():
+    cache = Cache[str, int](max_size=2)
+    cache.set("a", 1)
+
+    assert cache.peek("a") == 1
+    assert cache.get_stats() == {"size": 1, "hits": 0, "misses": 0}
+
+
+def test_discard_if():
+    cache = Cache[str, int](max_size=3)
+    cache.set("a:1", 1)
+    cache.set("a:2", 2)
+    cache.set("b:1", 3)
+
+    cache.discard_if(lambda key, _: key.startswith("a:"))
+
+    assert cache.get("a:1") is None
+    assert cache.get("a:2") is None
+    assert cache.get("b:1") == 3
+
+
+def test_identical_calls_in_flight_share_future():
+    in_flight = InFlight[str]()
+    func = mock.Mock(side_effect=pykka.ThreadingFuture)
+
+    future1 = in_flight.call("a", func)
+    future2 = in_flight.call("a", func)
+
+    assert future1 is future2
+    func.assert_called_once_with()
+    assert in_flight.get_stats() == {"size": 1, "hits": 1, "misses": 1}
+
+
+def test_different_calls_in_flight_do_not_share_future():
+    in_flight = InFlight[str]()
+    func = mock.Mock(side_effect=pykka.ThreadingFuture)
+
+    assert in_flight.call("a", func) is not in_flight.call("b", func)
+    assert func.call_count == 2
+
+
+def test_completed_calls_are_not_shared():
+    in_flight = InFlight[str]()
+    func = mock.Mock(side_effect=pykka.ThreadingFuture)
+    future1 = in_flight.call("a", func)
+    future1.set(1)
+
+    future2 = in_flight.call("a", func)
+
+    assert future2 is not future1
+    assert func.call_count == 2
+
+
+def test_failed_calls_are_not_shared():
+    in_flight = InFlight[str]()
+    func = mock.Mock(side_effect=pykka.ThreadingFuture)
+    future1 = in_flight.call("a", func)
+    future1.set_exception(exc_info=(RuntimeError, RuntimeError("Failed"), None))
+
+    assert in_flight.call("a", func) is not future1
+    assert len(in_flight) == 1
@@ -1,11 +1,13 @@
+import threading
 import unittest
 from unittest import mock
 
+import pykka
 import pytest
 
 from mopidy import backend, core
 from mopidy.core import _validation as validation
-from mopidy.models import Image, Ref, SearchResult, Track
+from mopidy.models import Artist, Image, Ref, SearchResult, Track
 
 
 class BaseCoreLibraryTest(unittest.TestCase):
@@ -448,6 +450,760 @@ class GetDistinctTest(BaseCoreLibraryTest):
         logger_mock.error.assert_called()
 
 
+class GetDistinctCountsTest(BaseCoreLibraryTest):
+    def test_combines_counts_from_all_backends(self):
+        self.library1.get_distinct_counts.return_value.get.return_value = {
+            "foo": 2,
+            "bar": 1,
+        }
+        self.library2.get_distinct_counts.return_value.get.return_value = {"foo": 3}
+
+        result = self.core.library.get_distinct("artist", counts=True)
+
+        assert result == {"foo": 5, "bar": 1}
+        self.library1.get_distinct_counts.assert_called_with("artist", None)
+        self.library1.get_distinct.assert_not_called()
+
+    def test_values_from_backend_without_counts_have_unknown_count(self):
+        self.library1.get_distinct_counts.return_value.get.return_value = {
+            "foo": 2,
+            "bar": 1,
+        }
+        self.library2.get_distinct_counts.return_value.get.return_value = None
+        self.library2.get_distinct.return_value.get.return_value = {"foo", "baz"}
+
+        result = self.core.library.get_distinct(
+            "artist",
+            {"genre": ["rock"]},
+            counts=True,
+        )
+
+        assert result == {"foo": None, "bar": 1, "baz": None}
+        self.library2.get_distinct.assert_called_with("artist", {"genre": ["rock"]})
+
+    @mock.patch.object(core._library, "logger")
+    def test_ignores_negative_counts(self, logger):
+        self.library1.get_distinct_counts.return_value.get.return_value = {"a": -1}
+        self.library2.get_distinct_counts.return_value.get.return_value = {"b": 1}
+
+        result = self.core.library.get_distinct("artist", counts=True)
+
+        assert result == {"b": 1}
+        logger.error.assert_called_once()
+
+
+class CacheTestMixin:
+    """Tests shared by the library caches, with backend 2 opting out."""
+
+    cache: str
+    cache_size = 10
+
+    def setUp(self):
+        super().setUp()
+        getattr(self.library1, f"{self.cache}_cache_ttl").get.return_value = None
+        getattr(self.library2, f"{self.cache}_cache_ttl").get.return_value = 0
+
+        self.core = core.Core(
+            config={
+                "core": {
+                    f"{self.cache}_cache_size": self.cache_size,
+                    f"{self.cache}_cache_ttl": 60,
+                },
+            },
+            mixer=None,
+            backends=[self.backend1, self.backend2, self.backend3],
+        )
+        self.clock = mock.Mock(return_value=1000)
+        getattr(self.core.library, f"_{self.cache}_cache")._clock = self.clock
+
+    def call(self, scheme):
+        raise NotImplementedError
+
+    def get_backend_method(self, library):
+        raise NotImplementedError
+
+    def test_results_are_cached(self):
+        self.call("dummy1")
+        self.call("dummy1")
+
+        assert self.get_backend_method(self.library1).call_count == 1
+        assert self.core.library.get_cache_stats()[self.cache]["hits"] == 1
+
+    def test_results_with_backend_opting_out_are_not_cached(self):
+        self.call("dummy2")
+        self.call("dummy2")
+
+        assert self.get_backend_method(self.library2).call_count == 2
+
+    def test_backend_ttl_is_read_once_when_core_starts(self):
+        ttl = getattr(self.library1, f"{self.cache}_cache_ttl")
+        ttl.get.return_value = 0
+
+        self.call("dummy1")
+        self.call("dummy1")
+
+        assert self.get_backend_method(self.library1).call_count == 1
+        assert ttl.get.call_count == 1
+
+    @mock.patch.object(core._library, "logger")
+    def test_invalid_backend_ttl_falls_back_to_config_value(self, logger):
+        getattr(self.library1, f"{self.cache}_cache_ttl").get.return_value = -1
+        self.core = core.Core(
+            config={
+                "core": {
+                    f"{self.cache}_cache_size": self.cache_size,
+                    f"{self.cache}_cache_ttl": 60,
+                },
+            },
+            mixer=None,
+            backends=[self.backend1, self.backend2, self.backend3],
+        )
+
+        self.call("dummy1")
+        self.call("dummy1")
+
+        assert self.get_backend_method(self.library1).call_count == 1
+        logger.error.assert_called_once()
+
+    def test_results_expire_after_ttl(self):
+        self.call("dummy1")
+        self.clock.return_value = 1059
+        self.call("dummy1")
+        assert self.get_backend_method(self.library1).call_count == 1
+
+        self.clock.return_value = 1060
+        self.call("dummy1")
+        assert self.get_backend_method(self.library1).call_count == 2
+
+    @mock.patch.object(core._library, "logger")
+    def test_results_from_failing_backend_are_not_cached(self, logger):
+        self.get_backend_method(self.library1).return_value.get.side_effect = Exception
+
+        self.call("dummy1")
+        self.call("dummy1")
+
+        assert self.get_backend_method(self.library1).call_count == 2
+
+    def test_refresh_invalidates_results_of_refreshed_backend(self):
+        self.call("dummy1")
+
+        self.core.library.refresh("dummy1:")
+        self.call("dummy1")
+
+        assert self.get_backend_method(self.library1).call_count == 2
+
+    def test_library_changed_invalidates_results_of_changed_backend(self):
+        self.call("dummy1")
+
+        self.core.library_changed("dummy2:")
+        self.call("dummy1")
+        assert self.get_backend_method(self.library1).call_count == 1
+
+        self.core.library_changed("dummy1:")
+        self.call("dummy1")
+        assert self.get_backend_method(self.library1).call_count == 2
+
+
+class BrowseCacheTest(CacheTestMixin, BaseCoreLibraryTest):
+    cache = "browse"
+
+    def setUp(self):
+        super().setUp()
+        self.refs = [Ref.track(uri="dummy1:track:/foo", name="foo")]
+        self.library1.browse.return_value.get.return_value = self.refs
+        self.library2.browse.return_value.get.return_value = []
+
+    def call(self, scheme):
+        return self.core.library.browse(f"{scheme}:directory:/")
+
+    def get_backend_method(self, library):
+        return library.browse
+
+    def test_cached_browse_results_are_copies(self):
+        self.core.library.browse("dummy1:directory:/")
+        self.core.library.browse("dummy1:directory:/").clear()
+
+        assert self.core.library.browse("dummy1:directory:/") == self.refs
+
+    def test_refresh_invalidates_all_cached_directories_of_backend(self):
+        self.core.library.browse("dummy1:directory:/")
+        self.core.library.browse("dummy1:directory:/foo")
+        self.core.library.browse("dummy1:directory:/foo/bar")
+
+        self.core.library.refresh("dummy1:directory:/foo")
+        self.core.library.browse("dummy1:directory:/")
+        self.core.library.browse("dummy1:directory:/foo")
+        self.core.library.browse("dummy1:directory:/foo/bar")
+
+        assert self.library1.browse.call_count == 6
+
+    def test_library_changed_invalidates_parent_directory(self):
+        self.core.library.browse("dummy1:directory:/")
+
+        self.core.library_changed("dummy1:directory:/foo/new.mp3")
+        self.core.library.browse("dummy1:directory:/")
+
+        assert self.library1.browse.call_count == 2
+
+    def test_root_directories_are_cached(self):
+        self.core.library.browse(None)
+        result = self.core.library.browse(None)
+
+        assert result == [
+            Ref.directory(uri="dummy1:directory", name="dummy1"),
+            Ref.directory(uri="dummy2:directory", name="dummy2"),
+        ]
+        assert self.library1.root_directory.get.call_count == 1
+        assert self.library2.root_directory.get.call_count == 1
+
+    def test_refresh_of_everything_invalidates_root_directories(self):
+        self.core.library.browse(None)
+
+        self.core.library.refresh()
+        self.core.library.browse(None)
+
+        assert self.library1.root_directory.get.call_count == 2
+
+
+class LookupCacheTest(CacheTestMixin, BaseCoreLibraryTest):
+    cache = "lookup"
+
+    def setUp(self):
+        super().setUp()
+        self.track1 = Track(uri="dummy1:a", name="abc", last_modified=1)
+        self.library1.lookup_many.return_value.get.return_value = {
+            "dummy1:a": [self.track1],
+        }
+        self.library2.lookup_many.return_value.get.return_value = {
+            "dummy2:a": [Track(uri="dummy2:a")],
+        }
+
+    def call(self, scheme):
+        return self.core.library.lookup(uris=[f"{scheme}:a"])
+
+    def get_backend_method(self, library):
+        return library.lookup_many
+
+    def test_lookup_only_asks_backends_for_uncached_uris(self):
+        track2 = Track(uri="dummy1:b")
+        self.core.library.lookup(uris=["dummy1:a"])
+        self.library1.lookup_many.return_value.get.return_value = {
+            "dummy1:b": [track2],
+        }
+
+        result = self.core.library.lookup(uris=["dummy1:a", "dummy1:b"])
+
+        assert result == {"dummy1:a": [self.track1], "dummy1:b": [track2]}
+        self.library1.lookup_many.assert_called_with(["dummy1:b"])
+
+    def test_lookup_without_tracks_is_not_cached(self):
+        self.library1.lookup_many.return_value.get.return_value = {"dummy1:x": []}
+
+        self.core.library.lookup(uris=["dummy1:x"])
+        self.core.library.lookup(uris=["dummy1:x"])
+
+        assert self.library1.lookup_many.call_count == 2
+
+    def test_refresh_of_other_uri_keeps_cached_lookups(self):
+        self.core.library.lookup(uris=["dummy1:a"])
+
+        self.core.library.refresh("dummy1:b")
+        self.core.library.lookup(uris=["dummy1:a"])
+
+        self.library1.lookup_many.assert_called_once_with(["dummy1:a"])
+
+    def test_newer_track_from_search_invalidates_lookup(self):
+        self.core.library.lookup(uris=["dummy1:a"])
+        self.library1.search.return_value.get.return_value = SearchResult(
+            tracks=[self.track1.replace(last_modified=2)],
+        )
+        self.library2.search.return_value.get.return_value = None
+
+        self.core.library.search({"any": ["abc"]})
+        self.core.library.lookup(uris=["dummy1:a"])
+
+        assert self.library1.lookup_many.call_count == 2
+
+
+class ImageCacheTest(CacheTestMixin, BaseCoreLibraryTest):
+    cache = "image"
+
+    def setUp(self):
+        super().setUp()
+        self.image = Image(uri="http://example.com/a.jpg")
+        self.library1.get_images.return_value.get.return_value = {
+            "dummy1:a": [self.image],
+        }
+
+    def call(self, scheme):
+        return self.core.library.get_images([f"{scheme}:a"])
+
+    def get_backend_method(self, library):
+        return library.get_images
+
+    def test_only_uncached_uris_are_sent_to_backends(self):
+        self.core.library.get_images(["dummy1:a"])
+        self.library1.get_images.return_value.get.return_value = {"dummy1:b": []}
+
+        result = self.core.library.get_images(["dummy1:a", "dummy1:b"])
+
+        assert result == {"dummy1:a": (self.image,), "dummy1:b": ()}
+        self.library1.get_images.assert_called_with(["dummy1:b"])
+
+    def test_uris_without_images_are_cached(self):
+        self.library1.get_images.return_value.get.return_value = {}
+
+        self.core.library.get_images(["dummy1:b"])
+        result = self.core.library.get_images(["dummy1:b"])
+
+        assert result == {"dummy1:b": ()}
+        self.library1.get_images.assert_called_once_with(["dummy1:b"])
+
+
+class DistinctCacheTest(CacheTestMixin, BaseCoreLibraryTest):
+    cache = "distinct"
+
+    def setUp(self):
+        super().setUp()
+        self.library1.get_distinct.return_value.get.return_value = {"foo"}
+        self.library2.get_distinct.return_value.get.return_value = {"bar"}
+
+    def call(self, scheme):
+        # All backends are asked for distinct values.
+        return self.core.library.get_distinct("artist", {"album": ["x"]})
+
+    def get_backend_method(self, library):
+        return library.get_distinct
+
+    def test_cache_key_includes_field_and_query(self):
+        self.core.library.get_distinct("artist")
+        self.core.library.get_distinct("album")
+        self.core.library.get_distinct("artist", {"album": ["x"]})
+
+        assert self.library1.get_distinct.call_count == 3
+
+    def test_counts_are_cached_separately(self):
+        self.library1.get_distinct_counts.return_value.get.return_value = {"foo": 1}
+        self.core.library.get_distinct("artist")
+
+        self.core.library.get_distinct("artist", counts=True)
+        self.core.library.get_distinct("artist", counts=True)
+
+        self.library1.get_distinct_counts.assert_called_once_with("artist", None)
+
+
+class SearchCacheTest(CacheTestMixin, BaseCoreLibraryTest):
+    cache = "search"
+    cache_size = 1
+
+    def setUp(self):
+        super().setUp()
+        self.result1 = SearchResult(tracks=[Track(uri="dummy1:a")])
+        self.result2 = SearchResult(tracks=[Track(uri="dummy2:a")])
+        self.library1.search.return_value.get.return_value = self.result1
+        self.library2.search.return_value.get.return_value = self.result2
+
+    def call(self, scheme):
+        # All backends are searched.
+        return self.core.library.search({"any": ["a"]})
+
+    def get_backend_method(self, library):
+        return library.search
+
+    def test_search_cache_key_is_normalized(self):
+        self.core.library.search({"artist": ["x", "y"], "album": ["z"]})
+        self.core.library.search({"album": ["z"], "artist": ["y", "x", "x"]})
+
+        assert self.library1.search.call_count == 1
+
+    def test_search_cache_key_includes_uris_and_exact(self):
+        self.core.library.search({"any": ["a"]})
+        self.core.library.search({"any": ["a"]}, exact=True)
+        self.core.library.search({"any": ["a"]}, uris=["dummy1:"])
+
+        assert self.library1.search.call_count == 3
+
+    def test_results_over_the_memory_budget_are_not_cached(self):
+        self.library1.search.return_value.get.return_value = SearchResult(
+            tracks=[Track(uri=f"dummy1:{i}", name="x" * 1000) for i in range(2000)],
+        )
+
+        self.core.library.search({"any": ["a"]})
+        self.core.library.search({"any": ["a"]})
+
+        assert self.library1.search.call_count == 2
+
+
+class ResultValidationTest(BaseCoreLibraryTest):
+    def setUp(self):
+        super().setUp()
+        # Every second track is invalid, so sampling catches it too.
+        self.library1.lookup_many.return_value.get.return_value = {
+            "dummy1:a": [Track(uri="dummy1:a"), "not a track"] * 100,
+        }
+
+    def _create_core(self, result_validation):
+        return core.Core(
+            config={"core": {"result_validation": result_validation}},
+            mixer=None,
+            backends=[self.backend1, self.backend2, self.backend3],
+        )
+
+    @mock.patch.object(core._library, "logger")
+    def test_full_validation_rejects_bad_results(self, logger):
+        self.core = self._create_core("full")
+
+        assert self.core.library.lookup(["dummy1:a"]) == {"dummy1:a": []}
+        logger.error.assert_called_once()
+
+    @mock.patch.object(core._library, "logger")
+    def test_off_still_checks_results_of_other_backends(self, logger):
+        self.core = self._create_core("off")
+
+        assert self.core.library.lookup(["dummy1:a"]) == {"dummy1:a": []}
+        logger.error.assert_called_once()
+
+    def test_off_skips_checks_of_built_in_backends(self):
+        self.backend1.actor_ref.actor_class.__module__ = "mopidy._exts.file.backend"
+        self.core = self._create_core("off")
+
+        result = self.core.library.lookup(["dummy1:a"])
+
+        assert len(result["dummy1:a"]) == 200
+
+
+class SearchPagingTest(BaseCoreLibraryTest):
+    def setUp(self):
+        super().setUp()
+        self.tracks1 = [Track(uri=f"dummy1:{i}") for i in range(3)]
+        self.tracks2 = [Track(uri="dummy2:0")]
+        self.library1.search.return_value.get.return_value = SearchResult(
+            tracks=self.tracks1,
+            artists=[Artist(name="a")],
+        )
+        self.library2.search.return_value.get.return_value = SearchResult(
+            tracks=self.tracks2,
+        )
+        self.library1.search_paging.get.return_value = False
+        self.library2.search_paging.get.return_value = False
+
+    def _create_core(self, **core_config):
+        return core.Core(
+            config={"core": core_config},
+            mixer=None,
+            backends=[self.backend1, self.backend2, self.backend3],
+        )
+
+    def test_first_page_merges_best_matches_of_each_backend(self):
+        result = self.core.library.search({"any": ["a"]}, limit=2)
+
+        assert result == [
+            SearchResult(tracks=self.tracks1[:1], artists=[Artist(name="a")]),
+            SearchResult(tracks=self.tracks2),
+        ]
+
+    def test_next_page_continues_after_offset(self):
+        result = self.core.library.search({"any": ["a"]}, limit=2, offset=2)
+
+        assert result == [
+            SearchResult(tracks=self.tracks1[1:]),
+            SearchResult(),
+        ]
+
+    def test_backends_supporting_paging_get_results_up_to_end_of_page(self):
+        self.library1.search_paging.get.return_value = True
+        self.core = self._create_core()
+
+        self.core.library.search({"any": ["a"]}, limit=2, offset=2)
+
+        self.library1.search.assert_called_once_with(
+            query={"any": ["a"]},
+            uris=None,
+            exact=False,
+            limit=4,
+            offset=0,
+        )
+        self.library2.search.assert_called_once_with(
+            query={"any": ["a"]},
+            uris=None,
+            exact=False,
+        )
+
+    def test_single_backend_supporting_paging_gets_limit_and_offset(self):
+        self.library1.search_paging.get.return_value = True
+        self.library1.search.return_value.get.return_value = SearchResult(
+            tracks=self.tracks1,
+        )
+        self.core = self._create_core()
+
+        result = self.core.library.search(
+            {"any": ["a"]},
+            uris=["dummy1:"],
+            limit=2,
+            offset=4,
+        )
+
+        self.library1.search.assert_called_once_with(
+            query={"any": ["a"]},
+            uris=["dummy1:"],
+            exact=False,
+            limit=2,
+            offset=4,
+        )
+        assert result == [SearchResult(tracks=self.tracks1[:2])]
+
+    def test_pages_are_picked_from_cached_results(self):
+        self.library1.search_cache_ttl.get.return_value = None
+        self.library2.search_cache_ttl.get.return_value = None
+        self.core = self._create_core(search_cache_size=1, search_cache_ttl=60)
+
+        self.core.library.search({"any": ["a"]}, limit=2)
+        self.core.library.search({"any": ["a"]}, limit=2, offset=2)
+
+        assert self.library1.search.call_count == 1
+
+    def test_paging_support_is_read_once_when_core_starts(self):
+        self.library1.search_paging.get.return_value = True
+
+        self.core.library.search({"any": ["a"]}, uris=["dummy1:"], limit=2)
+        self.core.library.search({"any": ["a"]}, uris=["dummy1:"], limit=2)
+
+        assert self.library1.search.call_args_list == [
+            mock.call(query={"any": ["a"]}, uris=["dummy1:"], exact=False),
+            mock.call(query={"any": ["a"]}, uris=["dummy1:"], exact=False),
+        ]
+        assert self.library1.search_paging.get.call_count == 1
+
+    def test_invalid_limit_or_offset_raises_valueerror(self):
+        with pytest.raises(ValueError):
+            self.core.library.search({"any": ["a"]}, limit=0)
+        with pytest.raises(ValueError):
+            self.core.library.search({"any": ["a"]}, limit=1, offset=-1)
+
+
+@mock.patch.object(core._library, "logger")
+class LibraryTimeoutTest(BaseCoreLibraryTest):
+    def setUp(self):
+        super().setUp()
+        self.library1.search.return_value = pykka.ThreadingFuture()
+        self.library1.lookup_many.return_value = pykka.ThreadingFuture()
+        self.result2 = SearchResult(tracks=[Track(uri="dummy2:a")])
+        self.library2.search.return_value.get.return_value = self.result2
+
+    def _create_core(self, **core_config):
+        return core.Core(
+            config={"core": core_config},
+            mixer=None,
+            backends=[self.backend1, self.backend2, self.backend3],
+        )
+
+    def test_search_returns_results_of_backends_answering_before_deadline(
+        self,
+        logger,
+    ):
+        self.core = self._create_core(library_timeout=0.01)
+
+        result = self.core.library.search({"any": ["a"]})
+
+        assert result == [self.result2]
+        logger.warning.assert_called_once_with(
+            mock.ANY,
+            "DummyBackend1",
+            1,
+        )
+
+    def test_lookup_returns_results_of_backends_answering_before_deadline(
+        self,
+        logger,
+    ):
+        track = Track(uri="dummy2:a")
+        self.library2.lookup_many.return_value.get.return_value = {
+            "dummy2:a": [track],
+        }
+        self.core = self._create_core(library_timeout=0.01)
+
+        result = self.core.library.lookup(uris=["dummy1:a", "dummy2:a"])
+
+        assert result == {"dummy1:a": [], "dummy2:a": [track]}
+
+    def test_backend_timeout_applies_to_each_backend(self, logger):
+        self.core = self._create_core(library_backend_timeout=0.01)
+
+        result = self.core.library.search({"any": ["a"]})
+
+        assert result == [self.result2]
+        assert logger.warning.call_count == 1
+
+    def test_timeouts_are_counted_per_backend(self, logger):
+        self.core = self._create_core(library_timeout=0.01)
+
+        self.core.library.search({"any": ["a"]})
+        self.core.library.search({"any": ["b"]})
+
+        assert logger.warning.call_args == mock.call(mock.ANY, "DummyBackend1", 2)
+
+    def test_results_are_cached_after_deadline_has_passed(self, logger):
+        track = Track(uri="dummy1:a")
+        self.library1.lookup_many.return_value = pykka.ThreadingFuture()
+        self.library1.lookup_many.return_value.set({"dummy1:a": [track]})
+        self.library1.lookup_cache_ttl.get.return_value = None
+        self.core = self._create_core(library_timeout=0, lookup_cache_size=10)
+
+        assert self.core.library.lookup(["dummy1:a"]) == {"dummy1:a": [track]}
+        self.core.library.lookup(["dummy1:a"])
+
+        assert self.library1.lookup_many.call_count == 1
+
+
+@mock.patch.object(core._library, "logger")
+class InFlightTest(BaseCoreLibraryTest):
+    def setUp(self):
+        super().setUp()
+        self.future = pykka.ThreadingFuture()
+        self.library1.lookup_many.return_value = self.future
+        self.library1.get_images.return_value = self.future
+        self.library1.browse.return_value = self.future
+        self.backend1.has_library_browse.return_value.get.return_value = True
+
+        self.core = core.Core(
+            config={"core": {"library_timeout": 0.01}},
+            mixer=None,
+            backends=[self.backend1, self.backend2, self.backend3],
+        )
+
+    def test_lookup_shares_backend_call_in_flight(self, logger):
+        self.core.library.lookup(["dummy1:a"])
+        self.core.library.lookup(["dummy1:a"])
+
+        self.library1.lookup_many.assert_called_once_with(["dummy1:a"])
+        assert self.core.library.get_cache_stats()["in_flight"] == {
+            "size": 1,
+            "hits": 1,
+            "misses": 1,
+        }
+
+    def test_completed_backend_call_is_not_shared(self, logger):
+        track = Track(uri="dummy1:a")
+        self.core.library.lookup(["dummy1:a"])
+        self.future.set({"dummy1:a": [track]})
+
+        result = self.core.library.lookup(["dummy1:a"])
+
+        assert result == {"dummy1:a": [track]}
+        assert self.library1.lookup_many.call_count == 2
+
+    def test_lookups_of_different_uris_are_not_shared(self, logger):
+        self.core.library.lookup(["dummy1:a"])
+        self.core.library.lookup(["dummy1:b"])
+
+        assert self.library1.lookup_many.call_count == 2
+
+    def test_get_images_shares_backend_call_in_flight(self, logger):
+        self.core.library.get_images(["dummy1:a"])
+        self.core.library.get_images(["dummy1:a"])
+
+        self.library1.get_images.assert_called_once_with(["dummy1:a"])
+
+    def test_browse_shares_backend_call_in_flight(self, logger):
+        self.core.library.browse("dummy1:directory")
+        self.core.library.browse("dummy1:directory")
+
+        self.library1.browse.assert_called_once_with("dummy1:directory")
+
+
+class StartSearchTest(BaseCoreLibraryTest):
+    def setUp(self):
+        super().setUp()
+        self.future1 = pykka.ThreadingFuture()
+        self.library1.search.return_value = self.future1
+        self.result1 = SearchResult(tracks=[Track(uri="dummy1:a")])
+        self.result2 = SearchResult(tracks=[Track(uri="dummy2:a")])
+        self.library2.search.return_value.get.return_value = self.result2
+
+        self.sent = {
+            "search_result": threading.Event(),
+            "search_done": threading.Event(),
+        }
+        patcher = mock.patch.object(core.CoreListener, "send")
+        self.send = patcher.start()
+        self.send.side_effect = lambda event, **_: self.sent[event].set()
+        self.addCleanup(patcher.stop)
+
+    def _create_core(self, **core_config):
+        return core.Core(
+            config={"core": core_config},
+            mixer=None,
+            backends=[self.backend1, self.backend2, self.backend3],
+        )
+
+    def test_results_are_sent_in_completion_order(self):
+        search_id = self.core.library.start_search({"any": ["a"]})
+        assert self.sent["search_result"].wait(timeout=1)
+
+        self.future1.set(self.result1)
+
+        assert self.sent["search_done"].wait(timeout=1)
+        assert self.send.call_args_list == [
+            mock.call("search_result", search_id=search_id, result=self.result2),
+            mock.call("search_result", search_id=search_id, result=self.result1),
+            mock.call("search_done", search_id=search_id),
+        ]
+
+    def test_search_ids_are_unique(self):
+        self.future1.set(self.result1)
+
+        assert self.core.library.start_search(
+            {"any": ["a"]},
+        ) != self.core.library.start_search({"any": ["a"]})
+
+    def test_cached_results_are_sent_right_away(self):
+        self.library1.search_cache_ttl.get.return_value = None
+        self.library2.search_cache_ttl.get.return_value = None
+        self.core = self._create_core(search_cache_size=1, search_cache_ttl=60)
+        self.future1.set(self.result1)
+        self.core.library.search({"any": ["a"]})
+
+        search_id = self.core.library.start_search({"any": ["a"]})
+
+        assert self.send.call_args_list == [
+            mock.call("search_result", search_id=search_id, result=self.result1),
+            mock.call("search_result", search_id=search_id, result=self.result2),
+            mock.call("search_done", search_id=search_id),
+        ]
+
+    def test_returns_while_backend_is_still_searching(self):
+        self.library1.search_cache_ttl.get.return_value = None
+        self.library2.search_cache_ttl.get.return_value = None
+        self.core = self._create_core(search_cache_size=1, search_cache_ttl=60)
+
+        search_id = self.core.library.start_search({"any": ["a"]})
+
+        assert not self.sent["search_done"].is_set()
+        self.future1.set(self.result1)
+        assert self.sent["search_done"].wait(timeout=1)
+        self.send.assert_called_with("search_done", search_id=search_id)
+        self.core.library.search({"any": ["a"]})
+        self.library1.search.assert_called_once()
+
+    @mock.patch.object(core._library, "logger")
+    def test_done_is_sent_when_backends_time_out(self, logger):
+        self.core = self._create_core(library_timeout=0.01)
+
+        search_id = self.core.library.start_search({"any": ["a"]})
+
+        assert self.sent["search_done"].wait(timeout=1)
+        assert self.send.call_args_list == [
+            mock.call("search_result", search_id=search_id, result=self.result2),
+            mock.call("search_done", search_id=search_id),
+        ]
+
+    def test_empty_query_sends_done_right_away(self):
+        search_id = self.core.library.start_search({})
+
+        self.send.assert_called_once_with("search_done", search_id=search_id)
+        self.library1.search.assert_not_called()
+
+
 class LegacyFindExactToSearchLibraryTest(unittest.TestCase):
     def setUp(self):
         self.backend = mock.Mock()
@@ -2,7 +2,7 @@ import unittest
 from unittest import mock
 
 from mopidy.core import CoreListener
-from mopidy.models import TlTrack
+from mopidy.models import SearchResult, TlTrack
 from mopidy.types import PlaybackState, Uri
 from tests.factories import PlaylistFactory, TrackFactory
 
@@ -43,6 +43,9 @@ class CoreListenerTest(unittest.TestCase):
     def test_listener_has_default_impl_for_tracklist_changed(self):
         self.listener.tracklist_changed()
 
+    def test_listener_has_default_impl_for_tracklist_delta(self):
+        self.listener.tracklist_delta(1, ())
+
     def test_listener_has_default_impl_for_playlists_loaded(self):
         self.listener.playlists_loaded()
 
@@ -66,3 +69,9 @@ class CoreListenerTest(unittest.TestCase):
 
     def test_listener_has_default_impl_for_stream_title_changed(self):
         self.listener.stream_title_changed("foobar")
+
+    def test_listener_has_default_impl_for_search_result(self):
+        self.listener.search_result(1, SearchResult())
+
+    def test_listener_has_default_impl_for_search_done(self):
+        self.listener.search_done(1)
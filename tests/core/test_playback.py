@@ -6,7 +6,7 @@ import pytest
 
 from mopidy import backend, core
 from mopidy.core._state_storage import PlaybackControllerState
-from mopidy.models import Track
+from mopidy.models import Track, TracklistChange
 from mopidy.types import PlaybackState
 from tests import dummy_audio, dummy_backend
 
@@ -712,8 +712,20 @@ class TestEventEmission(BaseTest):
 
         self.core.playback.next()
         self.replay_events()
+        version = self.core.tracklist.get_version()
 
         assert listener_send_mock.mock_calls == [
+            mock.call(
+                "tracklist_delta",
+                version=version,
+                changes=(
+                    TracklistChange(
+                        version=version,
+                        type="remove",
+                        tlids=(tl_tracks[0].tlid,),
+                    ),
+                ),
+            ),
             mock.call("tracklist_changed"),
             mock.call(
                 "track_playback_ended",
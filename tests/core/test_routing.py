@@ -0,0 +1,44 @@
+import urllib.parse
+from unittest import mock
+
+import pytest
+
+from mopidy.core._routing import get_uri_scheme, group_by_backend
+
+
+@pytest.mark.parametrize(
+    "uri",
+    [
+        "file:///home/alice/music/song.mp3",
+        "spotify:track:abc",
+        "HTTP://example.com/stream",
+        "a+b.c-d:foo",
+        "foo",
+        "",
+        ":foo",
+        "1abc:foo",
+        "fo o:bar",
+        " file:///foo",
+        "fi\tle:///foo",
+        "ø:foo",
+        "/home/alice/music/song.mp3",
+        "localhost:6600",
+    ],
+)
+def test_get_uri_scheme_is_same_as_urlsplit(uri):
+    assert get_uri_scheme(uri) == urllib.parse.urlsplit(uri).scheme
+
+
+def test_group_by_backend():
+    backend1, backend2 = mock.Mock(), mock.Mock()
+    backends = {"dummy1": backend1, "dummy2": backend2, "du2": backend2}
+
+    result = group_by_backend(
+        ["dummy1:a", "du2:b", "unknown:c", "dummy2:d", "dummy1:e"],
+        backends,
+    )
+
+    assert result == {
+        backend1: ["dummy1:a", "dummy1:e"],
+        backend2: ["du2:b", "dummy2:d"],
+    }
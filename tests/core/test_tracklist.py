@@ -1,11 +1,15 @@
+import time
 import unittest
+from typing import cast
 from unittest import mock
 
+import pykka
 import pytest
 
-from mopidy import backend, core
+from mopidy import backend, core, exceptions
 from mopidy.core._state_storage import TracklistControllerState
-from mopidy.models import TlTrack, Track
+from mopidy.core._tracklist import CHANGE_LOG_LENGTH
+from mopidy.models import TlTrack, Track, TracklistChange
 from mopidy.types import TracklistId
 from tests.factories import TrackFactory
 
@@ -67,6 +71,91 @@ class TracklistTest(unittest.TestCase):
         assert self.tracks[2] == tl_tracks[2].track
         assert tl_tracks == self.core.tracklist.get_tl_tracks()[(-len(tl_tracks)) :]
 
+    def test_add_at_position_inserts_tracks_in_order(self):
+        tl_tracks = self.core.tracklist.add(
+            uris=["dummy1:c", "dummy1:b"],
+            at_position=1,
+        )
+
+        assert self.core.tracklist.get_tl_tracks() == [
+            self.tl_tracks[0],
+            *tl_tracks,
+            *self.tl_tracks[1:],
+        ]
+        assert [tl_track.tlid for tl_track in tl_tracks] == [4, 5]
+
+    def test_add_beyond_max_length_fails_without_adding_anything(self):
+        self.core._config["core"]["max_tracklist_length"] = 4
+
+        with pytest.raises(exceptions.TracklistFull):
+            self.core.tracklist.add(uris=["dummy1:a", "dummy1:b"])
+
+        assert self.core.tracklist.get_tl_tracks() == self.tl_tracks
+        assert self.core.tracklist.add(uris=["dummy1:a"])[0].tlid == 4
+
+    def test_move_range_forwards(self):
+        self.core.tracklist.add(uris=["dummy1:a"])
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+
+        self.core.tracklist.move(0, 2, 2)
+
+        assert self.core.tracklist.get_tl_tracks() == [
+            tl_tracks[2],
+            tl_tracks[3],
+            tl_tracks[0],
+            tl_tracks[1],
+        ]
+
+    def test_move_range_backwards(self):
+        self.core.tracklist.add(uris=["dummy1:a"])
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+
+        self.core.tracklist.move(2, 4, 0)
+
+        assert self.core.tracklist.get_tl_tracks() == [
+            tl_tracks[2],
+            tl_tracks[3],
+            tl_tracks[0],
+            tl_tracks[1],
+        ]
+
+    def test_get_tl_tracks_with_offset_and_limit(self):
+        assert self.core.tracklist.get_tl_tracks(offset=1) == self.tl_tracks[1:]
+        assert self.core.tracklist.get_tl_tracks(limit=2) == self.tl_tracks[:2]
+        assert self.core.tracklist.get_tl_tracks(1, 1) == self.tl_tracks[1:2]
+        assert self.core.tracklist.get_tl_tracks(offset=5) == []
+
+    def test_get_tl_tracks_with_current_version(self):
+        version = self.core.tracklist.get_version()
+
+        result = self.core.tracklist.get_tl_tracks(0, 2, version=version)
+
+        assert result == self.tl_tracks[:2]
+
+    def test_get_tl_tracks_with_old_version_fails(self):
+        version = self.core.tracklist.get_version()
+        self.core.tracklist.remove({"tlid": [1]})
+
+        with pytest.raises(exceptions.TracklistVersionMismatch):
+            self.core.tracklist.get_tl_tracks(0, 2, version=version)
+
+    def test_get_tl_tracks_returns_new_list_on_each_call(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+        tl_tracks.pop()
+
+        assert self.core.tracklist.get_tl_tracks() == self.tl_tracks
+
+    def test_get_tracks_is_updated_when_tracklist_changes(self):
+        assert self.core.tracklist.get_tracks() == self.tracks
+
+        self.core.tracklist.move(0, 1, 2)
+
+        assert self.core.tracklist.get_tracks() == [
+            self.tracks[1],
+            self.tracks[2],
+            self.tracks[0],
+        ]
+
     def test_remove_removes_tl_tracks_matching_query(self):
         tl_tracks = self.core.tracklist.remove({"name": ["foo"]})
 
@@ -97,6 +186,40 @@ class TracklistTest(unittest.TestCase):
         assert len(tl_tracks) == 2
         self.assertListEqual(self.tl_tracks[:2], tl_tracks)
 
+    def test_filter_by_uri_after_add(self):
+        assert self.core.tracklist.filter({"uri": ["dummy1:a"]}) == self.tl_tracks[:1]
+
+        tl_tracks = self.core.tracklist.add(uris=["dummy1:a"])
+
+        assert self.core.tracklist.filter({"uri": ["dummy1:a"]}) == [
+            self.tl_tracks[0],
+            tl_tracks[0],
+        ]
+
+    def test_filter_by_uri_after_move(self):
+        assert self.core.tracklist.filter({"uri": ["dummy1:a"]}) == self.tl_tracks[:1]
+
+        self.core.tracklist.move(0, 1, 2)
+
+        assert self.core.tracklist.filter({"uri": ["dummy1:a", "dummy1:c"]}) == [
+            self.tl_tracks[2],
+            self.tl_tracks[0],
+        ]
+
+    def test_filter_matches_all_criteria(self):
+        tl_tracks = self.core.tracklist.filter(
+            {
+                "tlid": [t.tlid for t in self.tl_tracks[1:]],
+                "name": ["foo"],
+                "uri": ["dummy1:a", "dummy1:b", "dummy1:c"],
+            }
+        )
+
+        assert tl_tracks == self.tl_tracks[1:2]
+
+    def test_filter_without_criteria_returns_all_tracks(self):
+        assert self.core.tracklist.filter({}) == self.tl_tracks
+
     def test_filter_fails_if_values_isnt_iterable(self):
         with pytest.raises(ValueError):
             self.core.tracklist.filter({"tlid": 3})
@@ -174,6 +297,424 @@ class TracklistIndexTest(unittest.TestCase):
         assert self.core.tracklist.index() == 1
         assert self.core.tracklist.index() == 2
 
+    def test_index_follows_tracks_after_insert(self):
+        self.core.tracklist.add(uris=["dummy1:a"], at_position=1)
+
+        assert self.core.tracklist.index(tlid=self.tl_tracks[0].tlid) == 0
+        assert self.core.tracklist.index(tlid=self.tl_tracks[1].tlid) == 2
+        assert self.core.tracklist.index(tlid=self.tl_tracks[2].tlid) == 3
+
+    def test_index_follows_tracks_after_move(self):
+        self.core.tracklist.move(0, 1, 2)
+
+        assert self.core.tracklist.index(self.tl_tracks[0]) == 2
+        assert self.core.tracklist.index(self.tl_tracks[1]) == 0
+        assert self.core.tracklist.index(self.tl_tracks[2]) == 1
+
+    def test_index_follows_tracks_after_remove(self):
+        self.core.tracklist.remove({"tlid": [self.tl_tracks[0].tlid]})
+
+        assert self.core.tracklist.index(self.tl_tracks[0]) is None
+        assert self.core.tracklist.index(tlid=self.tl_tracks[0].tlid) is None
+        assert self.core.tracklist.index(self.tl_tracks[1]) == 0
+        assert self.core.tracklist.index(self.tl_tracks[2]) == 1
+
+    def test_remove_many_tlids_keeps_order_of_remaining_tracks(self):
+        self.core.tracklist.add(uris=[t.uri for t in self.tracks])
+        all_tl_tracks = self.core.tracklist.get_tl_tracks()
+
+        removed = self.core.tracklist.remove(
+            {"tlid": [tl_track.tlid for tl_track in all_tl_tracks[::2]]}
+        )
+
+        assert removed == all_tl_tracks[::2]
+        assert self.core.tracklist.get_tl_tracks() == all_tl_tracks[1::2]
+
+    def test_filter_by_tlids_returns_tracks_in_tracklist_order(self):
+        tlids = [tl_track.tlid for tl_track in reversed(self.tl_tracks)]
+
+        assert self.core.tracklist.filter({"tlid": tlids}) == self.tl_tracks
+
+
+class TracklistRandomTest(unittest.TestCase):
+    def setUp(self):
+        config = {"core": {"max_tracklist_length": 10000}}
+
+        self.tracks = [Track(uri=f"dummy1:{i}") for i in range(10)]
+
+        def lookup(uris):
+            return {u: [t for t in self.tracks if t.uri == u] for u in uris}
+
+        self.core = core.Core(config, mixer=None, backends=[])
+        self.core.library = mock.Mock(spec=core.LibraryController)
+        self.core.library.lookup.side_effect = lookup
+
+        self.core.playback = mock.Mock(spec=core.PlaybackController)
+        self.core.playback.get_current_tl_track.return_value = None
+
+        self.tl_tracks = self.core.tracklist.add(uris=[t.uri for t in self.tracks])
+        self.core.tracklist.set_random(True)
+
+    def play_next(self):
+        tlid = self.core.tracklist.get_next_tlid()
+        assert tlid is not None
+        tl_track = self.core.tracklist._get_tl_track(tlid)
+        assert tl_track is not None
+        self.core.tracklist._mark_playing(tl_track)
+        self.core.playback.get_current_tl_track.return_value = tl_track
+        return tl_track
+
+    def test_random_plays_all_tracks_once(self):
+        played = [self.play_next() for _ in self.tl_tracks]
+
+        assert sorted(played, key=lambda t: t.tlid) == self.tl_tracks
+        assert self.core.tracklist.get_next_tlid() is None
+
+    def test_add_does_not_replay_played_tracks(self):
+        played = [self.play_next() for _ in range(5)]
+
+        new_tl_tracks = self.core.tracklist.add(uris=["dummy1:0", "dummy1:1"])
+        remaining = [self.play_next() for _ in range(7)]
+
+        assert set(played).isdisjoint(remaining)
+        assert {t.tlid for t in played + remaining} == {
+            t.tlid for t in self.tl_tracks + new_tl_tracks
+        }
+        assert self.core.tracklist.get_next_tlid() is None
+
+    def test_removed_tracks_are_not_played(self):
+        self.core.tracklist.remove({"tlid": [t.tlid for t in self.tl_tracks[:5]]})
+
+        played = [self.play_next() for _ in range(5)]
+
+        assert sorted(played, key=lambda t: t.tlid) == self.tl_tracks[5:]
+        assert self.core.tracklist.get_next_tlid() is None
+
+    def test_clear_drops_pending_tracks(self):
+        self.core.tracklist.clear()
+
+        assert self.core.tracklist.get_next_tlid() is None
+
+
+class TracklistChangesTest(unittest.TestCase):
+    def setUp(self):
+        config = {"core": {"max_tracklist_length": 10000}}
+
+        self.tracks = [
+            Track(uri="dummy1:a", name="foo"),
+            Track(uri="dummy1:b", name="foo"),
+            Track(uri="dummy1:c", name="bar"),
+        ]
+
+        def lookup(uris):
+            return {u: [t for t in self.tracks if t.uri == u] for u in uris}
+
+        self.core = core.Core(config, mixer=None, backends=[])
+        self.core.library = mock.Mock(spec=core.LibraryController)
+        self.core.library.lookup.side_effect = lookup
+
+        self.core.playback = mock.Mock(spec=core.PlaybackController)
+
+        self.tl_tracks = self.core.tracklist.add(uris=[t.uri for t in self.tracks])
+
+    def test_add_records_insert(self):
+        version = self.core.tracklist.get_version()
+
+        tl_tracks = self.core.tracklist.add(uris=["dummy1:a"], at_position=1)
+
+        assert self.core.tracklist.get_changes_since(version) == [
+            TracklistChange(
+                version=version + 1,
+                type="insert",
+                position=1,
+                tlids=(tl_tracks[0].tlid,),
+            ),
+        ]
+
+    def test_move_and_remove_are_recorded_in_order(self):
+        version = self.core.tracklist.get_version()
+
+        self.core.tracklist.move(0, 1, 2)
+        self.core.tracklist.remove({"tlid": [self.tl_tracks[1].tlid]})
+
+        assert self.core.tracklist.get_changes_since(version) == [
+            TracklistChange(
+                version=version + 1,
+                type="move",
+                position=0,
+                end=1,
+                to_position=2,
+            ),
+            TracklistChange(
+                version=version + 2,
+                type="remove",
+                tlids=(self.tl_tracks[1].tlid,),
+            ),
+        ]
+
+    def test_changes_since_current_version_is_empty(self):
+        version = self.core.tracklist.get_version()
+
+        assert self.core.tracklist.get_changes_since(version) == []
+
+    def test_changes_since_unknown_version_is_none(self):
+        version = self.core.tracklist.get_version()
+
+        assert self.core.tracklist.get_changes_since(version + 1) is None
+
+    def test_changes_since_expired_version_is_none(self):
+        version = self.core.tracklist.get_version()
+
+        for _ in range(CHANGE_LOG_LENGTH + 1):
+            self.core.tracklist.move(0, 1, 2)
+
+        assert self.core.tracklist.get_changes_since(version) is None
+        assert len(self.core.tracklist.get_changes_since(version + 1)) == (
+            CHANGE_LOG_LENGTH
+        )
+
+    @mock.patch.object(core.CoreListener, "send")
+    def test_tracklist_delta_is_sent_before_tracklist_changed(self, send):
+        self.core.tracklist.clear()
+
+        version = self.core.tracklist.get_version()
+        assert send.call_args_list == [
+            mock.call(
+                "tracklist_delta",
+                version=version,
+                changes=(TracklistChange(version=version, type="clear"),),
+            ),
+            mock.call("tracklist_changed"),
+        ]
+
+
+class TracklistBatchTest(unittest.TestCase):
+    def setUp(self):
+        config = {"core": {"max_tracklist_length": 10000}}
+
+        self.tracks = [
+            Track(uri="dummy1:a", name="foo"),
+            Track(uri="dummy1:b", name="foo"),
+            Track(uri="dummy1:c", name="bar"),
+        ]
+
+        def lookup(uris):
+            return {u: [t for t in self.tracks if t.uri == u] for u in uris}
+
+        self.core = core.Core(config, mixer=None, backends=[])
+        self.core.library = mock.Mock(spec=core.LibraryController)
+        self.core.library.lookup.side_effect = lookup
+
+        self.core.playback = mock.Mock(spec=core.PlaybackController)
+
+        self.tl_tracks = self.core.tracklist.add(uris=[t.uri for t in self.tracks])
+
+    def test_batch_applies_operations_in_order(self):
+        results = self.core.tracklist.batch(
+            [
+                {"method": "move", "params": {"start": 2, "end": 3, "to_position": 0}},
+                {"method": "add", "params": {"uris": ["dummy1:a"]}},
+                {"method": "remove", "params": {"criteria": {"name": ["bar"]}}},
+            ],
+        )
+
+        added = self.core.tracklist.get_tl_tracks()[-1]
+        assert results == [None, [added], [self.tl_tracks[2]]]
+        assert self.core.tracklist.get_tl_tracks() == [
+            self.tl_tracks[0],
+            self.tl_tracks[1],
+            added,
+        ]
+
+    @mock.patch.object(core.CoreListener, "send")
+    def test_batch_increases_version_and_sends_event_once(self, send):
+        version = self.core.tracklist.get_version()
+        self.core.playback.reset_mock()
+
+        self.core.tracklist.batch(
+            [
+                {"method": "move", "params": {"start": 0, "end": 1, "to_position": 2}},
+                {"method": "move", "params": {"start": 0, "end": 1, "to_position": 2}},
+                {"method": "shuffle"},
+            ],
+        )
+
+        assert self.core.tracklist.get_version() == version + 1
+        self.core.playback._on_tracklist_change.assert_called_once_with()
+        assert [c.args[0] for c in send.call_args_list] == [
+            "tracklist_delta",
+            "tracklist_changed",
+        ]
+        changes = self.core.tracklist.get_changes_since(version)
+        assert [change.type for change in changes] == [
+            "move",
+            "move",
+            "remove",
+            "insert",
+        ]
+        assert {change.version for change in changes} == {version + 1}
+
+    def test_batch_failure_undoes_all_operations(self):
+        version = self.core.tracklist.get_version()
+
+        with pytest.raises(AssertionError):
+            self.core.tracklist.batch(
+                [
+                    {"method": "add", "params": {"uris": ["dummy1:a"]}},
+                    {"method": "clear"},
+                    {
+                        "method": "move",
+                        "params": {"start": 0, "end": 1, "to_position": 2},
+                    },
+                ],
+            )
+
+        assert self.core.tracklist.get_version() == version
+        assert self.core.tracklist.get_tl_tracks() == self.tl_tracks
+        assert self.core.tracklist.index(tlid=self.tl_tracks[2].tlid) == 2
+        assert self.core.tracklist.add(uris=["dummy1:a"])[0].tlid == 4
+
+    def test_batch_fails_for_unknown_method(self):
+        with pytest.raises(ValueError):
+            self.core.tracklist.batch([{"method": "set_random"}])
+
+    def test_batch_fails_if_operations_are_not_mappings(self):
+        with pytest.raises(ValueError):
+            self.core.tracklist.batch(["clear"])
+
+    def test_batch_fails_for_iterator_before_applying_operations(self):
+        operations = iter([{"method": "clear"}, {"method": "set_random"}])
+
+        with pytest.raises(ValueError):
+            self.core.tracklist.batch(operations)
+
+        assert self.core.tracklist.get_tl_tracks() == self.tl_tracks
+
+    def test_empty_batch_does_not_change_version(self):
+        version = self.core.tracklist.get_version()
+
+        assert self.core.tracklist.batch([]) == []
+        assert self.core.tracklist.get_version() == version
+
+
+class TracklistIncrementalAddTest(unittest.TestCase):
+    def setUp(self):
+        self.futures = {}
+        self.backend1 = self._create_backend("dummy1")
+        self.backend2 = self._create_backend("dummy2")
+
+        self.core = self._start_core()
+
+    def tearDown(self):
+        pykka.ActorRegistry.stop_all()
+
+    def _create_backend(self, uri_scheme):
+        backend_proxy = mock.Mock()
+        backend_proxy.uri_schemes.get.return_value = [uri_scheme]
+        backend_proxy.actor_ref.actor_class.__name__ = f"{uri_scheme}Backend"
+        backend_proxy.library = mock.Mock(spec=backend.LibraryProvider)
+        backend_proxy.library.lookup_many.return_value = self.futures.setdefault(
+            uri_scheme,
+            pykka.ThreadingFuture(),
+        )
+        return backend_proxy
+
+    def _start_core(self, **core_config):
+        config = {"core": {"max_tracklist_length": 10000, **core_config}}
+        return cast(
+            core.CoreProxy,
+            core.Core.start(
+                config,
+                backends=[self.backend1, self.backend2],
+            ).proxy(),
+        )
+
+    def _lookup_done(self, uri_scheme, tracks):
+        self.futures[uri_scheme].set({track.uri: [track] for track in tracks})
+
+    def _wait_for_length(self, length):
+        deadline = time.monotonic() + 1
+        while self.core.tracklist.get_length().get() != length:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    def test_add_returns_before_lookups_complete(self):
+        result = self.core.tracklist.add(
+            uris=["dummy1:a", "dummy2:b"],
+            incremental=True,
+        ).get()
+
+        assert result == []
+        assert self.core.tracklist.get_length().get() == 0
+
+    def test_tracks_are_added_as_lookups_complete(self):
+        track_a, track_b = Track(uri="dummy1:a"), Track(uri="dummy2:b")
+        self.core.tracklist.add(uris=["dummy1:a", "dummy2:b"], incremental=True)
+
+        self._lookup_done("dummy1", [track_a])
+        self._wait_for_length(1)
+
+        assert self.core.tracklist.get_tracks().get() == [track_a]
+
+        self._lookup_done("dummy2", [track_b])
+        self._wait_for_length(2)
+
+        assert self.core.tracklist.get_tl_tracks().get() == [
+            TlTrack(TracklistId(1), track_a),
+            TlTrack(TracklistId(2), track_b),
+        ]
+
+    def test_tracks_are_added_in_uri_order(self):
+        track_a, track_b = Track(uri="dummy1:a"), Track(uri="dummy2:b")
+        track_c = Track(uri="dummy1:c")
+        self.core.tracklist.add(
+            uris=["dummy1:a", "dummy2:b", "dummy1:c"],
+            incremental=True,
+        )
+
+        self._lookup_done("dummy2", [track_b])
+        self._lookup_done("dummy1", [track_a, track_c])
+        self._wait_for_length(3)
+
+        assert self.core.tracklist.get_tl_tracks().get() == [
+            TlTrack(TracklistId(1), track_a),
+            TlTrack(TracklistId(2), track_b),
+            TlTrack(TracklistId(3), track_c),
+        ]
+
+    def test_failing_backend_does_not_block_later_tracks(self):
+        track_b = Track(uri="dummy2:b")
+        self.core.tracklist.add(uris=["dummy1:a", "dummy2:b"], incremental=True)
+
+        self.futures["dummy1"].set_exception(
+            exc_info=(RuntimeError, RuntimeError("Lookup failed"), None),
+        )
+        self._lookup_done("dummy2", [track_b])
+        self._wait_for_length(1)
+
+        assert self.core.tracklist.get_tracks().get() == [track_b]
+
+    def test_hung_backend_does_not_block_later_tracks(self):
+        self.core.actor_ref.stop()
+        self.core = self._start_core(library_backend_timeout=0.01)
+        track_b = Track(uri="dummy2:b")
+
+        with self.assertLogs("mopidy.core._library", level="WARNING") as logs:
+            self.core.tracklist.add(uris=["dummy1:a", "dummy2:b"], incremental=True)
+            self._lookup_done("dummy2", [track_b])
+            self._wait_for_length(1)
+
+        assert self.core.tracklist.get_tracks().get() == [track_b]
+        assert "dummy1Backend backend did not respond in time" in logs.output[0]
+
+    def test_incremental_add_requires_uris_without_position(self):
+        with pytest.raises(ValueError):
+            self.core.tracklist.add(
+                uris=["dummy1:a"],
+                at_position=0,
+                incremental=True,
+            ).get()
+
 
 class TracklistSaveLoadStateTest(unittest.TestCase):
     def setUp(self):
@@ -80,6 +80,45 @@ def test_check_instances_error_message():
     assert str(excinfo.value) == "Expected a list of str, not [1]"
 
 
+def test_check_instances_sampled_checks_first_and_last_values():
+    values = ["abc"] * 1000
+
+    validation.check_instances(values, str, level="sampled")
+    for index in 0, 500, 999:
+        with pytest.raises(exceptions.ValidationError):
+            validation.check_instances(
+                [*values[:index], 123, *values[index + 1 :]],
+                str,
+                level="sampled",
+            )
+
+
+@pytest.mark.parametrize("length", [101, 150, 199, 1000, 10001])
+def test_check_instances_sampled_checks_at_most_sample_size_values(length):
+    sample = list(validation._sample(list(range(length))))
+
+    assert len(sample) <= validation.SAMPLE_SIZE + 1
+    assert sample[0] == 0
+    assert sample[-1] == length - 1
+
+
+def test_check_instances_sampled_checks_all_of_short_lists():
+    values = ["abc"] * validation.SAMPLE_SIZE
+    values[37] = 123
+
+    with pytest.raises(exceptions.ValidationError):
+        validation.check_instances(values, str, level="sampled")
+
+
+def test_check_instances_sampled_still_checks_iterable():
+    with pytest.raises(exceptions.ValidationError):
+        validation.check_instances("abc", str, level="sampled")
+
+
+def test_check_instances_off_checks_nothing():
+    validation.check_instances([123], str, level="off")
+
+
 def test_check_query_valid_values():
     for value in {}, {"any": []}, {"any": ["abc"]}:
         validation.check_query(value)
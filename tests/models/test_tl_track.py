@@ -41,6 +41,30 @@ def test_iteration():
     assert track2 == track
 
 
+def test_equality():
+    track = TrackFactory.build()
+    tl_track = TlTrack(TracklistId(123), track)
+    assert tl_track == tl_track  # noqa: PLR0124
+    assert tl_track == TlTrack(TracklistId(123), track)
+    assert tl_track == TlTrack(TracklistId(123), track.replace())
+
+
+def test_inequality():
+    track = TrackFactory.build()
+    tl_track = TlTrack(TracklistId(123), track)
+    assert tl_track != TlTrack(TracklistId(124), track)
+    assert tl_track != TlTrack(TracklistId(123), track.replace(name="other"))
+    assert tl_track != (TracklistId(123), track)
+
+
+def test_hash():
+    track = TrackFactory.build()
+    tl_track1 = TlTrack(TracklistId(123), track)
+    tl_track2 = TlTrack(TracklistId(123), track.replace())
+    assert hash(tl_track1) == hash(tl_track2)
+    assert len({tl_track1, tl_track2}) == 1
+
+
 def test_repr():
     assert repr(
         TlTrack(
@@ -0,0 +1,48 @@
+import pydantic
+import pytest
+
+from mopidy.models import TracklistChange
+from mopidy.types import TracklistId
+
+
+def test_insert():
+    change = TracklistChange(
+        version=3,
+        type="insert",
+        position=2,
+        tlids=(TracklistId(4), TracklistId(5)),
+    )
+    assert change.version == 3
+    assert change.type == "insert"
+    assert change.position == 2
+    assert change.tlids == (4, 5)
+    with pytest.raises(pydantic.ValidationError):
+        change.position = 3
+
+
+def test_move():
+    change = TracklistChange(version=3, type="move", position=0, end=2, to_position=5)
+    assert change.position == 0
+    assert change.end == 2
+    assert change.to_position == 5
+    assert change.tlids == ()
+
+
+def test_invalid_type():
+    with pytest.raises(pydantic.ValidationError):
+        TracklistChange(version=3, type="replace")
+
+
+def test_negative_version():
+    with pytest.raises(pydantic.ValidationError):
+        TracklistChange(version=-1, type="clear")
+
+
+def test_serialize():
+    change = TracklistChange(version=3, type="remove", tlids=(TracklistId(1),))
+    assert change.serialize() == {
+        "__model__": "TracklistChange",
+        "version": 3,
+        "type": "remove",
+        "tlids": [1],
+    }